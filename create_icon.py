@@ -3,7 +3,7 @@
 Create a simple icon for MBU-Linux.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 import os
 
 # Create icon directory
@@ -11,39 +11,41 @@ os.makedirs("mbulinux/data/icons", exist_ok=True)
 
 # Create 256x256 icon
 size = 256
-icon = Image.new('RGB', (size, size), color='#0078d7')
-draw = ImageDraw.Draw(icon)
+icon = Image.new('RGB', (size, size), color=(0x00, 0x78, 0xd7))
 
-# Draw USB symbol
+# Draw USB symbol with solid fills; paste boxes exclude their right and
+# bottom edges, hence the +1 to match the inclusive rectangle bounds
 margin = 40
 usb_width = size - 2 * margin
 usb_height = usb_width // 2
 
 # USB connector
-draw.rectangle([margin, margin + usb_height//3, 
-                size - margin, margin + 2*usb_height//3], 
-               fill='white', outline='white', width=4)
+icon.paste((0xff, 0xff, 0xff),
+           (margin, margin + usb_height//3,
+            size - margin + 1, margin + 2*usb_height//3 + 1))
 
 # USB plug
 plug_width = usb_width // 6
 plug_x = size // 2 - plug_width // 2
-draw.rectangle([plug_x, margin, plug_x + plug_width, margin + usb_height//3], 
-               fill='white', outline='white', width=2)
+icon.paste((0xff, 0xff, 0xff),
+           (plug_x, margin, plug_x + plug_width + 1, margin + usb_height//3 + 1))
 
 # USB pins
 pin_height = usb_height // 8
 pin_y = margin + usb_height//2 - pin_height//2
-draw.rectangle([margin + usb_width//4, pin_y, 
-                size - margin - usb_width//4, pin_y + pin_height], 
-               fill='#005a9e')
+icon.paste((0x00, 0x5a, 0x9e),
+           (margin + usb_width//4, pin_y,
+            size - margin - usb_width//4 + 1, pin_y + pin_height + 1))
 
 # Save as PNG
 icon_path = "mbulinux/data/icons/mbulinux.png"
 icon.save(icon_path, "PNG")
 print(f"Icon saved to {icon_path}")
 
-# Also create smaller versions for different sizes
-for sz in [16, 32, 64, 128]:
-    small_icon = icon.resize((sz, sz), Image.Resampling.LANCZOS)
-    small_icon.save(f"mbulinux/data/icons/mbulinux_{sz}.png", "PNG")
+# Also create smaller versions for different sizes, each downscaled from
+# the previous one so every step only filters a quarter of the pixels
+prev = icon
+for sz in [128, 64, 32, 16]:
+    prev = prev.resize((sz, sz), Image.Resampling.LANCZOS)
+    prev.save(f"mbulinux/data/icons/mbulinux_{sz}.png", "PNG")
     print(f"  - {sz}x{sz} icon created")
\ No newline at end of file
@@ -3,7 +3,6 @@ Main entry point for MBU-Linux application.
 """
 
 import sys
-import traceback
 from mbulinux.app import MBULinuxApp
 
 def main():
@@ -13,6 +12,7 @@ def main():
         return app.exec()
     except Exception as e:
         print(f"Fatal error: {e}", file=sys.stderr)
+        import traceback
         traceback.print_exc()
         return 1
 
@@ -2,16 +2,28 @@
 Main application class.
 """
 
-import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    # Only needed when orjson is missing
+    import json
+    orjson = None
+
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QSettings, QLocale, QTranslator
 from PySide6.QtGui import QIcon, QFontDatabase
 
-from .constants import APP_NAME, APP_ORG, CONFIG_DIR, SETTINGS_FILE, DATA_DIR
+from .constants import APP_NAME, APP_ORG, CONFIG_DIR, SETTINGS_FILE, DATA_DIR, DEFAULT_SETTINGS
 from .ui.main_window import MainWindow
 
+# Parsed settings keyed by file path: (mtime_ns, size, raw bytes, settings)
+_settings_cache = {}
+
 class MBULinuxApp(QApplication):
     """Main application class."""
     
@@ -41,22 +53,31 @@ class MBULinuxApp(QApplication):
     
     def load_settings(self):
         """Load application settings from file."""
-        if SETTINGS_FILE.exists():
-            try:
-                with open(SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                settings = {}
-        else:
-            settings = {}
+        self._last_serialized = None
+        settings = {}
         
-        # Merge with defaults
-        from .constants import DEFAULT_SETTINGS
-        for key, value in DEFAULT_SETTINGS.items():
-            if key not in settings:
-                settings[key] = value
+        try:
+            st = os.stat(SETTINGS_FILE)
+        except OSError:
+            st = None
+        
+        if st is not None:
+            key = str(SETTINGS_FILE)
+            cached = _settings_cache.get(key)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                self._last_serialized = cached[2]
+                settings = dict(cached[3])
+            else:
+                try:
+                    data = SETTINGS_FILE.read_bytes()
+                    settings = orjson.loads(data) if orjson else json.loads(data)
+                    _settings_cache[key] = (st.st_mtime_ns, st.st_size, data, dict(settings))
+                    self._last_serialized = data
+                except (ValueError, IOError):
+                    settings = {}
         
-        return settings
+        # Merge with defaults
+        return {**DEFAULT_SETTINGS, **settings}
     
     def save_settings(self):
         """Save application settings to file."""
@@ -66,9 +87,22 @@ class MBULinuxApp(QApplication):
         
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=2)
-        except IOError as e:
+            if orjson:
+                data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.settings, indent=2).encode('utf-8')
+            
+            # Nothing changed since load or the last save
+            if data == getattr(self, '_last_serialized', None):
+                return
+            
+            # Write to a temporary file and rename so a crash never
+            # leaves a truncated settings file behind
+            tmp_file = SETTINGS_FILE.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, SETTINGS_FILE)
+            self._last_serialized = data
+        except (IOError, TypeError) as e:
             print(f"Failed to save settings: {e}", file=sys.stderr)
     
     def setup_translations(self):
@@ -90,9 +124,18 @@ class MBULinuxApp(QApplication):
     def load_fonts(self):
         """Load custom fonts."""
         fonts_dir = DATA_DIR / "fonts"
-        if fonts_dir.exists():
-            for font_file in fonts_dir.glob("*.ttf"):
-                QFontDatabase.addApplicationFont(str(font_file))
+        if not fonts_dir.exists():
+            return
+        
+        font_files = [str(font_file) for font_file in fonts_dir.glob("*.ttf")]
+        if len(font_files) < 2:
+            for font_file in font_files:
+                QFontDatabase.addApplicationFont(font_file)
+            return
+        
+        # QFontDatabase is thread-safe; parse the font files concurrently
+        with ThreadPoolExecutor(max_workers=min(4, len(font_files))) as executor:
+            list(executor.map(QFontDatabase.addApplicationFont, font_files))
     
     def apply_style(self):
         """Apply application style based on settings."""
@@ -104,9 +147,22 @@ class MBULinuxApp(QApplication):
         
         # Load QSS file
         style_file = DATA_DIR / "styles" / f"{theme}.qss"
-        if style_file.exists():
-            with open(style_file, 'r') as f:
-                self.setStyleSheet(f.read())
+        try:
+            mtime = style_file.stat().st_mtime_ns
+        except OSError:
+            return
+        
+        # Reuse the stylesheet persisted with the settings if the file is unchanged
+        cached = self.settings.get('_qss_cache')
+        if (isinstance(cached, dict) and cached.get('theme') == theme
+                and cached.get('mtime') == mtime):
+            self.setStyleSheet(cached.get('data', ''))
+            return
+        
+        with open(style_file, 'r') as f:
+            data = f.read()
+        self.settings['_qss_cache'] = {'theme': theme, 'mtime': mtime, 'data': data}
+        self.setStyleSheet(data)
     
     def exec(self):
         """Execute application with cleanup."""
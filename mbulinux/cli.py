@@ -6,6 +6,7 @@ Command-line interface for MBU-Linux.
 import argparse
 import sys
 import os
+import time
 from pathlib import Path
 
 def main():
@@ -152,6 +153,7 @@ def run_write(args) -> int:
         # Import here to avoid GUI dependencies
         from mbulinux.core.image_analyzer import ImageAnalyzer
         from mbulinux.core.permissions import PermissionManager
+        from mbulinux.constants import FAT32_MAX_FILE_SIZE
         
         # Check permissions
         perm_manager = PermissionManager()
@@ -166,7 +168,7 @@ def run_write(args) -> int:
         print(f"OS: {iso_info['os_name']}")
         print(f"Architecture: {iso_info['architecture']}")
         
-        if iso_info.get('wim_size', 0) > 4 * 1024**3:
+        if iso_info.get('wim_size', 0) > FAT32_MAX_FILE_SIZE:
             print("Note: Large WIM file detected, will use NTFS")
             args.fs = 'ntfs'
         
@@ -180,9 +182,17 @@ def run_write(args) -> int:
             from mbulinux.core.writer_strategies.linux_strategy import LinuxWriteStrategy
             strategy = LinuxWriteStrategy()
         
-        # Setup progress callback
+        # Setup progress callback, redrawing only when the percentage
+        # changes or at most every 50ms
+        write = sys.stdout.write
+        last = [-1, 0.0]  # percent, monotonic time of last redraw
+        
         def progress_callback(percent, message):
-            print(f"\r[{percent:3d}%] {message}", end='', flush=True)
+            now = time.monotonic()
+            if percent != last[0] or now - last[1] >= 0.05:
+                write(f"\r[{percent:3d}%] {message}")
+                sys.stdout.flush()
+                last[0], last[1] = percent, now
         
         strategy.set_progress_callback(progress_callback)
         
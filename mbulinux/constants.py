@@ -4,6 +4,7 @@ Application constants and configuration.
 
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 # Application info
 APP_NAME = "MBU-Linux"
@@ -48,8 +49,11 @@ FS_FAT32 = "fat32"
 FS_NTFS = "ntfs"
 FS_EXFAT = "exfat"
 
-# Default settings
-DEFAULT_SETTINGS = {
+# Largest file FAT32 can hold is one byte short of this
+FAT32_MAX_FILE_SIZE = 4 * (1 << 30)
+
+# Default settings (read-only; merge into a new dict to customise)
+DEFAULT_SETTINGS = MappingProxyType({
     "theme": "auto",
     "language": "auto",
     "default_scheme": SCHEME_GPT,
@@ -59,4 +63,4 @@ DEFAULT_SETTINGS = {
     "check_for_updates": True,
     "window_width": 900,
     "window_height": 700,
-}
\ No newline at end of file
+})
\ No newline at end of file
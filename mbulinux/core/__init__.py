@@ -2,9 +2,29 @@
 Core functionality for MBU-Linux.
 """
 
-from .disk_manager import DiskManager
-from .image_analyzer import ImageAnalyzer
-from .formatter import DiskFormatter
-from .permissions import PermissionManager  # Исправлено с premissions
+import importlib
 
-__all__ = ['DiskManager', 'ImageAnalyzer', 'DiskFormatter', 'PermissionManager']
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562) so that
+# importing e.g. mbulinux.core.image_analyzer does not pull in pydbus/GLib.
+_LAZY_IMPORTS = {
+    'DiskManager': '.disk_manager',
+    'ImageAnalyzer': '.image_analyzer',
+    'DiskFormatter': '.formatter',
+    'PermissionManager': '.permissions',  # Исправлено с premissions
+}
+
+__all__ = ['DiskManager', 'ImageAnalyzer', 'DiskFormatter', 'PermissionManager']
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
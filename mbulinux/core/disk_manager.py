@@ -2,19 +2,71 @@
 Disk management using UDisks2.
 """
 
+import ctypes
+import errno
+import functools
+import os
 import subprocess
-import json
 import re
+import time
 from typing import List, Dict, Optional
 from pathlib import Path
 
 import pydbus
 from gi.repository import GLib
 
+from .mounts import read_mountinfo
+
+try:
+    import orjson
+except ImportError:
+    # Only needed when orjson is missing
+    import json
+    orjson = None
+
+# How long a get_removable_disks() result is reused, in seconds
+DISK_CACHE_TTL = 0.5
+
+# lsblk size strings like '14.9G'; multipliers to GB keyed by unit letter
+_SIZE_RE = re.compile(r'([\d.]+)([KMGTP])', re.IGNORECASE)
+_SIZE_SCALE = {
+    unit: mult
+    for letter, mult in zip('KMGTP', (1 / 1048576, 1 / 1024, 1.0, 1024.0, 1048576.0))
+    for unit in (letter, letter.lower())
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_size_gb(size_str: str) -> float:
+    """Parse a size string like '14.9G' to GB; the same strings recur every refresh."""
+    match = _SIZE_RE.match(size_str)
+    if not match:
+        return 0.0
+    
+    value, unit = match.groups()
+    try:
+        return float(value) * _SIZE_SCALE[unit]
+    except ValueError:
+        return 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _libc():
+    return ctypes.CDLL(None, use_errno=True)
+
+
+def _umount(mount_point: str):
+    """Unmount mount_point with the umount2 syscall; raises OSError on failure."""
+    if _libc().umount2(os.fsencode(mount_point), 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), mount_point)
+
 class DiskManager:
     """Manage disks using UDisks2."""
     
     def __init__(self):
+        self._cache: Optional[List[Dict]] = None
+        self._cache_ts = 0.0
         self.bus = pydbus.SystemBus()
         try:
             self.udisks = self.bus.get('org.freedesktop.UDisks2', '/org/freedesktop/UDisks2')
@@ -48,66 +100,136 @@ class DiskManager:
         Returns:
             List of dictionaries with disk information
         """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < DISK_CACHE_TTL:
+            return [dict(disk) for disk in self._cache]
+        
+        disks = self._scan_removable_disks()
+        self._cache = disks
+        self._cache_ts = now
+        return [dict(disk) for disk in disks]
+    
+    def invalidate_cache(self):
+        """Force the next get_removable_disks() call to rescan."""
+        self._cache = None
+        self._cache_ts = 0.0
+    
+    def _scan_removable_disks(self) -> List[Dict]:
+        """Query UDisks2 (or the sysfs fallback) for removable disks."""
         disks = []
         
         try:
             # Get all block devices
             objects = self.udisks.GetManagedObjects()
             
+            # Collect removable drives first so blocks can be matched by path
+            removable_drives = {}
             for obj_path, interfaces in objects.items():
-                if 'org.freedesktop.UDisks2.Block' in interfaces:
-                    block = interfaces['org.freedesktop.UDisks2.Block']
-                    drive_path = block.get('Drive', '/')
-                    
-                    # Get drive info
-                    drive_interfaces = objects.get(drive_path, {})
-                    if 'org.freedesktop.UDisks2.Drive' in drive_interfaces:
-                        drive = drive_interfaces['org.freedesktop.UDisks2.Drive']
-                        
-                        # Only removable drives
-                        if drive.get('Removable', False):
-                            raw_device = block.get('Device', '/dev/unknown')
-                            device = self._decode_udisks_value(raw_device)
-                            if not isinstance(device, str):
-                                device = '/dev/unknown'
-
-                            disk_info = {
-                                'device': device,
-                                'path': obj_path,
-                                'size': block.get('Size', 0),
-                                'model': drive.get('Model', 'Unknown'),
-                                'vendor': drive.get('Vendor', 'Unknown'),
-                                'serial': drive.get('Serial', ''),
-                                'read_only': block.get('ReadOnly', False),
-                                'mount_points': self._decode_mount_points(block.get('MountPoints', [])),
-                                'partition_table': block.get('PartitionTable', {}),
-                                'is_partition': 'org.freedesktop.UDisks2.Partition' in interfaces,
-                            }
-                            
-                            # Convert size to GB
-                            disk_info['size_gb'] = disk_info['size'] / (1024**3)
-                            
-                            # Only add if it's a whole disk (not partition)
-                            if not disk_info['is_partition']:
-                                disks.append(disk_info)
+                drive = interfaces.get('org.freedesktop.UDisks2.Drive')
+                if drive is not None and drive.get('Removable', False):
+                    removable_drives[obj_path] = drive
+            
+            for obj_path, interfaces in objects.items():
+                # Only whole disks (not partitions)
+                block = interfaces.get('org.freedesktop.UDisks2.Block')
+                if block is None or 'org.freedesktop.UDisks2.Partition' in interfaces:
+                    continue
+                
+                # Only removable drives
+                drive = removable_drives.get(block.get('Drive', '/'))
+                if drive is None:
+                    continue
+                
+                raw_device = block.get('Device', '/dev/unknown')
+                device = self._decode_udisks_value(raw_device)
+                if not isinstance(device, str):
+                    device = '/dev/unknown'
+
+                disk_info = {
+                    'device': device,
+                    'path': obj_path,
+                    'size': block.get('Size', 0),
+                    'model': drive.get('Model', 'Unknown'),
+                    'vendor': drive.get('Vendor', 'Unknown'),
+                    'serial': drive.get('Serial', ''),
+                    'read_only': block.get('ReadOnly', False),
+                    'mount_points': self._decode_mount_points(block.get('MountPoints', [])),
+                    'partition_table': block.get('PartitionTable', {}),
+                    'is_partition': False,
+                }
+                
+                # Convert size to GB
+                disk_info['size_gb'] = disk_info['size'] / (1024**3)
+                
+                disks.append(disk_info)
         except Exception as e:
             print(f"Error getting disks: {e}")
-            # Fallback to lsblk
+            # Fallback to sysfs
             disks = self._get_disks_fallback()
         
         return disks
     
     def _get_disks_fallback(self) -> List[Dict]:
-        """Fallback method using lsblk if UDisks2 fails."""
+        """Fallback method reading sysfs directly if UDisks2 fails."""
+        sys_block = Path('/sys/block')
+        if not sys_block.is_dir():
+            return self._get_disks_lsblk()
+        
+        try:
+            mounts = self._read_mounts()
+            disks = []
+            
+            for entry in sys_block.iterdir():
+                if self._read_sysfs(entry / 'removable') != '1':
+                    continue
+                
+                # Size is always reported in 512-byte sectors
+                size = int(self._read_sysfs(entry / 'size') or 0) * 512
+                if not size:
+                    continue  # Empty card reader slot or drive without media
+                
+                device = f"/dev/{entry.name}"
+                disks.append({
+                    'device': device,
+                    'model': self._read_sysfs(entry / 'device' / 'model'),
+                    'vendor': self._read_sysfs(entry / 'device' / 'vendor'),
+                    'size': size,
+                    'size_gb': size / (1024**3),
+                    'read_only': self._read_sysfs(entry / 'ro') == '1',
+                    'mount_points': mounts.get(device, []),
+                })
+            
+            return disks
+        except Exception as e:
+            print(f"Fallback also failed: {e}")
+            return []
+    
+    def _read_sysfs(self, path: Path) -> str:
+        """Read a sysfs attribute, returning '' if it is missing."""
+        try:
+            return path.read_text().strip()
+        except OSError:
+            return ''
+    
+    def _read_mounts(self) -> Dict[str, List[str]]:
+        """Map mounted devices to their mount points from /proc/self/mountinfo."""
+        mounts: Dict[str, List[str]] = {}
+        for source, mount_point, _ in read_mountinfo():
+            if source.startswith('/dev/'):
+                mounts.setdefault(source, []).append(mount_point)
+        return mounts
+    
+    def _get_disks_lsblk(self) -> List[Dict]:
+        """Fallback method using lsblk where sysfs is not available."""
         try:
             result = subprocess.run(
                 ['lsblk', '-J', '-o', 'NAME,SIZE,TYPE,MODEL,VENDOR,RO,MOUNTPOINT,PKNAME'],
                 capture_output=True,
-                text=True,
                 check=True
             )
             
-            data = json.loads(result.stdout)
+            # Parse the raw bytes; no need to decode to str first
+            data = orjson.loads(result.stdout) if orjson else json.loads(result.stdout)
             disks = []
             
             for device in data.get('blockdevices', []):
@@ -132,59 +254,81 @@ class DiskManager:
     
     def _parse_size(self, size_str: str) -> float:
         """Parse size string like '14.9G' to GB."""
-        match = re.match(r'([\d.]+)([KMGTP])', size_str.upper())
-        if not match:
-            return 0.0
-        
-        value, unit = match.groups()
-        value = float(value)
-        
-        units = {'K': 1/1024/1024, 'M': 1/1024, 'G': 1, 'T': 1024, 'P': 1024*1024}
-        return value * units.get(unit, 1)
+        return _parse_size_gb(size_str)
     
     def get_disk_usage(self, device: str) -> Dict:
-        """Get disk usage information."""
-        try:
-            result = subprocess.run(
-                ['df', '-h', device],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+        """
+        Get disk usage information.
+        
+        Args:
+            device: Mounted block device or a directory on the filesystem
             
-            lines = result.stdout.strip().split('\n')
-            if len(lines) > 1:
-                parts = lines[1].split()
-                if len(parts) >= 5:
-                    return {
-                        'size': parts[1],
-                        'used': parts[2],
-                        'available': parts[3],
-                        'use_percent': parts[4],
-                        'mounted_on': parts[5] if len(parts) > 5 else ''
-                    }
-        except subprocess.CalledProcessError:
-            pass
+        Returns:
+            Dictionary with sizes in bytes, or empty if not mounted
+        """
+        mount_points = self._read_mounts().get(device)
+        if mount_points:
+            mount_point = mount_points[0]
+        elif os.path.isdir(device):
+            mount_point = device
+        else:
+            return {}
+        
+        try:
+            st = os.statvfs(mount_point)
+        except OSError:
+            return {}
         
-        return {}
+        size = st.f_blocks * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        available = st.f_bavail * st.f_frsize
+        
+        # Same rounding as df: percentage of the space usable by non-root
+        usable = used + available
+        use_percent = -(-used * 100 // usable) if usable else 0
+        
+        return {
+            'size': size,
+            'used': used,
+            'available': available,
+            'use_percent': use_percent,
+            'mounted_on': mount_point,
+        }
     
     def unmount_disk(self, device: str) -> bool:
         """Unmount a disk."""
+        self.invalidate_cache()
         try:
             # Try through UDisks2 first
             obj = self.bus.get('org.freedesktop.UDisks2', device.replace('/dev/', '/org/freedesktop/UDisks2/block_devices/'))
             obj.Filesystem.Unmount({})
             return True
         except Exception:
-            # Fallback to umount
+            pass
+        
+        # Unmount directly when we have the privileges; saves spawning umount
+        mount_points = self._read_mounts().get(device, [])
+        if mount_points:
             try:
-                subprocess.run(['umount', device], check=True)
+                # The same device can be mounted more than once; the latest
+                # mount is on top, so undo them in reverse order
+                for mount_point in reversed(mount_points):
+                    _umount(mount_point)
                 return True
-            except subprocess.CalledProcessError:
-                return False
+            except OSError as e:
+                if e.errno not in (errno.EPERM, errno.EACCES):
+                    print(f"umount2 failed for {device}: {e}")
+        
+        # Fallback to umount
+        try:
+            subprocess.run(['umount', device], check=True)
+            return True
+        except subprocess.CalledProcessError:
+            return False
     
     def eject_disk(self, device: str) -> bool:
         """Eject a disk."""
+        self.invalidate_cache()
         try:
             obj = self.bus.get('org.freedesktop.UDisks2', device.replace('/dev/', '/org/freedesktop/UDisks2/block_devices/'))
             obj.Drive.Eject({})
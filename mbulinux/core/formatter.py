@@ -2,9 +2,13 @@
 Disk formatting functionality.
 """
 
+import os
+import shlex
+import shutil
 import subprocess
 import time
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
 
 class DiskFormatter:
     """Handle disk formatting operations."""
@@ -45,7 +49,7 @@ class DiskFormatter:
             quick = options.get('quick', False)
             
             partition = f"{device}1"
-            time.sleep(1)  # Wait for partition to appear
+            self._wait_for_partition(partition)
             
             return self._format_partition(partition, fs_type, label, quick)
             
@@ -56,23 +60,50 @@ class DiskFormatter:
             print(f"Unexpected error: {e}")
             return False
     
+    def _wait_for_partition(self, partition: str, timeout: float = 5.0):
+        """Wait until udev has created the partition device node."""
+        try:
+            subprocess.run(['udevadm', 'settle', f'--timeout={int(timeout)}'],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        except FileNotFoundError:
+            pass
+        
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(partition):
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Partition {partition} did not appear")
+            time.sleep(0.02)
+    
     def _unmount_device(self, device: str):
         """Unmount device and all partitions."""
         try:
             # Try udisksctl first
             subprocess.run(['udisksctl', 'unmount', '-b', device],
-                          capture_output=True, check=False)
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
             
             # Also try regular umount
-            subprocess.run(['umount', device], capture_output=True, check=False)
+            subprocess.run(['umount', device],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
             
             # Unmount any partitions
-            import glob
-            for part in glob.glob(f"{device}*[0-9]"):
-                subprocess.run(['umount', part], capture_output=True, check=False)
+            for part in self._get_partitions(device):
+                subprocess.run(['umount', part],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         except Exception:
             pass
     
+    def _get_partitions(self, device: str) -> List[str]:
+        """List partition device nodes of a disk, as reported by sysfs."""
+        name = os.path.basename(os.path.realpath(device))
+        try:
+            return sorted(
+                f"/dev/{entry.name}"
+                for entry in Path(f"/sys/block/{name}").iterdir()
+                if entry.name.startswith(name) and (entry / 'partition').exists()
+            )
+        except OSError:
+            return []
+    
     def _create_partition_table(self, device: str, scheme: str):
         """Create partition table on device."""
         subprocess.run(['parted', '-s', device, 'mklabel', scheme],
@@ -89,19 +120,15 @@ class DiskFormatter:
         
         parted_fs = fs_map.get(fs_type, 'fat32')
         
-        # Create partition
-        subprocess.run([
-            'parted', '-s', device,
-            'mkpart', 'primary', parted_fs, '0%', '100%'
-        ], check=True, capture_output=True)
-        
-        # Set appropriate flags
+        # Create partition and set appropriate flags in one parted call
+        cmd = ['parted', '-s', device,
+               'mkpart', 'primary', parted_fs, '0%', '100%']
         if scheme == 'mbr':
-            subprocess.run(['parted', '-s', device, 'set', '1', 'boot', 'on'],
-                          check=True, capture_output=True)
+            cmd.extend(['set', '1', 'boot', 'on'])
         elif scheme == 'gpt' and fs_type == 'fat32':
-            subprocess.run(['parted', '-s', device, 'set', '1', 'esp', 'on'],
-                          check=True, capture_output=True)
+            cmd.extend(['set', '1', 'esp', 'on'])
+        
+        subprocess.run(cmd, check=True, capture_output=True)
     
     def _format_partition(self, partition: str, fs_type: str, label: str, quick: bool) -> bool:
         """Format partition with specified filesystem."""
@@ -135,17 +162,19 @@ class DiskFormatter:
         try:
             # Use blkid to get filesystem info
             result = subprocess.run(
-                ['blkid', device],
+                ['blkid', '-o', 'export', device],
                 capture_output=True,
                 text=True,
                 check=True
             )
             
+            # One KEY=value pair per line, values shell-escaped (LABEL=My\ Disk)
             info = {}
-            for part in result.stdout.strip().split():
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    info[key.lower()] = value.strip('"')
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition('=')
+                if sep:
+                    words = shlex.split(value)
+                    info[key.lower()] = words[0] if words else ''
             
             return info if info else None
             
@@ -157,11 +186,7 @@ class DiskFormatter:
         filesystems = ['fat32', 'ntfs']
         
         # Check for exfat support
-        try:
-            subprocess.run(['which', 'mkfs.exfat'], 
-                          capture_output=True, check=False)
+        if shutil.which('mkfs.exfat'):
             filesystems.append('exfat')
-        except:
-            pass
         
         return filesystems
\ No newline at end of file
@@ -2,17 +2,99 @@
 Analyze ISO images to detect OS type and properties.
 """
 
+import asyncio
+import copy
+import functools
 import subprocess
 import os
-from typing import Dict, Optional
+import re
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 from ..constants import ISO_TYPE_LINUX, ISO_TYPE_WINDOWS, ISO_TYPE_UNKNOWN
 
+# Number of distinct ISO files whose probe results are kept
+PROBE_CACHE_SIZE = 64
+
+# ISO9660 layout: 2 KiB sectors, volume descriptors from sector 16
+ISO_SECTOR_SIZE = 2048
+PVD_OFFSET = 16 * ISO_SECTOR_SIZE
+VOLUME_ID_OFFSET = PVD_OFFSET + 40
+VOLUME_ID_LENGTH = 32
+ROOT_RECORD_OFFSET = PVD_OFFSET + 156
+
+# El Torito boot record follows the PVD; its catalog lists boot images
+BOOT_RECORD_OFFSET = PVD_OFFSET + ISO_SECTOR_SIZE
+ELTORITO_ID = b'EL TORITO SPECIFICATION'
+ELTORITO_ENTRY_SIZE = 32
+ELTORITO_PLATFORM_EFI = 0xEF
+
+# One read covers the MBR, the 0x228 arch probe, the PVD and the boot record
+HEADER_SIZE = PVD_OFFSET + 2 * ISO_SECTOR_SIZE
+
+# Upper bound on a single directory extent we are willing to read
+MAX_DIRECTORY_SIZE = 1024 * 1024
+
+# Known distributions and the keywords identifying them (lowercase)
+DISTRO_KEYWORDS = {
+    'ubuntu': ['ubuntu', 'kubuntu', 'xubuntu', 'lubuntu'],
+    'fedora': ['fedora'],
+    'debian': ['debian'],
+    'arch': ['arch linux', 'arch_'],
+    'manjaro': ['manjaro'],
+    'mint': ['linux mint'],
+    'opensuse': ['opensuse', 'suse'],
+    'centos': ['centos'],
+    'rhel': ['red hat'],
+}
+
+# All keywords in one alternation so a single scan finds the distribution;
+# each keyword maps back to its distribution by group name
+_DISTRO_RE = re.compile('|'.join(
+    f"(?P<{distro}>{'|'.join(map(re.escape, keywords))})"
+    for distro, keywords in DISTRO_KEYWORDS.items()
+))
+
+
+def _file_signature(path: str) -> Tuple[str, int, int]:
+    """Identify a file's current contents by (path, mtime_ns, size)."""
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _memoize_by_file(func):
+    """
+    Cache an ImageAnalyzer probe per ISO file.
+    
+    Results are shared by all analyzer instances and recomputed when the
+    file's mtime or size changes.
+    """
+    cache = {}
+    
+    @functools.wraps(func)
+    def wrapper(self, iso_path, *args):
+        # Extra arguments are data derived from the file itself (e.g. its
+        # header), so the file signature alone is a sufficient key
+        try:
+            key = _file_signature(iso_path)
+        except OSError:
+            return func(self, iso_path, *args)
+        
+        if key not in cache:
+            if len(cache) >= PROBE_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[key] = func(self, iso_path, *args)
+        return cache[key]
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
 class ImageAnalyzer:
     """Analyze ISO images."""
     
     def __init__(self):
+        self._cache: Dict[Tuple[str, int, int], Dict] = {}
         self.signatures = {
             'linux': {
                 'files': ['boot/cat', 'boot/grub', 'isolinux/', 'syslinux/', 'casper/'],
@@ -34,12 +116,37 @@ class ImageAnalyzer:
         Returns:
             Dictionary with analysis results
         """
-        if not os.path.exists(iso_path):
+        try:
+            cached = self._cache.get(_file_signature(iso_path))
+        except OSError:
+            cached = None  # analyze_async reports the error
+        if cached is not None:
+            return copy.copy(cached)
+        
+        return asyncio.run(self.analyze_async(iso_path))
+    
+    async def analyze_async(self, iso_path: str) -> Dict:
+        """
+        Analyze ISO image, running independent probes concurrently.
+        
+        Args:
+            iso_path: Path to ISO file
+            
+        Returns:
+            Dictionary with analysis results
+        """
+        try:
+            key = _file_signature(iso_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"ISO file not found: {iso_path}")
         
+        cached = self._cache.get(key)
+        if cached is not None:
+            return copy.copy(cached)
+        
         result = {
             'path': iso_path,
-            'size': os.path.getsize(iso_path),
+            'size': key[2],
             'type': ISO_TYPE_UNKNOWN,
             'os_name': 'Unknown',
             'architecture': 'Unknown',
@@ -50,39 +157,58 @@ class ImageAnalyzer:
         
         # Check file extension
         if iso_path.lower().endswith(('.iso', '.img')):
-            result['is_hybrid'] = self._check_hybrid(iso_path)
-            
-            # Try to identify by reading first sector
+            # Try to identify by reading the volume descriptors
             try:
-                with open(iso_path, 'rb') as f:
-                    # Read boot sector
-                    f.seek(32768)  # ISO9660 PVD offset
-                    data = f.read(2048)
-                    
-                    # Check for ISO9660/El Torito
-                    if b'EL TORITO' in data:
-                        result['has_eltorito'] = True
-                    
-                    # Check for Windows
-                    if b'BOOTMGR' in data[:512] or b'NTFS' in data[:512]:
-                        result['type'] = ISO_TYPE_WINDOWS
-                        result['os_name'] = 'Windows'
-                        result['requires_uefi'] = self._check_windows_uefi(iso_path)
-                        result['wim_size'] = self._get_wim_size(iso_path)
-                    
-                    # Check for Linux (GRUB/SYSLINUX)
-                    elif b'ISOLINUX' in data or b'GRUB' in data or b'LINUX' in data:
-                        result['type'] = ISO_TYPE_LINUX
-                        result['os_name'] = self._identify_linux_distro(iso_path)
-                        result['architecture'] = self._get_linux_arch(iso_path)
+                header = await asyncio.to_thread(self._read_header, iso_path)
+                result['is_hybrid'] = self._check_hybrid(header)
+                data = header[PVD_OFFSET:PVD_OFFSET + ISO_SECTOR_SIZE]
+                
+                # Check for ISO9660/El Torito
+                if b'EL TORITO' in header[PVD_OFFSET:]:
+                    result['has_eltorito'] = True
+                
+                # Check for Windows
+                if b'BOOTMGR' in data[:512] or b'NTFS' in data[:512]:
+                    result['type'] = ISO_TYPE_WINDOWS
+                    result['os_name'] = 'Windows'
+                    # The loop-mount and 7z probes are independent subprocesses
+                    result['requires_uefi'], result['wim_size'] = await asyncio.gather(
+                        asyncio.to_thread(self._check_windows_uefi, iso_path, header),
+                        asyncio.to_thread(self._get_wim_size, iso_path, header),
+                    )
+                
+                # Check for Linux (GRUB/SYSLINUX)
+                elif b'ISOLINUX' in data or b'GRUB' in data or b'LINUX' in data:
+                    result['type'] = ISO_TYPE_LINUX
+                    result['os_name'], result['architecture'] = await asyncio.gather(
+                        asyncio.to_thread(self._identify_linux_distro, iso_path, header),
+                        asyncio.to_thread(self._get_linux_arch, iso_path, header),
+                    )
             
             except IOError as e:
                 print(f"Error reading ISO: {e}")
         
-        return result
+        self._cache[key] = result
+        return copy.copy(result)
     
-    def _check_hybrid(self, iso_path: str) -> bool:
-        """Check if ISO is hybrid (bootable from CD and USB)."""
+    def _read_header(self, iso_path: str) -> bytes:
+        """Read everything the probes need from the start of the ISO at once."""
+        fd = os.open(iso_path, os.O_RDONLY)
+        try:
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, HEADER_SIZE, os.POSIX_FADV_WILLNEED)
+            data = os.pread(fd, HEADER_SIZE, 0)
+            
+            # The header is not read again; keep it out of the page cache
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, 0, HEADER_SIZE, os.POSIX_FADV_DONTNEED)
+            return data
+        finally:
+            os.close(fd)
+    
+    @_memoize_by_file
+    def _run_file(self, iso_path: str) -> str:
+        """Run file(1) on the ISO and return its lowercased description."""
         try:
             result = subprocess.run(
                 ['file', iso_path],
@@ -90,12 +216,27 @@ class ImageAnalyzer:
                 text=True,
                 check=True
             )
-            return 'hybrid' in result.stdout.lower()
-        except subprocess.CalledProcessError:
-            return False
+            return result.stdout.lower()
+        except (subprocess.CalledProcessError, OSError):
+            return ''
     
-    def _check_windows_uefi(self, iso_path: str) -> bool:
+    def _check_hybrid(self, header: bytes) -> bool:
+        """Check if ISO is hybrid (bootable from CD and USB)."""
+        # isohybrid images carry an MBR boot signature in front of the ISO9660 PVD
+        return (header[510:512] == b'\x55\xaa'
+                and header[PVD_OFFSET + 1:PVD_OFFSET + 6] == b'CD001')
+    
+    @_memoize_by_file
+    def _check_windows_uefi(self, iso_path: str, header: bytes) -> bool:
         """Check if Windows ISO requires UEFI."""
+        # The El Torito boot catalog answers this without mounting the ISO
+        try:
+            has_efi = self._eltorito_has_efi(iso_path, header)
+        except OSError:
+            has_efi = None
+        if has_efi is not None:
+            return has_efi
+        
         try:
             # Mount ISO temporarily (read-only)
             import tempfile
@@ -115,7 +256,7 @@ class ImageAnalyzer:
                 
                 # Cleanup
                 subprocess.run(['udisksctl', 'loop-delete', '-b', mount_point],
-                             capture_output=True)
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 
                 return result
             finally:
@@ -123,8 +264,66 @@ class ImageAnalyzer:
         except Exception:
             return False
     
-    def _get_wim_size(self, iso_path: str) -> int:
+    def _eltorito_has_efi(self, iso_path: str, header: bytes) -> Optional[bool]:
+        """
+        Look for an EFI boot image in the El Torito boot catalog.
+        
+        Returns:
+            True or False, or None if there is no valid boot record/catalog
+        """
+        record = header[BOOT_RECORD_OFFSET:BOOT_RECORD_OFFSET + ISO_SECTOR_SIZE]
+        if (len(record) < 0x4B or record[0] != 0 or record[1:6] != b'CD001'
+                or not record[7:39].startswith(ELTORITO_ID)):
+            return None
+        
+        catalog_sector = int.from_bytes(record[0x47:0x4B], 'little')
+        fd = os.open(iso_path, os.O_RDONLY)
+        try:
+            catalog = os.pread(fd, ISO_SECTOR_SIZE, catalog_sector * ISO_SECTOR_SIZE)
+        finally:
+            os.close(fd)
+        
+        # Validation entry: header ID 1 and the 0x55AA key
+        if len(catalog) < 2 * ELTORITO_ENTRY_SIZE or catalog[0] != 0x01 or catalog[30:32] != b'\x55\xaa':
+            return None
+        if catalog[1] == ELTORITO_PLATFORM_EFI:
+            return True
+        
+        # Section headers (0x90, or 0x91 for the last one) follow the default
+        # entry, each followed by its section entries and their extensions
+        offset = 2 * ELTORITO_ENTRY_SIZE
+        while offset + ELTORITO_ENTRY_SIZE <= len(catalog):
+            entry_type = catalog[offset]
+            if entry_type not in (0x90, 0x91):
+                break
+            if catalog[offset + 1] == ELTORITO_PLATFORM_EFI:
+                return True
+            if entry_type == 0x91:
+                break
+            
+            # Skip the section's entries, including extensions after the last
+            entries = int.from_bytes(catalog[offset + 2:offset + 4], 'little')
+            offset += ELTORITO_ENTRY_SIZE
+            while offset < len(catalog) and (entries or catalog[offset] == 0x44):
+                if catalog[offset] != 0x44:  # Extension
+                    entries -= 1
+                offset += ELTORITO_ENTRY_SIZE
+        
+        return False
+    
+    @_memoize_by_file
+    def _get_wim_size(self, iso_path: str, header: bytes) -> int:
         """Get size of Windows WIM file."""
+        # Look the file up in the ISO9660 directory tree first
+        try:
+            for name in ('INSTALL.WIM', 'INSTALL.ESD'):
+                size = self._find_iso9660_file_size(iso_path, header, ['SOURCES', name])
+                if size:
+                    return size
+        except (OSError, IndexError):
+            pass
+        
+        # Many Windows ISOs only carry the full tree in UDF; ask 7z
         try:
             # Use 7z to list contents
             result = subprocess.run(
@@ -147,53 +346,110 @@ class ImageAnalyzer:
         
         return 0
     
-    def _identify_linux_distro(self, iso_path: str) -> str:
-        """Identify Linux distribution."""
-        distros = {
-            'ubuntu': ['ubuntu', 'kubuntu', 'xubuntu', 'lubuntu'],
-            'fedora': ['fedora'],
-            'debian': ['debian'],
-            'arch': ['arch linux'],
-            'manjaro': ['manjaro'],
-            'mint': ['linux mint'],
-            'opensuse': ['opensuse', 'suse'],
-            'centos': ['centos'],
-            'rhel': ['red hat'],
-        }
+    def _find_iso9660_file_size(self, iso_path: str, header: bytes,
+                                path: list) -> Optional[int]:
+        """
+        Find a file's size by walking ISO9660 directory records.
+        
+        Args:
+            iso_path: Path to ISO file
+            header: Bytes returned by _read_header
+            path: Uppercase path components, e.g. ['SOURCES', 'INSTALL.WIM']
+            
+        Returns:
+            Size in bytes, or None if the file is not in the ISO9660 tree
+        """
+        if header[PVD_OFFSET + 1:PVD_OFFSET + 6] != b'CD001':
+            return None
+        
+        root = header[ROOT_RECORD_OFFSET:ROOT_RECORD_OFFSET + 34]
+        extent = int.from_bytes(root[2:6], 'little')
+        length = int.from_bytes(root[10:14], 'little')
         
+        fd = os.open(iso_path, os.O_RDONLY)
         try:
-            result = subprocess.run(
-                ['file', iso_path],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            for depth, wanted in enumerate(path):
+                is_last = depth == len(path) - 1
+                directory = os.pread(fd, min(length, MAX_DIRECTORY_SIZE),
+                                     extent * ISO_SECTOR_SIZE)
+                
+                size = 0
+                found = False
+                for name, rec_extent, rec_length, flags in self._iter_directory(directory):
+                    if name != wanted:
+                        if found:
+                            break  # Past the last extent of a multi-extent file
+                        continue
+                    
+                    if not is_last:
+                        if flags & 0x02:  # Directory
+                            extent, length = rec_extent, rec_length
+                            found = True
+                        break
+                    
+                    # Files over 4 GiB are split into several records
+                    size += rec_length
+                    found = True
+                    if not flags & 0x80:
+                        break
+                
+                if not found:
+                    return None
+                if is_last:
+                    return size
+        finally:
+            os.close(fd)
+        
+        return None
+    
+    def _iter_directory(self, directory: bytes):
+        """Yield (name, extent, length, flags) for each ISO9660 directory record."""
+        offset = 0
+        while offset < len(directory):
+            record_length = directory[offset]
+            if record_length == 0:
+                # Records never cross sectors; skip the padding to the next one
+                offset = (offset // ISO_SECTOR_SIZE + 1) * ISO_SECTOR_SIZE
+                continue
             
-            output = result.stdout.lower()
-            for distro, keywords in distros.items():
-                for keyword in keywords:
-                    if keyword in output:
-                        return distro.capitalize()
-        except Exception:
-            pass
+            record = directory[offset:offset + record_length]
+            name_length = record[32]
+            name = record[33:33 + name_length].decode('ascii', errors='ignore')
+            yield (
+                name.split(';', 1)[0].upper(),
+                int.from_bytes(record[2:6], 'little'),
+                int.from_bytes(record[10:14], 'little'),
+                record[25],
+            )
+            offset += record_length
+    
+    @_memoize_by_file
+    def _identify_linux_distro(self, iso_path: str, header: bytes) -> str:
+        """Identify Linux distribution."""
+        # The volume identifier usually names the distribution
+        volume_id = header[VOLUME_ID_OFFSET:VOLUME_ID_OFFSET + VOLUME_ID_LENGTH]
+        distro = self._match_distro(volume_id.decode('ascii', errors='ignore'))
+        if distro:
+            return distro
         
-        return 'Linux'
+        return self._match_distro(self._run_file(iso_path)) or 'Linux'
+    
+    def _match_distro(self, text: str) -> Optional[str]:
+        """Return the distribution named in text, if any."""
+        match = _DISTRO_RE.search(text.lower())
+        return match.lastgroup.capitalize() if match else None
     
-    def _get_linux_arch(self, iso_path: str) -> str:
+    @_memoize_by_file
+    def _get_linux_arch(self, iso_path: str, header: bytes) -> str:
         """Get Linux architecture."""
-        try:
-            # Check for 64-bit indicators
-            with open(iso_path, 'rb') as f:
-                f.seek(0x228)  # Architecture identifier offset
-                data = f.read(8)
-                
-                if b'x86_64' in data or b'amd64' in data:
-                    return 'x86_64'
-                elif b'i386' in data or b'i686' in data:
-                    return 'i386'
-                elif b'arm64' in data or b'aarch64' in data:
-                    return 'arm64'
-        except Exception:
-            pass
+        # Check for 64-bit indicators at the architecture identifier offset
+        data = header[0x228:0x230]
+        
+        if b'x86_64' in data or b'amd64' in data:
+            return 'x86_64'
+        elif b'i386' in data or b'i686' in data:
+            return 'i386'
+        elif b'arm64' in data or b'aarch64' in data:
+            return 'arm64'
         
-        return 'Unknown'
\ No newline at end of file
+        return 'Unknown'
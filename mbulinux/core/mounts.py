@@ -0,0 +1,61 @@
+"""
+Mount table parsing shared by the disk manager, writers and system info.
+"""
+
+import re
+from typing import List, Tuple
+
+MOUNTINFO = '/proc/self/mountinfo'
+
+# Mountinfo escapes space, tab, newline and backslash as octal (\040 etc.)
+_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
+
+def _unescape_octal(match) -> str:
+    """Turn a \\NNN octal escape match back into its character."""
+    return chr(int(match.group(1), 8))
+
+
+def unescape_mount_field(value: str) -> str:
+    """Decode the octal escapes used in mountinfo fields."""
+    if '\\' not in value:
+        return value
+    return _ESCAPE_RE.sub(_unescape_octal, value)
+
+
+def parse_mountinfo(lines) -> List[Tuple[str, str, str]]:
+    """
+    Parse mountinfo lines into (source, mount point, fstype) tuples.
+
+    Args:
+        lines: Iterable of lines in /proc/self/mountinfo format
+
+    Returns:
+        Entries in mount order, with escapes decoded
+    """
+    mounts = []
+    for line in lines:
+        # Fields: id parent major:minor root mount-point ... - fstype source options
+        fields, _, tail = line.partition(' - ')
+        fields = fields.split()
+        tail = tail.split()
+        if len(fields) < 5 or len(tail) < 2:
+            continue
+        mounts.append((unescape_mount_field(tail[1]),
+                       unescape_mount_field(fields[4]),
+                       tail[0]))
+    return mounts
+
+
+def read_mountinfo() -> List[Tuple[str, str, str]]:
+    """
+    Read /proc/self/mountinfo once.
+
+    Returns:
+        (source, mount point, fstype) tuples, empty if the table is unreadable
+    """
+    try:
+        with open(MOUNTINFO, 'r') as f:
+            return parse_mountinfo(f.readlines())
+    except OSError:
+        return []
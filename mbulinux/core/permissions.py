@@ -2,11 +2,34 @@
 Handle permissions and privilege escalation.
 """
 
+import functools
+import shutil
 import subprocess
 import os
 import sys
+import textwrap
 from typing import Optional
 
+# Desktop Entry keys must start at the beginning of the line
+_DESKTOP_TEMPLATE = textwrap.dedent("""\
+    [Desktop Entry]
+    Version=1.0
+    Type=Application
+    Name=MBU-Linux
+    Comment=Make Bootable USB on Linux
+    Exec={exec_path} %U
+    Icon=mbulinux
+    Terminal=false
+    Categories=System;Utility;
+    """)
+
+
+@functools.lru_cache(maxsize=None)
+def _have_tool(tool: str) -> bool:
+    """Check whether a tool is on PATH (cached for the process lifetime)."""
+    return shutil.which(tool) is not None
+
+
 class PermissionManager:
     """Manage permissions for disk operations."""
     
@@ -16,21 +39,15 @@ class PermissionManager:
     
     def _check_polkit(self) -> bool:
         """Check if polkit is available."""
-        try:
-            subprocess.run(['pkexec', '--version'],
-                          capture_output=True, check=False)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return _have_tool('pkexec')
     
     def _check_sudo(self) -> bool:
         """Check if sudo is available."""
-        try:
-            subprocess.run(['sudo', '--version'],
-                          capture_output=True, check=False)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return _have_tool('sudo')
+    
+    def _has_session_bus(self) -> bool:
+        """Check for a user session bus, through which pkexec reaches its agent."""
+        return os.access(f'/run/user/{os.getuid()}/bus', os.R_OK)
     
     def check_root(self) -> bool:
         """Check if running as root."""
@@ -91,70 +108,66 @@ class PermissionManager:
         if self.check_root():
             return True
         
-        # Try polkit first
-        if self.use_polkit:
-            try:
-                # Test with a simple command
-                result = subprocess.run(
-                    ['pkexec', 'echo', 'test'],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                return result.returncode == 0
-            except:
-                pass
+        # Polkit asks for authentication when the command is actually run,
+        # so there is no need to prompt here just to probe
+        if self.use_polkit and self._has_session_bus():
+            return True
         
-        # Try sudo
+        # Try sudo without prompting, which succeeds with cached credentials
         if self.use_sudo:
             try:
                 result = subprocess.run(
-                    ['sudo', '-v'],
-                    capture_output=True,
-                    text=True,
+                    ['sudo', '-n', 'true'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=False
                 )
                 return result.returncode == 0
-            except:
+            except OSError:
                 pass
         
         return False
     
     def create_desktop_entry(self) -> bool:
         """Create desktop entry with elevated privileges."""
-        desktop_content = """[Desktop Entry]
-            Version=1.0
-            Type=Application
-            Name=MBU-Linux
-            Comment=Make Bootable USB on Linux
-            Exec={exec_path} %U
-            Icon=mbulinux
-            Terminal=false
-            Categories=System;Utility;
-            """
-        
         # Get current executable path
         exec_path = sys.executable if hasattr(sys, '_MEIPASS') else sys.argv[0]
         
         desktop_file = os.path.expanduser('~/.local/share/applications/mbulinux.desktop')
         
+        content = _DESKTOP_TEMPLATE.format(exec_path=exec_path).encode('utf-8')
+        
         try:
+            # Nothing to do if the entry is already up to date
+            try:
+                with open(desktop_file, 'rb') as f:
+                    if f.read() == content:
+                        return True
+            except OSError:
+                pass
+            
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(desktop_file), exist_ok=True)
             
-            # Write desktop file
-            with open(desktop_file, 'w') as f:
-                f.write(desktop_content.format(exec_path=exec_path))
-            
-            # Make executable
-            os.chmod(desktop_file, 0o755)
+            # Write to a temporary file and rename so desktop environments
+            # never see a half-written entry
+            tmp_file = desktop_file + '.tmp'
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o755)
+            try:
+                os.write(fd, content)
+                os.fchmod(fd, 0o755)  # Mode passed to open() is masked by umask
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, desktop_file)
             
             # Update desktop database
-            subprocess.run(['update-desktop-database',
-                          os.path.expanduser('~/.local/share/applications')],
-                          check=False)
+            if _have_tool('update-desktop-database'):
+                subprocess.run(['update-desktop-database',
+                              os.path.dirname(desktop_file)],
+                              check=False)
             
             return True
         except Exception as e:
             print(f"Failed to create desktop entry: {e}")
-            return False
\ No newline at end of file
+            return False
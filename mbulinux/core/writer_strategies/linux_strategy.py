@@ -2,25 +2,70 @@
 Strategy for writing Linux ISO images.
 """
 
+import errno
+import fcntl
+import hashlib
+import mmap
+import random
+import re
 import subprocess
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from .base_strategy import WriteStrategy
+from ..mounts import read_mountinfo
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# O_DIRECT needs buffer addresses and lengths aligned to the logical block
+# size; 4 KiB covers both 512-byte and 4Kn devices
+DIRECT_IO_ALIGNMENT = 4096
+
+# Bytes handed to each sendfile() call, bounding the progress update interval
+SENDFILE_CHUNK_SIZE = 64 * 1024 * 1024
+
+# validate() compares this many stripes of this size
+VALIDATE_STRIPE_SIZE = 1024 * 1024
+VALIDATE_STRIPE_COUNT = 16
+
+# A full validate() compares the whole image in chunks of this size
+VALIDATE_FULL_CHUNK_SIZE = 8 * 1024 * 1024
+
+# dd status=progress lines, e.g.
+# "12345678 bytes (12 MB, 11 MiB) copied, 1.2345 s, 10.0 MB/s"
+_DD_PROGRESS_RE = re.compile(rb'(\d+) bytes.*?(?:,\s*([\d.,]+\s*[kKMGTP]?i?B/s))?\s*$')
+
+# dd separates status=progress updates with \r and its final summary with \n
+_DD_LINE_SEP_RE = re.compile(rb'[\r\n]')
+
+# Minimum time between dd progress reports (100ms)
+PROGRESS_INTERVAL_NS = 100_000_000
+
+
+def _new_hasher():
+    """Return a blake3 hasher if available, otherwise SHA-256."""
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.sha256()
+
 
 class LinuxWriteStrategy(WriteStrategy):
-    """Write strategy for Linux ISO images (using dd)."""
+    """Write strategy for Linux ISO images (raw image copy)."""
     
     def __init__(self):
         super().__init__()
         self.block_size = 4 * 1024 * 1024  # 4MB blocks for better performance
     
     def get_required_tools(self) -> list:
-        return ['dd', 'sync', 'parted']
+        return ['dd', 'sfdisk', 'udevadm']
     
     def write(self, iso_path: str, device: str, options: dict) -> bool:
         """
-        Write Linux ISO using dd.
+        Write Linux ISO as a raw image, falling back to dd.
         
         Args:
             iso_path: Path to ISO file
@@ -48,10 +93,141 @@ class LinuxWriteStrategy(WriteStrategy):
             if not self._format_device(device, options):
                 return False
         
-        # Write ISO with dd
+        self.update_progress(5, f"Writing {iso_path} to {device}...")
+        
+        # Write ISO directly, then in-kernel with sendfile, and finally
+        # with dd if the device rejects both
+        for writer in (self._write_direct, self._write_sendfile):
+            try:
+                return writer(iso_path, device, iso_size)
+            except OSError as e:
+                if e.errno not in (errno.EINVAL, errno.EOPNOTSUPP, errno.ENOSYS):
+                    self.update_progress(0, f"Error during write: {e}")
+                    return False
+            except Exception as e:
+                self.update_progress(0, f"Unexpected error: {e}")
+                return False
+        
+        return self._write_dd(iso_path, device, iso_size)
+    
+    def _write_direct(self, iso_path: str, device: str, iso_size: int) -> bool:
+        """
+        Copy the ISO to the device with O_DIRECT writes.
+        
+        The next chunk is read on a helper thread while the current one is
+        written, so source reads and device writes overlap.
+        
+        Raises:
+            OSError: If the device cannot be opened or written
+        """
+        chunk_size = self._get_chunk_size(iso_size)
+        
+        # Anonymous mmaps are page aligned, as O_DIRECT requires
+        buffers = [mmap.mmap(-1, chunk_size), mmap.mmap(-1, chunk_size)]
+        
+        src_fd = os.open(iso_path, os.O_RDONLY)
         try:
-            self.update_progress(5, f"Writing {iso_path} to {device}...")
+            try:
+                dst_fd = os.open(device, os.O_WRONLY | os.O_DIRECT)
+                direct = True
+            except OSError as e:
+                if e.errno != errno.EINVAL:
+                    raise
+                dst_fd = os.open(device, os.O_WRONLY)
+                direct = False
             
+            try:
+                start = time.monotonic()
+                offset = 0
+                index = 0
+                
+                with ThreadPoolExecutor(max_workers=1) as reader:
+                    pending = reader.submit(os.preadv, src_fd, [buffers[0]], 0)
+                    
+                    while offset < iso_size:
+                        length = min(pending.result(), iso_size - offset)
+                        if length <= 0:
+                            raise OSError(errno.EIO, f"Unexpected end of {iso_path}")
+                        
+                        next_offset = offset + length
+                        if next_offset < iso_size:
+                            pending = reader.submit(
+                                os.preadv, src_fd, [buffers[index ^ 1]], next_offset
+                            )
+                        
+                        # A short final chunk cannot satisfy O_DIRECT alignment
+                        if direct and length % DIRECT_IO_ALIGNMENT:
+                            flags = fcntl.fcntl(dst_fd, fcntl.F_GETFL)
+                            fcntl.fcntl(dst_fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+                            direct = False
+                        
+                        # Views are released even if pwrite fails, so the mmaps
+                        # can still be closed and the original error propagates
+                        with memoryview(buffers[index])[:length] as view:
+                            written = 0
+                            while written < length:
+                                with view[written:] as rest:
+                                    written += os.pwrite(dst_fd, rest, offset + written)
+                        
+                        offset = next_offset
+                        index ^= 1
+                        
+                        percent = min(99, int((offset / iso_size) * 100))
+                        elapsed = time.monotonic() - start
+                        speed = f"{offset / elapsed / 1e6:.1f} MB/s" if elapsed else "N/A"
+                        self.update_progress(percent, f"Writing: {percent}% ({speed})")
+                
+                self.update_progress(99, "Flushing data to device...")
+                os.fsync(dst_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+            for buffer in buffers:
+                buffer.close()
+        
+        self.update_progress(100, "Write completed successfully")
+        return True
+    
+    def _write_sendfile(self, iso_path: str, device: str, iso_size: int) -> bool:
+        """
+        Copy the ISO to the device with sendfile, entirely in the kernel.
+        
+        Raises:
+            OSError: If the device cannot be opened or written
+        """
+        src_fd = os.open(iso_path, os.O_RDONLY)
+        try:
+            dst_fd = os.open(device, os.O_WRONLY)
+            try:
+                start = time.monotonic()
+                offset = 0
+                
+                while offset < iso_size:
+                    sent = os.sendfile(dst_fd, src_fd, offset,
+                                       min(SENDFILE_CHUNK_SIZE, iso_size - offset))
+                    if sent <= 0:
+                        raise OSError(errno.EIO, f"Unexpected end of {iso_path}")
+                    offset += sent
+                    
+                    percent = min(99, int((offset / iso_size) * 100))
+                    elapsed = time.monotonic() - start
+                    speed = f"{offset / elapsed / 1e6:.1f} MB/s" if elapsed else "N/A"
+                    self.update_progress(percent, f"Writing: {percent}% ({speed})")
+                
+                self.update_progress(99, "Flushing data to device...")
+                os.fsync(dst_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        
+        self.update_progress(100, "Write completed successfully")
+        return True
+    
+    def _write_dd(self, iso_path: str, device: str, iso_size: int) -> bool:
+        """Write ISO using dd."""
+        try:
             # Calculate optimal block size
             block_size = self._get_optimal_block_size(device)
             
@@ -70,34 +246,50 @@ class LinuxWriteStrategy(WriteStrategy):
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+                bufsize=0
             )
             
-            # Monitor progress
-            for line in process.stdout:
-                if 'bytes' in line:
-                    # Parse dd output for progress
-                    try:
-                        # Format: "12345678 bytes (12 MB, 11 MiB) copied, 1.2345 s, 10.0 MB/s"
-                        parts = line.split()
-                        if len(parts) >= 1:
-                            bytes_written = int(parts[0])
-                            percent = min(99, int((bytes_written / iso_size) * 100))
-                            speed = parts[-2] if len(parts) >= 3 else "N/A"
-                            self.update_progress(percent, f"Writing: {percent}% ({speed})")
-                    except (ValueError, IndexError):
-                        pass
+            # Monitor progress, reporting at most every PROGRESS_INTERVAL_NS.
+            # Output is handled as raw bytes; only emitted messages are decoded.
+            last_emit_ns = 0
+            pending = b''
+            while True:
+                chunk = process.stdout.read(4096)
+                if not chunk:
+                    break
+                
+                *lines, pending = _DD_LINE_SEP_RE.split(pending + chunk)
+                
+                now_ns = time.monotonic_ns()
+                if now_ns - last_emit_ns < PROGRESS_INTERVAL_NS:
+                    continue
+                
+                # Only the most recent update in this chunk is of interest
+                for line in reversed(lines):
+                    match = _DD_PROGRESS_RE.match(line)
+                    if match:
+                        break
+                else:
+                    continue
+                last_emit_ns = now_ns
+                
+                bytes_written = int(match.group(1))
+                percent = min(99, int((bytes_written / iso_size) * 100))
+                speed = match.group(2).decode('ascii', errors='replace') if match.group(2) else "N/A"
+                self.update_progress(percent, f"Writing: {percent}% ({speed})")
             
             # Wait for completion
             process.wait()
             
             if process.returncode == 0:
-                self.update_progress(100, "Write completed successfully")
+                # Flush only this device rather than every filesystem
+                dev_fd = os.open(device, os.O_WRONLY | os.O_CLOEXEC)
+                try:
+                    os.fsync(dev_fd)
+                finally:
+                    os.close(dev_fd)
                 
-                # Sync to ensure all data is written
-                subprocess.run(['sync'], check=False)
+                self.update_progress(100, "Write completed successfully")
                 return True
             else:
                 self.update_progress(0, f"dd failed with code {process.returncode}")
@@ -110,36 +302,154 @@ class LinuxWriteStrategy(WriteStrategy):
             self.update_progress(0, f"Unexpected error: {e}")
             return False
     
-    def validate(self, iso_path: str, device: str) -> bool:
-        """Simple validation by checking first few bytes."""
+    def validate(self, iso_path: str, device: str, full: bool = False) -> bool:
+        """
+        Validate by hashing the same sampled stripes of the ISO and device.
+        
+        The first and last stripes plus a fixed pseudo-random selection in
+        between are compared, so the result is reproducible between runs.
+        With full=True every byte of the image is compared instead.
+        """
         try:
-            # Read first 512 bytes from ISO
-            with open(iso_path, 'rb') as f:
-                iso_data = f.read(512)
-            
-            # Read first 512 bytes from device
-            with open(device, 'rb') as f:
-                device_data = f.read(512)
-            
-            return iso_data == device_data
+            src_fd = os.open(iso_path, os.O_RDONLY)
+            try:
+                dev_fd = os.open(device, os.O_RDONLY)
+                try:
+                    iso_size = os.fstat(src_fd).st_size
+                    if os.lseek(dev_fd, 0, os.SEEK_END) < iso_size:
+                        return False
+                    
+                    if full:
+                        return self._compare_full(src_fd, dev_fd, iso_size)
+                    
+                    offsets = self._get_validation_offsets(iso_size)
+                    
+                    # Start readahead of every stripe on both sides at once
+                    fadvise = getattr(os, 'posix_fadvise', None)
+                    if fadvise:
+                        for offset in offsets:
+                            fadvise(src_fd, offset, VALIDATE_STRIPE_SIZE, os.POSIX_FADV_WILLNEED)
+                            fadvise(dev_fd, offset, VALIDATE_STRIPE_SIZE, os.POSIX_FADV_WILLNEED)
+                    
+                    iso_hash = _new_hasher()
+                    dev_hash = _new_hasher()
+                    for offset in offsets:
+                        length = min(VALIDATE_STRIPE_SIZE, iso_size - offset)
+                        iso_hash.update(os.pread(src_fd, length, offset))
+                        dev_hash.update(os.pread(dev_fd, length, offset))
+                    
+                    # Nothing here is read again; release the cached pages
+                    if fadvise:
+                        fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                        fadvise(dev_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    
+                    return iso_hash.digest() == dev_hash.digest()
+                finally:
+                    os.close(dev_fd)
+            finally:
+                os.close(src_fd)
         except Exception:
             return False
     
+    def _compare_full(self, src_fd: int, dev_fd: int, size: int) -> bool:
+        """
+        Compare the first size bytes of two files.
+        
+        Both sides are read on their own thread into double buffers, so the
+        next chunk of each is in flight while the current one is compared.
+        """
+        buffers = [
+            (bytearray(VALIDATE_FULL_CHUNK_SIZE), bytearray(VALIDATE_FULL_CHUNK_SIZE))
+            for _ in range(2)
+        ]
+        
+        def read_chunk(index, offset):
+            iso_buf, dev_buf = buffers[index]
+            return (reader.submit(os.preadv, src_fd, [iso_buf], offset),
+                    reader.submit(os.preadv, dev_fd, [dev_buf], offset))
+        
+        fadvise = getattr(os, 'posix_fadvise', None)
+        if fadvise:
+            fadvise(src_fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+            fadvise(dev_fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        
+        offset = 0
+        index = 0
+        with ThreadPoolExecutor(max_workers=2) as reader:
+            pending = read_chunk(0, 0)
+            
+            while offset < size:
+                length = min(VALIDATE_FULL_CHUNK_SIZE, size - offset)
+                iso_read, dev_read = (future.result() for future in pending)
+                if iso_read < length or dev_read < length:
+                    return False
+                
+                next_offset = offset + length
+                if next_offset < size:
+                    pending = read_chunk(index ^ 1, next_offset)
+                
+                # memoryview comparison is a plain memcmp, far cheaper than
+                # hashing both sides
+                iso_buf, dev_buf = buffers[index]
+                with memoryview(iso_buf) as a, memoryview(dev_buf) as b:
+                    if a[:length] != b[:length]:
+                        return False
+                
+                offset = next_offset
+                index ^= 1
+        
+        # Nothing here is read again; release the cached pages
+        if fadvise:
+            fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            fadvise(dev_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        return True
+    
+    def _get_validation_offsets(self, iso_size: int) -> list:
+        """Pick the stripe offsets compared by validate()."""
+        stripes = range(0, iso_size, VALIDATE_STRIPE_SIZE)
+        if len(stripes) <= VALIDATE_STRIPE_COUNT:
+            return list(stripes)
+        
+        inner = random.Random(0).sample(stripes[1:-1], VALIDATE_STRIPE_COUNT - 2)
+        return [stripes[0]] + sorted(inner) + [stripes[-1]]
+    
     def _unmount_device(self, device: str):
         """Unmount device and all its partitions."""
         try:
-            # Unmount using udisksctl
-            subprocess.run(['udisksctl', 'unmount', '-b', device],
-                          capture_output=True, check=False)
+            devices = self._get_device_nodes(device)
+            mount_points = [
+                mount_point
+                for source, mount_point in self._read_mountinfo()
+                if source in devices
+            ]
+            if not mount_points:
+                return
             
-            # Also try to unmount any partitions
-            import glob
-            for part in glob.glob(f"{device}*[0-9]"):
-                subprocess.run(['udisksctl', 'unmount', '-b', part],
-                              capture_output=True, check=False)
+            # One umount for every mount, nested mount points first
+            mount_points.sort(key=len, reverse=True)
+            subprocess.run(['umount'] + mount_points,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         except Exception:
             pass
     
+    def _get_device_nodes(self, device: str) -> set:
+        """Return the device and its partitions as /dev paths."""
+        name = os.path.basename(os.path.realpath(device))
+        nodes = {device, f'/dev/{name}'}
+        try:
+            # Partitions appear as subdirectories of the disk in sysfs
+            nodes.update(f'/dev/{entry}'
+                         for entry in os.listdir(f'/sys/class/block/{name}')
+                         if entry.startswith(name))
+        except OSError:
+            pass
+        return nodes
+    
+    def _read_mountinfo(self) -> list:
+        """Return (source, mount point) pairs from /proc/self/mountinfo."""
+        return [(source, mount_point)
+                for source, mount_point, _ in read_mountinfo()]
+    
     def _format_device(self, device: str, options: dict) -> bool:
         """Format device with selected options."""
         try:
@@ -148,22 +458,19 @@ class LinuxWriteStrategy(WriteStrategy):
             
             self.update_progress(0, f"Formatting {device} as {fs} ({scheme})...")
             
-            # Create partition table
-            subprocess.run(['parted', '-s', device, 'mklabel', scheme],
-                          check=True, capture_output=True)
-            
-            # Create single partition
-            subprocess.run(['parted', '-s', device, 'mkpart', 'primary', fs, '0%', '100%'],
-                          check=True, capture_output=True)
-            
-            # Set boot flag for MBR
-            if scheme == 'mbr':
-                subprocess.run(['parted', '-s', device, 'set', '1', 'boot', 'on'],
-                              check=True, capture_output=True)
+            # Partition table and single partition in one sfdisk run
+            layout = self._get_sfdisk_layout(scheme, fs)
+            subprocess.run(['sfdisk', '--wipe', 'always', device],
+                          input=layout, check=True, capture_output=True)
             
-            # Format partition
+            # Let udev finish processing the new partition instead of sleeping;
+            # the node itself may already exist before the rules have run
             partition = f"{device}1"
-            time.sleep(1)  # Wait for partition to appear
+            try:
+                subprocess.run(['udevadm', 'settle', '--timeout=5'],
+                              check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except FileNotFoundError:
+                pass  # No udev (containers, minimal systems)
             
             if fs == 'fat32':
                 subprocess.run(['mkfs.fat', '-F', '32', '-n', 'BOOTUSB', partition],
@@ -181,6 +488,25 @@ class LinuxWriteStrategy(WriteStrategy):
         except subprocess.CalledProcessError as e:
             self.update_progress(0, f"Formatting failed: {e}")
             return False
+        except FileNotFoundError as e:
+            self.update_progress(0, f"Formatting failed: {e.filename} not found")
+            return False
+    
+    def _get_sfdisk_layout(self, scheme: str, fs: str) -> bytes:
+        """Build the sfdisk script for a single partition spanning the device."""
+        if scheme == 'gpt':
+            # EFI System for FAT32, Microsoft basic data otherwise
+            part_type = 'U' if fs == 'fat32' else 'EBD0A0A2-B9E5-4433-87C0-68B6B72699C7'
+            return f"label: gpt\n,,{part_type}\n".encode()
+        
+        # W95 FAT32 (LBA) or HPFS/NTFS/exFAT, marked bootable
+        part_type = 'c' if fs == 'fat32' else '7'
+        return f"label: dos\n,,{part_type},*\n".encode()
+    
+    def _get_chunk_size(self, iso_size: int) -> int:
+        """Pick a copy chunk size scaled to the image: 1 MiB up to 16 MiB."""
+        chunk = min(16 * 1024 * 1024, max(1024 * 1024, iso_size // 256))
+        return chunk - chunk % (1024 * 1024)
     
     def _get_optimal_block_size(self, device: str) -> str:
         """Get optimal block size for device."""
@@ -2,15 +2,88 @@
 Strategy for writing Windows ISO images.
 """
 
+import ctypes
+import ctypes.util
+import errno
+import functools
+import queue
 import subprocess
 import os
 import tempfile
 import shutil
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Tuple
 from pathlib import Path
 
+from ...constants import FAT32_MAX_FILE_SIZE
 from .base_strategy import WriteStrategy
 
+# Files are copied to the USB on this many threads, each with its own buffer
+COPY_WORKERS = 8
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Files at least this large first try copy_file_range, which can copy
+# without moving data through the page cache (e.g. reflinks)
+LARGE_FILE_SIZE = 64 * 1024 * 1024
+
+# Mount options for the target partitions: no atime updates, 128 KiB
+# writes for NTFS-3G and eager flushing on the removable FAT32 partition
+NTFS_MOUNT_OPTIONS = 'noatime,big_writes'
+FAT_MOUNT_OPTIONS = 'noatime,flush'
+
+# Performance-only options that may be dropped if a driver rejects them
+_OPTIONAL_MOUNT_OPTIONS = frozenset({'noatime', 'big_writes', 'flush'})
+
+# Split WIM parts at 3.8GB to stay safely under the FAT32 file size limit
+WIM_SPLIT_SIZE_MB = 3800
+
+
+@functools.lru_cache(maxsize=1)
+def _required_tools() -> tuple:
+    """Tools needed for Windows images (PATH is only searched once)."""
+    tools = ['parted', 'udevadm', 'mkfs.fat', 'mkfs.ntfs', 'wimlib-imagex']
+    
+    # Check for wimlib
+    if shutil.which('wimlib-imagex') is None:
+        tools.remove('wimlib-imagex')
+        tools.append('7z')  # Fallback to 7z
+    
+    return tuple(tools)
+
+
+@functools.lru_cache(maxsize=None)
+def _libc():
+    return ctypes.CDLL(None, use_errno=True)
+
+
+def _syncfs(fd: int):
+    """Flush the filesystem containing fd to its device."""
+    if _libc().syncfs(fd) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_libwim():
+    """Load libwim through ctypes, or return None if it is not installed."""
+    path = ctypes.util.find_library('wim')
+    if path is None:
+        return None
+    try:
+        lib = ctypes.CDLL(path)
+    except OSError:
+        return None
+    
+    lib.wimlib_open_wim.argtypes = [ctypes.c_char_p, ctypes.c_int,
+                                    ctypes.POINTER(ctypes.c_void_p)]
+    lib.wimlib_split.argtypes = [ctypes.c_void_p, ctypes.c_char_p,
+                                 ctypes.c_uint64, ctypes.c_int]
+    lib.wimlib_free.argtypes = [ctypes.c_void_p]
+    lib.wimlib_free.restype = None
+    lib.wimlib_get_error_string.argtypes = [ctypes.c_int]
+    lib.wimlib_get_error_string.restype = ctypes.c_char_p
+    return lib
+
 class WindowsWriteStrategy(WriteStrategy):
     """Write strategy for Windows ISO images."""
     
@@ -18,17 +91,7 @@ class WindowsWriteStrategy(WriteStrategy):
         super().__init__()
     
     def get_required_tools(self) -> list:
-        tools = ['parted', 'mkfs.fat', 'mkfs.ntfs', 'wimlib-imagex']
-        
-        # Check for wimlib
-        try:
-            subprocess.run(['wimlib-imagex', '--version'], 
-                          capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            tools.remove('wimlib-imagex')
-            tools.append('7z')  # Fallback to 7z
-        
-        return tools
+        return list(_required_tools())
     
     def write(self, iso_path: str, device: str, options: dict) -> bool:
         """
@@ -51,7 +114,7 @@ class WindowsWriteStrategy(WriteStrategy):
         
         # Check WIM size
         wim_size = iso_info.get('wim_size', 0)
-        needs_split = wim_size > 4 * 1024**3  # > 4GB
+        needs_split = wim_size > FAT32_MAX_FILE_SIZE
         
         # Unmount device
         self._unmount_device(device)
@@ -72,8 +135,7 @@ class WindowsWriteStrategy(WriteStrategy):
             mount_point = tempfile.mkdtemp()
             
             partition = f"{device}1"
-            subprocess.run(['mount', partition, mount_point], 
-                          capture_output=True, check=True)
+            self._mount_partition(partition, mount_point, 'ro,noatime')
             
             # Check for essential Windows files
             essential_files = ['bootmgr', 'boot/BCD', 'sources/boot.wim']
@@ -102,14 +164,10 @@ class WindowsWriteStrategy(WriteStrategy):
             
             self.update_progress(5, f"Creating {scheme.upper()} partition table...")
             
-            # Create partition table
-            subprocess.run(['parted', '-s', device, 'mklabel', scheme],
-                          check=True, capture_output=True)
-            
             # Create partitions
             if needs_split:
                 # FAT32 (boot) + NTFS (install) for large WIM
-                self._create_dual_partitions(device)
+                self._create_dual_partitions(device, scheme)
             else:
                 # Single NTFS partition
                 self._create_single_partition(device, scheme)
@@ -121,81 +179,89 @@ class WindowsWriteStrategy(WriteStrategy):
             self.update_progress(0, f"Formatting failed: {e}")
             return False
     
+    def _run_parted(self, device: str, scheme: str, commands: list):
+        """Write a new partition table and apply commands in one parted run."""
+        label = 'msdos' if scheme == 'mbr' else scheme
+        subprocess.run(['parted', '-s', device, 'mklabel', label] + commands,
+                      check=True, capture_output=True)
+    
+    def _wait_for_partition(self, partition: str):
+        """Wait until udev has finished processing the new partition."""
+        # The node itself may already exist before the rules have run
+        try:
+            subprocess.run(['udevadm', 'settle', '--timeout=5'],
+                          check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            pass  # No udev (containers, minimal systems)
+    
     def _create_single_partition(self, device: str, scheme: str):
         """Create single NTFS partition."""
-        # Create NTFS partition
-        subprocess.run(['parted', '-s', device, 'mkpart', 'primary', 'ntfs', '0%', '100%'],
-                      check=True)
-        
-        # Set boot/esp flags
-        partition = f"{device}1"
-        if scheme == 'gpt':
-            subprocess.run(['parted', '-s', device, 'set', '1', 'esp', 'on'],
-                          check=True)
-        else:
-            subprocess.run(['parted', '-s', device, 'set', '1', 'boot', 'on'],
-                          check=True)
+        # Create NTFS partition and set boot/esp flags
+        flag = 'esp' if scheme == 'gpt' else 'boot'
+        self._run_parted(device, scheme, [
+            'mkpart', 'primary', 'ntfs', '0%', '100%',
+            'set', '1', flag, 'on',
+        ])
         
         # Format as NTFS
+        partition = f"{device}1"
+        self._wait_for_partition(partition)
         subprocess.run(['mkfs.ntfs', '-f', '-L', 'WININSTALL', partition],
                       check=True)
     
-    def _create_dual_partitions(self, device: str):
+    def _create_dual_partitions(self, device: str, scheme: str):
         """Create FAT32 (boot) + NTFS (install) partitions."""
-        # FAT32 partition for boot (1GB)
-        subprocess.run(['parted', '-s', device, 'mkpart', 'primary', 'fat32', '0%', '1GB'],
-                      check=True)
-        subprocess.run(['parted', '-s', device, 'set', '1', 'esp', 'on'],
-                      check=True)
-        subprocess.run(['mkfs.fat', '-F', '32', '-n', 'BOOT', f"{device}1"],
-                      check=True)
+        # FAT32 partition for boot (1GB), NTFS partition for install (rest of space)
+        self._run_parted(device, scheme, [
+            'mkpart', 'primary', 'fat32', '0%', '1GB',
+            'set', '1', 'esp', 'on',
+            'mkpart', 'primary', 'ntfs', '1GB', '100%',
+        ])
         
-        # NTFS partition for install (rest of space)
-        subprocess.run(['parted', '-s', device, 'mkpart', 'primary', 'ntfs', '1GB', '100%'],
-                      check=True)
-        subprocess.run(['mkfs.ntfs', '-f', '-L', 'WINDOWS', f"{device}2"],
-                      check=True)
+        self._wait_for_partition(f"{device}2")
+        
+        # The partitions are independent, so format both at once
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(subprocess.run,
+                                ['mkfs.fat', '-F', '32', '-n', 'BOOT', f"{device}1"],
+                                check=True),
+                executor.submit(subprocess.run,
+                                ['mkfs.ntfs', '-f', '-L', 'WINDOWS', f"{device}2"],
+                                check=True),
+            ]
+            for future in futures:
+                future.result()
     
     def _extract_and_copy(self, iso_path: str, device: str, needs_split: bool) -> bool:
-        """Extract ISO and copy files to device."""
-        temp_dir = tempfile.mkdtemp()
+        """Copy files from the loop-mounted ISO straight to the device."""
+        iso_mount = tempfile.mkdtemp()
         
         try:
-            self.update_progress(15, "Extracting ISO files...")
+            self.update_progress(15, "Mounting ISO image...")
             
-            # Extract ISO using 7z
-            subprocess.run(['7z', 'x', iso_path, f'-o{temp_dir}'],
+            # Read files in place instead of extracting them to a temp dir first
+            subprocess.run(['mount', '-o', 'loop,ro', iso_path, iso_mount],
                           check=True, capture_output=True)
-            
-            # Handle WIM splitting if needed
-            if needs_split:
-                wim_path = os.path.join(temp_dir, 'sources', 'install.wim')
-                if os.path.exists(wim_path):
-                    self.update_progress(30, "Splitting large WIM file...")
-                    self._split_wim_file(wim_path)
-            
-            # Copy files to device
-            if needs_split:
-                # Copy boot files to FAT32 partition
-                self.update_progress(50, "Copying boot files...")
-                self._copy_boot_files(temp_dir, f"{device}1")
-                
-                # Copy install files to NTFS partition
-                self.update_progress(70, "Copying installation files...")
-                self._copy_install_files(temp_dir, f"{device}2")
-            else:
-                # Copy all files to single partition
-                self.update_progress(60, "Copying files to USB...")
-                self._copy_all_files(temp_dir, f"{device}1")
+            try:
+                # Copy files to device
+                if needs_split:
+                    # Boot files to FAT32, install files to NTFS, splitting the WIM
+                    self.update_progress(50, "Copying files to USB...")
+                    self._copy_split_files(iso_mount, f"{device}1", f"{device}2")
+                else:
+                    # Copy all files to single partition
+                    self.update_progress(60, "Copying files to USB...")
+                    self._copy_all_files(iso_mount, f"{device}1")
+            finally:
+                subprocess.run(['umount', iso_mount],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
             
             self.update_progress(95, "Finalizing...")
             
-            # Install bootloader
+            # Install bootloader; every partition was flushed when unmounted
             self._install_bootloader(device, needs_split)
             
-            # Sync
-            subprocess.run(['sync'], check=True)
-            
             self.update_progress(100, "Windows USB created successfully!")
             return True
             
@@ -203,87 +269,273 @@ class WindowsWriteStrategy(WriteStrategy):
             self.update_progress(0, f"Error: {e}")
             return False
         finally:
-            # Cleanup
-            shutil.rmtree(temp_dir, ignore_errors=True)
+            # Cleanup; rmdir refuses to touch a mount point that is still busy
+            try:
+                os.rmdir(iso_mount)
+            except OSError:
+                pass
     
-    def _split_wim_file(self, wim_path: str):
-        """Split WIM file if it's larger than 4GB."""
+    def _split_wim_file(self, wim_path: str, dest_dir: str):
+        """Split a WIM file larger than 4GB into dest_dir."""
+        swm_path = os.path.join(dest_dir, 'install.swm')
         try:
-            # Use wimlib to split
-            base_name = os.path.splitext(wim_path)[0]
-            subprocess.run([
-                'wimlib-imagex', 'split',
-                wim_path,
-                f"{base_name}.swm",
-                '3800'  # Split at 3.8GB to be safe
-            ], check=True)
-            
-            # Remove original WIM
-            os.remove(wim_path)
+            # Use wimlib to split, writing the parts directly to the target
+            self.update_progress(75, "Splitting large WIM file...")
+            if not self._split_wim_libwim(wim_path, swm_path):
+                subprocess.run([
+                    'wimlib-imagex', 'split',
+                    wim_path,
+                    swm_path,
+                    str(WIM_SPLIT_SIZE_MB)
+                ], check=True)
         except Exception:
-            # Fallback method
-            pass
+            # Fallback method: NTFS can hold the WIM as is
+            shutil.copy2(wim_path, dest_dir)
     
-    def _copy_boot_files(self, source_dir: str, partition: str):
-        """Copy boot files to FAT32 partition."""
-        mount_point = tempfile.mkdtemp()
-        try:
-            # Mount FAT32 partition
-            subprocess.run(['mount', partition, mount_point], check=True)
-            
-            # Copy essential boot files
-            boot_files = ['bootmgr', 'boot/', 'efi/', 'sources/boot.wim']
-            for item in boot_files:
-                src = os.path.join(source_dir, item)
-                dst = os.path.join(mount_point, item)
-                
-                if os.path.isdir(src):
-                    shutil.copytree(src, dst, dirs_exist_ok=True)
-                elif os.path.exists(src):
-                    shutil.copy2(src, dst)
+    def _split_wim_libwim(self, wim_path: str, swm_path: str) -> bool:
+        """
+        Split a WIM in-process with libwim.
+        
+        Returns:
+            False if libwim is not available
             
-            # Unmount
-            subprocess.run(['umount', mount_point], check=True)
+        Raises:
+            OSError: If libwim fails to open or split the WIM
+        """
+        lib = _load_libwim()
+        if lib is None:
+            return False
+        
+        wim = ctypes.c_void_p()
+        ret = lib.wimlib_open_wim(os.fsencode(wim_path), 0, ctypes.byref(wim))
+        if ret == 0:
+            try:
+                ret = lib.wimlib_split(wim, os.fsencode(swm_path),
+                                       WIM_SPLIT_SIZE_MB * 1024 * 1024, 0)
+            finally:
+                lib.wimlib_free(wim)
+        if ret != 0:
+            message = lib.wimlib_get_error_string(ret) or b'unknown error'
+            raise OSError(f"wimlib: {message.decode(errors='replace')}")
+        return True
+    
+    def _mount_partition(self, partition: str, mount_point: str, options: str):
+        """Mount a partition with options, retrying without the optional ones if rejected."""
+        # Not every driver knows every option (e.g. ntfs3 rejects big_writes)
+        result = subprocess.run(['mount', '-o', options, partition, mount_point],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if result.returncode != 0:
+            # Keep the options that change semantics, such as ro
+            required = [opt for opt in options.split(',')
+                        if opt and opt not in _OPTIONAL_MOUNT_OPTIONS]
+            cmd = ['mount', partition, mount_point]
+            if required:
+                cmd[1:1] = ['-o', ','.join(required)]
+            subprocess.run(cmd, capture_output=True, check=True)
+    
+    def _unmount_partition(self, mount_point: str):
+        """Flush a target filesystem and detach it."""
+        # syncfs flushes just this filesystem; once it returns the data is on
+        # the device, so the unmount itself can be lazy
+        fd = os.open(mount_point, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            _syncfs(fd)
         finally:
-            shutil.rmtree(mount_point, ignore_errors=True)
+            os.close(fd)
+        subprocess.run(['umount', '-l', mount_point], check=True)
     
-    def _copy_install_files(self, source_dir: str, partition: str):
-        """Copy installation files to NTFS partition."""
-        mount_point = tempfile.mkdtemp()
+    def _remove_mount_point(self, mount_point: str):
+        """Delete a temporary mount point, detaching it first if still mounted."""
+        # Never remove files from a partition left mounted by an error
+        if os.path.ismount(mount_point):
+            subprocess.run(['umount', '-l', mount_point],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            if os.path.ismount(mount_point):
+                return
+        shutil.rmtree(mount_point, ignore_errors=True)
+    
+    def _copy_split_files(self, source_dir: str, boot_partition: str,
+                          install_partition: str):
+        """
+        Copy boot files to the FAT32 and install files to the NTFS partition.
+        
+        Both partitions are mounted at once and every file is routed to its
+        target in a single pass over the ISO, so writes to the two overlap.
+        """
+        boot_mount = tempfile.mkdtemp()
+        install_mount = tempfile.mkdtemp()
         try:
-            # Mount NTFS partition
-            subprocess.run(['mount', partition, mount_point], check=True)
+            self._mount_partition(boot_partition, boot_mount, FAT_MOUNT_OPTIONS)
+            self._mount_partition(install_partition, install_mount, NTFS_MOUNT_OPTIONS)
             
-            # Copy everything except boot files already copied
-            for item in os.listdir(source_dir):
-                if item not in ['bootmgr', 'boot', 'efi']:
-                    src = os.path.join(source_dir, item)
-                    dst = os.path.join(mount_point, item)
-                    
-                    if os.path.isdir(src):
-                        shutil.copytree(src, dst, dirs_exist_ok=True)
-                    else:
-                        shutil.copy2(src, dst)
+            jobs = self._collect_boot_jobs(source_dir, boot_mount)
+            jobs += self._collect_install_jobs(source_dir, install_mount, split_wim=True)
+            self._copy_files(jobs)
+            
+            # The WIM is split straight from the ISO instead of being copied
+            wim_path = os.path.join(source_dir, 'sources', 'install.wim')
+            if os.path.exists(wim_path):
+                self._split_wim_file(wim_path, os.path.join(install_mount, 'sources'))
             
             # Unmount
-            subprocess.run(['umount', mount_point], check=True)
+            self._unmount_partition(boot_mount)
+            self._unmount_partition(install_mount)
         finally:
-            shutil.rmtree(mount_point, ignore_errors=True)
+            self._remove_mount_point(boot_mount)
+            self._remove_mount_point(install_mount)
+    
+    def _collect_boot_jobs(self, source_dir: str, mount_point: str) -> List[Tuple[str, str]]:
+        """List the essential boot files to copy to the FAT32 partition."""
+        boot_files = ['bootmgr', 'boot/', 'efi/', 'sources/boot.wim']
+        jobs = []
+        for item in boot_files:
+            src = os.path.join(source_dir, item)
+            dst = os.path.join(mount_point, item)
+            
+            if os.path.isdir(src):
+                jobs.extend(self._collect_copy_jobs(src, dst))
+            elif os.path.exists(src):
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                jobs.append((src, dst))
+        return jobs
+    
+    def _collect_install_jobs(self, source_dir: str, mount_point: str,
+                              split_wim: bool = False) -> List[Tuple[str, str]]:
+        """List the installation files to copy to the NTFS partition."""
+        # Everything except the boot files, which live on the FAT32 partition
+        exclude = {'bootmgr', 'boot', 'efi'}
+        if split_wim:
+            exclude.add(os.path.join('sources', 'install.wim'))
+        return self._collect_copy_jobs(source_dir, mount_point, exclude)
     
     def _copy_all_files(self, source_dir: str, partition: str):
         """Copy all files to single partition."""
         mount_point = tempfile.mkdtemp()
         try:
-            # Mount partition
-            subprocess.run(['mount', partition, mount_point], check=True)
+            # Mount NTFS partition
+            self._mount_partition(partition, mount_point, NTFS_MOUNT_OPTIONS)
             
             # Copy everything
-            shutil.copytree(source_dir, mount_point, dirs_exist_ok=True)
+            self._parallel_copy_tree(source_dir, mount_point)
             
             # Unmount
-            subprocess.run(['umount', mount_point], check=True)
+            self._unmount_partition(mount_point)
         finally:
-            shutil.rmtree(mount_point, ignore_errors=True)
+            self._remove_mount_point(mount_point)
+    
+    def _parallel_copy_tree(self, src: str, dst: str, exclude: Iterable[str] = (),
+                            workers: int = COPY_WORKERS):
+        """
+        Copy a directory tree, copying the files concurrently.
+        
+        Args:
+            src: Source directory
+            dst: Destination directory (may already exist)
+            exclude: Paths relative to src to leave out
+            workers: Number of copy threads
+        """
+        self._copy_files(self._collect_copy_jobs(src, dst, exclude), workers)
+    
+    def _collect_copy_jobs(self, src: str, dst: str,
+                           exclude: Iterable[str] = ()) -> List[Tuple[str, str]]:
+        """Create the directories of a tree under dst and list its files."""
+        exclude = set(exclude)
+        jobs = []
+        pending = [(src, dst, '')]
+        while pending:
+            src_dir, dst_dir, rel = pending.pop()
+            
+            # Directories are created up front so the workers only copy files
+            os.makedirs(dst_dir, exist_ok=True)
+            
+            # DirEntry caches the file type, so no extra stat per entry
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    entry_rel = os.path.join(rel, entry.name) if rel else entry.name
+                    if entry_rel in exclude:
+                        continue
+                    
+                    target = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        if not entry.is_symlink():  # Like os.walk, don't follow
+                            pending.append((entry.path, target, entry_rel))
+                    else:
+                        jobs.append((entry.path, target))
+        return jobs
+    
+    def _copy_files(self, jobs: List[Tuple[str, str]], workers: int = COPY_WORKERS):
+        """Copy (src, dst) file pairs on a thread pool, preserving metadata."""
+        if not jobs:
+            return
+        
+        workers = min(workers, len(jobs))
+        buffers = queue.SimpleQueue()
+        for _ in range(workers):
+            buffers.put(bytearray(COPY_BUFFER_SIZE))
+        
+        def copy_file(job):
+            src, dst = job
+            with open(src, 'rb', buffering=0) as fsrc, \
+                    open(dst, 'wb', buffering=0) as fdst:
+                src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+                size = os.fstat(src_fd).st_size
+                large = size >= LARGE_FILE_SIZE and hasattr(os, 'posix_fadvise')
+                if large:
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                
+                if not self._kernel_copy(src_fd, dst_fd, size):
+                    buf = buffers.get()
+                    try:
+                        with memoryview(buf) as view:
+                            while n := fsrc.readinto(buf):
+                                # Raw writes may be partial
+                                off = 0
+                                while off < n:
+                                    off += fdst.write(view[off:n])
+                    finally:
+                        buffers.put(buf)
+                
+                # Large files are never read again; keep them from evicting
+                # the rest of the page cache (dirty pages must be written first)
+                if large:
+                    os.fdatasync(dst_fd)
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    os.posix_fadvise(dst_fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            shutil.copystat(src, dst)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Consume the results so the first failure is raised here
+            for _ in executor.map(copy_file, jobs):
+                pass
+    
+    def _kernel_copy(self, src_fd: int, dst_fd: int, size: int) -> bool:
+        """
+        Copy a whole file in the kernel with copy_file_range or sendfile.
+        
+        Returns:
+            False if neither is supported for these files and nothing was
+            copied, so the caller should fall back to read/write
+        """
+        methods = [lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count)]
+        if size >= LARGE_FILE_SIZE and hasattr(os, 'copy_file_range'):
+            methods.insert(0, lambda offset, count: os.copy_file_range(
+                src_fd, dst_fd, count, offset, offset))
+        
+        for copy_chunk in methods:
+            offset = 0
+            try:
+                while offset < size:
+                    copied = copy_chunk(offset, size - offset)
+                    if copied == 0:
+                        break  # File shrank while copying
+                    offset += copied
+                return True
+            except OSError as e:
+                # Only switch methods if nothing has been written yet
+                if offset or e.errno not in (errno.EINVAL, errno.ENOSYS,
+                                             errno.EOPNOTSUPP, errno.EXDEV):
+                    raise
+        return False
     
     def _install_bootloader(self, device: str, dual_partition: bool):
         """Install bootloader."""
@@ -302,7 +554,7 @@ class WindowsWriteStrategy(WriteStrategy):
         """Install GRUB bootloader."""
         mount_point = tempfile.mkdtemp()
         try:
-            subprocess.run(['mount', partition, mount_point], check=True)
+            self._mount_partition(partition, mount_point, FAT_MOUNT_OPTIONS)
             
             # Create GRUB directory
             grub_dir = os.path.join(mount_point, 'boot/grub')
@@ -323,8 +575,8 @@ menuentry "Install Windows" {
                 '--target=i386-pc',
                 f'--boot-directory={mount_point}/boot',
                 partition
-            ], capture_output=True, check=False)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
             
-            subprocess.run(['umount', mount_point], check=True)
+            self._unmount_partition(mount_point)
         finally:
-            shutil.rmtree(mount_point, ignore_errors=True)
+            self._remove_mount_point(mount_point)
@@ -71,22 +71,30 @@ class DiskListWidget(QWidget):
     def update_disks(self, disks: list):
         """Update the list of disks."""
         self.disks = disks
-        self.disk_list.clear()
+        
+        # Rebuild the list without a repaint or selection signal per item
+        self.disk_list.setUpdatesEnabled(False)
+        self.disk_list.blockSignals(True)
+        try:
+            self.disk_list.clear()
+            self.selected_disk = None
+            
+            icon = get_icon("drive-removable-media")
+            for disk in disks:
+                self.disk_list.addItem(self.create_disk_item(disk, icon))
+        finally:
+            self.disk_list.blockSignals(False)
+            self.disk_list.setUpdatesEnabled(True)
         
         if not disks:
             self.no_disks_label.show()
             self.disk_list.hide()
-            self.selected_disk = None
             return
         
         self.no_disks_label.hide()
         self.disk_list.show()
-        
-        for disk in disks:
-            item = self.create_disk_item(disk)
-            self.disk_list.addItem(item)
     
-    def create_disk_item(self, disk: dict) -> QListWidgetItem:
+    def create_disk_item(self, disk: dict, icon: QIcon = None) -> QListWidgetItem:
         """Create a list item for a disk."""
         device = disk.get('device', 'Unknown')
         model = disk.get('model', 'Unknown Drive')
@@ -104,7 +112,7 @@ class DiskListWidget(QWidget):
         item.setData(Qt.UserRole, disk)
         
         # Set icon
-        item.setIcon(get_icon("drive-removable-media"))
+        item.setIcon(icon if icon is not None else get_icon("drive-removable-media"))
         
         # Set tooltip
         tooltip = f"Device: {device}\n"
@@ -13,6 +13,33 @@ from PySide6.QtGui import QDragEnterEvent, QDropEvent, QIcon
 
 from ...ui.resources import get_icon
 
+# File name suffixes accepted as ISO images
+_ISO_SUFFIXES = ('.iso', '.img')
+
+# Drop hint styles when idle and while an ISO is dragged over the widget
+_DROP_STYLE_IDLE = """
+    QLabel {
+        color: #888888;
+        font-style: italic;
+        border: 2px dashed #cccccc;
+        border-radius: 5px;
+        padding: 20px;
+        margin-top: 10px;
+    }
+"""
+
+_DROP_STYLE_ACTIVE = """
+    QLabel {
+        color: #0078d7;
+        font-style: italic;
+        border: 2px dashed #0078d7;
+        border-radius: 5px;
+        padding: 20px;
+        margin-top: 10px;
+        background-color: #f0f7ff;
+    }
+"""
+
 class IsoSelector(QWidget):
     """Widget for selecting ISO image files."""
     
@@ -24,6 +51,10 @@ class IsoSelector(QWidget):
         
         self.iso_path = None
         
+        # First URL of the last drag and whether it named an ISO
+        self._last_drag_url = None
+        self._last_drag_ok = False
+        
         self.setup_ui()
         self.setAcceptDrops(True)
     
@@ -78,16 +109,7 @@ class IsoSelector(QWidget):
         # Drop hint
         self.drop_hint = QLabel("← Drag and drop ISO file here")
         self.drop_hint.setAlignment(Qt.AlignCenter)
-        self.drop_hint.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-style: italic;
-                border: 2px dashed #cccccc;
-                border-radius: 5px;
-                padding: 20px;
-                margin-top: 10px;
-            }
-        """)
+        self.drop_hint.setStyleSheet(_DROP_STYLE_IDLE)
         layout.addWidget(self.drop_hint)
     
     def browse_iso(self):
@@ -106,11 +128,14 @@ class IsoSelector(QWidget):
     
     def set_iso_path(self, file_path: str):
         """Set ISO file path."""
-        if not os.path.exists(file_path):
+        # One stat gives both existence and size
+        try:
+            st = os.stat(file_path)
+        except OSError:
             self.show_error(f"File not found: {file_path}")
             return
         
-        if not file_path.lower().endswith(('.iso', '.img')):
+        if not file_path.lower().endswith(_ISO_SUFFIXES):
             self.show_warning("Selected file doesn't appear to be an ISO image")
         
         self.iso_path = file_path
@@ -118,7 +143,7 @@ class IsoSelector(QWidget):
         
         # Update info
         file_name = Path(file_path).name
-        file_size = os.path.getsize(file_path) / (1024**3)  # GB
+        file_size = st.st_size / (1024**3)  # GB
         
         self.info_label.setText(
             f"Selected: {file_name}\n"
@@ -158,49 +183,29 @@ class IsoSelector(QWidget):
         """Handle drag enter event."""
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
-            if urls and urls[0].toLocalFile().lower().endswith(('.iso', '.img')):
+            
+            # Only the first URL matters; skip decoding it again for the same drag
+            url = urls[0] if urls else None
+            if url != self._last_drag_url:
+                self._last_drag_url = url
+                self._last_drag_ok = (url is not None
+                                      and url.toLocalFile().lower().endswith(_ISO_SUFFIXES))
+            
+            if self._last_drag_ok:
                 event.acceptProposedAction()
-                self.drop_hint.setStyleSheet("""
-                    QLabel {
-                        color: #0078d7;
-                        font-style: italic;
-                        border: 2px dashed #0078d7;
-                        border-radius: 5px;
-                        padding: 20px;
-                        margin-top: 10px;
-                        background-color: #f0f7ff;
-                    }
-                """)
+                self.drop_hint.setStyleSheet(_DROP_STYLE_ACTIVE)
     
     def dragLeaveEvent(self, event):
         """Handle drag leave event."""
-        self.drop_hint.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-style: italic;
-                border: 2px dashed #cccccc;
-                border-radius: 5px;
-                padding: 20px;
-                margin-top: 10px;
-            }
-        """)
+        self.drop_hint.setStyleSheet(_DROP_STYLE_IDLE)
     
     def dropEvent(self, event: QDropEvent):
         """Handle drop event."""
         urls = event.mimeData().urls()
         if urls:
             file_path = urls[0].toLocalFile()
-            if file_path.lower().endswith(('.iso', '.img')):
+            if file_path.lower().endswith(_ISO_SUFFIXES):
                 self.set_iso_path(file_path)
         
         # Reset drop hint
-        self.drop_hint.setStyleSheet("""
-            QLabel {
-                color: #888888;
-                font-style: italic;
-                border: 2px dashed #cccccc;
-                border-radius: 5px;
-                padding: 20px;
-                margin-top: 10px;
-            }
-        """)
\ No newline at end of file
+        self.drop_hint.setStyleSheet(_DROP_STYLE_IDLE)
\ No newline at end of file
@@ -4,19 +4,42 @@ Widget for displaying write progress.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QProgressBar,
-    QLabel, QTextEdit, QPushButton, QFrame
+    QLabel, QPlainTextEdit, QPushButton, QFrame
 )
-from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QTextCursor, QIcon
+from PySide6.QtCore import Qt, Slot, QTimer
+from PySide6.QtGui import QIcon
 
 from ...ui.resources import get_icon
 
+# Oldest log lines are dropped beyond this many
+LOG_MAX_LINES = 500
+
+# Progress updates are applied to the widgets at most this often (~30 Hz)
+PROGRESS_FLUSH_INTERVAL_MS = 33
+
+# Title text and colour for each stage of a write
+_TITLE_STATES = {
+    'preparing': ("Preparing...", "#0078d7"),
+    'writing': ("Writing...", "#ff9900"),
+    'completed': ("Completed!", "#00aa00"),
+}
+
 class ProgressPanel(QWidget):
     """Widget for displaying write progress."""
     
     def __init__(self):
         super().__init__()
         
+        # Latest update not yet shown, and log lines received since
+        self._pending_progress = None
+        self._pending_log = []
+        self._title_state = None
+        
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_progress)
+        
         self.setup_ui()
         self.reset()
     
@@ -68,14 +91,20 @@ class ProgressPanel(QWidget):
         layout.addWidget(self.details_button)
         
         # Log text edit (hidden by default)
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         self.log_text.setMaximumHeight(150)
         self.log_text.hide()
         layout.addWidget(self.log_text)
     
     def reset(self):
         """Reset progress display."""
+        self._flush_timer.stop()
+        self._pending_progress = None
+        self._pending_log.clear()
+        self._title_state = None
+        
         self.progress_bar.setValue(0)
         self.status_label.setText("Ready")
         self.log_text.clear()
@@ -83,32 +112,48 @@ class ProgressPanel(QWidget):
     
     @Slot(int, str)
     def update_progress(self, percent: int, message: str):
-        """Update progress display."""
+        """Update progress display (coalesced to PROGRESS_FLUSH_INTERVAL_MS)."""
+        self._pending_progress = (percent, message)
+        self._pending_log.append(message)
+        
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    @Slot()
+    def _flush_progress(self):
+        """Apply the latest pending progress update."""
+        if self._pending_progress is None:
+            return
+        
+        percent, message = self._pending_progress
+        self._pending_progress = None
+        
         self.progress_bar.setValue(percent)
         self.status_label.setText(message)
         
-        # Add to log
-        self.add_log(message)
+        # Add to log; only the last LOG_MAX_LINES lines would be kept anyway
+        self.add_log('\n'.join(self._pending_log[-LOG_MAX_LINES:]))
+        self._pending_log.clear()
         
         # Update title based on progress
         if percent == 0:
-            self.title_label.setText("Preparing...")
-            self.title_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #0078d7;")
+            state = 'preparing'
         elif percent < 100:
-            self.title_label.setText("Writing...")
-            self.title_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #ff9900;")
+            state = 'writing'
         else:
-            self.title_label.setText("Completed!")
-            self.title_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #00aa00;")
+            state = 'completed'
+        
+        # Restyling is comparatively costly; only do it on a stage change
+        if state != self._title_state:
+            self._title_state = state
+            text, color = _TITLE_STATES[state]
+            self.title_label.setText(text)
+            self.title_label.setStyleSheet(f"font-weight: bold; font-size: 14px; color: {color};")
     
     def add_log(self, message: str):
         """Add message to log."""
-        self.log_text.append(f"{message}")
-        
-        # Auto-scroll to bottom
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.log_text.setTextCursor(cursor)
+        # Plain text appends stay scrolled to the bottom by themselves
+        self.log_text.appendPlainText(message)
     
     def toggle_details(self):
         """Toggle details visibility."""
@@ -8,7 +8,18 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Signal
 
-from ...constants import SCHEME_MBR, SCHEME_GPT, FS_FAT32, FS_NTFS, FS_EXFAT
+from ...constants import (
+    SCHEME_MBR, SCHEME_GPT, FS_FAT32, FS_NTFS, FS_EXFAT, FAT32_MAX_FILE_SIZE
+)
+
+# Display names for the ISO_TYPE_* values
+_TYPE_NAMES = {
+    0: "Unknown",
+    1: "Linux",
+    2: "Windows",
+    3: "macOS",
+    4: "Hybrid"
+}
 
 class SettingsPanel(QWidget):
     """Widget for configuration settings."""
@@ -17,6 +28,7 @@ class SettingsPanel(QWidget):
         super().__init__()
         
         self.iso_info = None
+        self._groups_built = False
         
         self.setup_ui()
     
@@ -37,6 +49,23 @@ class SettingsPanel(QWidget):
         separator.setFrameShadow(QFrame.Sunken)
         layout.addWidget(separator)
         
+        # The option groups are built on first show or first use
+    
+    def showEvent(self, event):
+        """Build the option groups before the panel is first shown."""
+        self._ensure_built()
+        super().showEvent(event)
+    
+    def _ensure_built(self):
+        """Build the option groups if that has not happened yet."""
+        if not self._groups_built:
+            self._groups_built = True
+            self._build_groups()
+    
+    def _build_groups(self):
+        """Create the ISO information, formatting and option groups."""
+        layout = self.layout()
+        
         # ISO Info group
         self.info_group = QGroupBox("ISO Information")
         info_layout = QFormLayout(self.info_group)
@@ -68,6 +97,7 @@ class SettingsPanel(QWidget):
         self.fs_combo.addItem("NTFS", FS_NTFS)
         self.fs_combo.addItem("exFAT", FS_EXFAT)
         format_layout.addRow("Filesystem:", self.fs_combo)
+        self._fat32_row = self.fs_combo.findData(FS_FAT32)
         
         layout.addWidget(self.format_group)
         
@@ -94,6 +124,7 @@ class SettingsPanel(QWidget):
     
     def set_iso_info(self, iso_info: dict):
         """Set ISO information."""
+        self._ensure_built()
         self.iso_info = iso_info
         
         # Update labels
@@ -102,14 +133,7 @@ class SettingsPanel(QWidget):
         
         # Set type
         iso_type = iso_info.get('type', 0)
-        type_names = {
-            0: "Unknown",
-            1: "Linux",
-            2: "Windows",
-            3: "macOS",
-            4: "Hybrid"
-        }
-        self.type_label.setText(type_names.get(iso_type, "Unknown"))
+        self.type_label.setText(_TYPE_NAMES.get(iso_type, "Unknown"))
         
         # Enable/disable options based on ISO type
         self.update_options_for_iso(iso_info)
@@ -124,37 +148,52 @@ class SettingsPanel(QWidget):
             
             # Check WIM size
             wim_size = iso_info.get('wim_size', 0)
-            if wim_size > 4 * 1024**3:  # > 4GB
+            if wim_size > FAT32_MAX_FILE_SIZE:
                 # Need NTFS for large WIM
                 self.fs_combo.setCurrentIndex(1)  # NTFS
                 # Disable FAT32
-                for i in range(self.fs_combo.count()):
-                    if self.fs_combo.itemData(i) == FS_FAT32:
-                        self.fs_combo.model().item(i).setEnabled(False)
+                self._set_fs_items_enabled(disabled_rows=(self._fat32_row,))
             else:
                 # Enable all filesystems
-                for i in range(self.fs_combo.count()):
-                    self.fs_combo.model().item(i).setEnabled(True)
+                self._set_fs_items_enabled()
         
         elif iso_type == 1:  # Linux
             # Enable all options for Linux
-            for i in range(self.fs_combo.count()):
-                self.fs_combo.model().item(i).setEnabled(True)
+            self._set_fs_items_enabled()
+    
+    def _set_fs_items_enabled(self, disabled_rows: tuple = ()):
+        """Enable every filesystem item except disabled_rows, with a single repaint."""
+        model = self.fs_combo.model()
+        rows = model.rowCount()
+        if rows == 0:
+            return
+        
+        model.blockSignals(True)
+        try:
+            for i in range(rows):
+                model.item(i).setEnabled(i not in disabled_rows)
+        finally:
+            model.blockSignals(False)
+        
+        model.dataChanged.emit(model.index(0, 0), model.index(rows - 1, 0), [])
     
     def set_partition_scheme(self, scheme: str):
         """Set partition scheme."""
+        self._ensure_built()
         index = self.scheme_combo.findData(scheme)
         if index >= 0:
             self.scheme_combo.setCurrentIndex(index)
     
     def set_filesystem(self, filesystem: str):
         """Set filesystem."""
+        self._ensure_built()
         index = self.fs_combo.findData(filesystem)
         if index >= 0:
             self.fs_combo.setCurrentIndex(index)
     
     def get_settings(self) -> dict:
         """Get current settings."""
+        self._ensure_built()
         return {
             'scheme': self.scheme_combo.currentData(),
             'filesystem': self.fs_combo.currentData(),
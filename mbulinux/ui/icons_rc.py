@@ -0,0 +1,323 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x02\x1a\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x02\x00\x00\x00\xfc\x18\xed\xa3\
+\x00\x00\x01\xe1IDATx\x9c\xedT=k\x14Q\
+\x14=\xf7\xbd7\xbbyn\x8cY\x12\x08A\x1bCR\
+\xd8X\xa4\x12\x8bH\x1a;m,,\x82\x7fA\x10\x9b\
+\xfd\x1bZ\xdb\x89\x90T\xf9\x01\xa9\xd3\xa4I%V\x82\
+\x10B\x08\x06\xccf?2\xe3\xbew\xaf\xbc\x9dM2\
+\xb3\xd9dVp\xc1b\x0e\x0c\xcc<\xee\xdcs\xef=\
+\xe7>B\xe3\x1b&\x095\xd1\xec\x00\xcc\xf8\xa14x\
+\x02D&@ \x9c\xc9\xaa\xe8\xdf\x13\xdc\xb5\xda\xf4\xf3\
+\x8aH3\xe11\x9b\x18\x8b@\x118\xe1\xcfo\x1e\xac\
+=\xb4\x00Nc^\xfd\xf8\xe3\xb4\xebHS!\xcd0\
+AZ\xe3\x08\x02Eu\xab\xebV\xa71\x91&\xa3\x88\
+\xd4\x08\x02\x9f\xef-O p\x1d7t\x02\x91\xc0\x10\
+\xfb\xceo\xef\xfb2\xc4\x8e\x7f\xb6\x1d\xda=\x18\x82\xd0\
+\xa5\xf2\x03L\xe9\xecI\x86@P1\xf4\xeaI\xbdj\
+B]\xd4\x0f2ZEZ\x11D\x9c<Z\xb0\xe1\x15\
+\x98\xab\x99\xf7\xcf\xe6\xbb\x09C\x93s\xdc\xf3\x9cV\x92\
+\xa6\xdd\xfe\xdajv\x99T8\xb9\x22 \x0a&\x99\xae\
+\xea/\xaf\x17)\xcd\x9d\x92z\xf7\xab\x15\xa7\x9ei%\
+\xdd\xef\xc7\x83\xe0\xc6S\xab\x14\xc4\xcbL\xad\x12E\x95\
+l\x03{\x07\xe7\xcdVr)OnD,8n\xfb\
+Y\xabE\xe0\x99\x8dV\x8d\xcd\xfd\x0f\x9fvq\xef\x0e\
+\xbc\xcfY\x93\x01M8;\x7f\xf9\xe2\xf1\xd6\xdbu\xc7\
+\xa2\xd5\xa0.\x17\xfa\xb9A\x03EX\x98\xd6\x17\x1d\x04\
+=\xdf=_Y_\x9a\xa5\x8a\x91kj\x86\xa6{~\
+\xf9~}\xca\xd0\xd5\x06\x06\x0b\x8c\x22\x08\xbf\x13\xb5\x13\
+\xde\xd8:\xcaj`#m\xabs\xe1s(}:t\
+\xc2\xce\x89\xef\xec\x1de58<s\xc8\xd8\x97r\x97\
+\x9d\x00\xb1\x1fN\xc3\xb7Z\x9d\xaem\xf5\x8d.\xeaG\
+\x9b\xda_\xec\xf6H\xdc\xba\x07A\xa2\xb1\xaf\xb1\xff\xe4\
+\xbaV%A\x11\xca\x11\x15\xa2\x1cQ!\xca\x11\x15\xa2\
+\x1c\x11\x8a\xf0\x07<\xfe\xb6'\xfb\x84b\xc8\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x00\xe6\
+(\
+\xb5/\xfd`6\x02\xe5\x06\x00\xe4\x0b\x89PNG\x0d\
+\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x01\x00\x08\
+\x02\x00\x00\x00\xd3\x10?1\x00\x00\x02\xfdIDAT\
+x\x9c\xed\xdd1\x0dB1\x14@\xd1\x96 \x06OL\
+\xb8\xf8(@\x06\x13\x9a\xc0\x0dl8 \x05\xee9\x02\
+\x9a\xb7\xdc\xbc\xa5i\xe7\xd8\xee\x03\xaav\xab\x07\x80\x95\
+\x04@\x9a\x00H\x13\x00i\x02 M\x00\xa4\x09\x804\
+\x01\x90&\x00\xd2\xb4\xfd\xea\x01\xfe\xd3\xf3r\xf8\xd0\xc9\
+\xf3\xfcM69\xb6\xfb\x9f=\x1f\xcb\x8f\x9a+\xde\xfd\
+\xb5\x01K\x7f\x93:\x8f\xd7\xd5#|\x8b\xe7\xed4\x92\
+lK\xdf\x05\xca^\x80\xe1\xcd\x06[\xf6:4|\x03\
+\x1b\xc0({\x01\xb7\x94\x10\xf6F9\x9d\x1b\x00\x00\x00\
+\x00IEND\xaeB`\x82\x09\x00\x7f8*P\xbc\
+\xcf\xf4\x9c\x0f\x97\xa9\xa5*\xca\xba\x80b(\xc0[\x8b\
+\x13\x0f\xeb\xbd\x03\
+\x00\x00\x03\xe1\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x02\x00\x00\x00L\x5c\xf6\x9c\
+\x00\x00\x03\xa8IDATx\x9c\xed\xdc=n\x13A\
+\x18\xc6\xf1\xf7\x9d\xd9\xf1Gd\x10(\x22R$*:\
+R *:$wH)\xb8\x00\x17\xa0\x85\x8ap\x80\
+ Q\xe4\x16\x9c\x01\xd1\x91\x96\x16\xa1\x88&\x17@\x8e\
+\x10v\xe28\xe3\x99A\xb6\x05e\xb2\x1f\xf6>\xde\xf8\
+\xf9\x95\xb1\xa5u\xf6\xbf\xb3\xb3\x9e\xddD\xe5\xdd\x89\x10\
+\x8e\x01n\x9b\x18\x00\x8f#\x00\x8c\x01\xc0\x18\x00\x8c\x01\
+\xc0\x18\x00\x8c\x01\xc0\x18\x00\x8c\x01\xc0\x18\x00\x8c\x01\xc0\
+\x18\x00\x8c\x01\xc0\x18\x00\x8c\x01\xc02i\x0e-\xf2\xe6\
+$\xcd\xd0\xa4\x00)\x16\xd9\xab\xa6P/\x98\xc6\x04P\
+\x91^\xd7\xe6\xdc\xa9Id4)\x94\x0b\xa6\x01\x01t\
+~\xec\xf7\xba\xf6\xe4\xed\xa3;m\x93\xae=\x17-^\
+\x1dN\xe2\xe3\xa3\xd3\xe18\xa8\xd15\xcf\xd0\x80\x00\x0b\
+*r\xbfk\xb7\x5c\xae1\x90\x19m\xc6\x09\xa8A\x01\
+D\xc4\xc7\x94D\xf3\x8c\x00\xdf\x8c\xd3O\xd3\x02\xe8\xbf\
+]\xaf\xf9\xde\xd6\x08\xfc\x1e\x00\xc6\x00`\x0c\x00\xc6\x00\
+`\x0c\x00\xc6\x00`\x0c\x00\xc6\x00M\xfe\x22\xe6\x8c\xd6\
+\xf0\x9dGE\x92\xce\xb7U\x843\xea\xac\xae|-h\
+\xfe\xcd;\xc4b\x0b\xb5K\x0a\x90\xc4\x8f\xa65\xad\xbb\
+\xc74\x98\xa6\x94{[)\xc9`4\x95\x8bP\xd3\xa2\
+tK\xa5e\xca\xed\x8a\xb2\x01Rjg\xe6\xcd\xfeN\
+;\xef\x0aq\xb5\x11\x90R\xdb\x99N\x96w[\x9dL\
+\x0f\xf7w&>\xaa\xaev\x04\xc4\x94\x8c\xea\xd7\xd3\x8b\
+\xe3\x9f#\xd36%\xc6AVv\x8fH\xc7\xe9\x87\x17\
+\x0f\xa4v\x9a\xe3\xd5v\xa6\x07\xfd\xed\x9a>\x90\xc8\xc7\
+\xe3\xb3\xe3\xefC\xdb\xd5\x18R}\xa7\xa0\xd90\x1f\x87\
+\xbb\xad\x1b\x16\xe8\x97F\x8bM\x03\xb3\x05\xd1\xd5\x9f\x1e\
+}L\xce\xe8\xe8*\x96\xde\x05U'agoX\x1f\
+\xbe\x9e\x0f1\xef[\x93\xf8\xe2\xc7W\x1e\xb3\xa9\xba\xc2\
+T\xe1\xacV\x99h\xc0\xcb\xd1\xcen\xfau0&\xc0\
+\xec\xc6\x8a\xca\xc4\x87\xa3\xcf?&WA\xcd\xec'\xf5\
+\xb3F\xc3\xd8\xf7\x9f>\xec\xef\xed\x86\x98,\xe2>>\
+r\x04\x5c\xfa\xf8\xfe\xd37\x19^\x89S\xc9}*Z\
+\xa6\xcc\xc8\xe0\xfc\xe2\xf5\xf3\xfe\xdenL\xc9\xca\x86\x05\
+P\x95\xed{[\x7f\xb2L3\x85\x8c\x00g\x8dO\xd2\
+\xeb:\xc1\x01\xcf\x01>D\x1f\xe6W\xeb\xa0\x9b\xb8>\
+\xc4\x08\xbd\x81\x8c\x9f\x84\x9d5ja#@\xac\xa9r\
+\x09\xd4\xec\x00)\xc9\xe0\xf7\x05p\x0e\xf0\x99\x91\xb3\xf3\
+\xd1\xd8\xcbf\x06\xe88s\xf8\xea\xd9:\x5c\x05\xcd\x9f\
+d\xd4\x0d\x0a\xb0\xf8e\xdb\xce\x1e\xbc|\x22\xeb\x01r\
+\x0dZ5\x80\x8f\xc9\x87\xd9\xb1[\xfa\xb3Oc*\xb0\
+\xc8\xb9l\xb3E\xad\xf9\xae/}\xf8/\x9e\x00\xab2\
+\x8bg\x95.\x22\xbbV\xaaq\xab_L]\xa9\xc5\xe7\
+\xef\x95]\x8b.\x19`\xb6-\x95K\x9f\x0e\xbe\xfc\xaa\
+a9z\x9d\xfd_\x8e\x96\x96\x86R\x03A\xcb\xff\xc7\
+\xac$2\x0e\x8d\xf9C\x88\xdbvCf\xb1>\xdc\xcb\
+\x9a\xf4\x18\xe6m\xbb%\xd9\xa8\x87\x90\xd7\xd6\xa6\xaf\x06\
+\xc31\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x80\
+1\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\
+\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\
+\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\
+\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\
+\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x80\
+1\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\
+\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\
+\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\
+\x03\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\
+\x801\x00\x18\x03\x801\x00\x18\x03\x801\x00\x18\x03\x80\
+1\x00\x18\x03\x801\x00\x18\x03\x08\xd6_\xa2{\xf9\xa0\
+\x03\x89nb\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x04\x02\
+<\
+svg xmlns=\x22http:\
+//www.w3.org/200\
+0/svg\x22 width=\x2225\
+6\x22 height=\x22256\x22 \
+viewBox=\x220 0 256\
+ 256\x22>\x0a  <defs>\x0a\
+    <linearGradi\
+ent id=\x22gradient\
+\x22 x1=\x220%\x22 y1=\x220%\
+\x22 x2=\x22100%\x22 y2=\x22\
+100%\x22>\x0a      <st\
+op offset=\x220%\x22 s\
+tyle=\x22stop-color\
+:#0078d7;stop-op\
+acity:1\x22 />\x0a    \
+  <stop offset=\x22\
+100%\x22 style=\x22sto\
+p-color:#106ebe;\
+stop-opacity:1\x22 \
+/>\x0a    </linearG\
+radient>\x0a  </def\
+s>\x0a  \x0a  <!-- \xd0\xa4\xd0\
+\xbe\xd0\xbd -->\x0a  <rect \
+width=\x22256\x22 heig\
+ht=\x22256\x22 rx=\x2240\x22\
+ fill=\x22url(#grad\
+ient)\x22/>\x0a  \x0a  <!\
+-- \xd0\xa1\xd0\xb8\xd0\xbc\xd0\xb2\xd0\xbe\xd0\xbb \
+USB -->\x0a  <g tra\
+nsform=\x22translat\
+e(50, 50) scale(\
+2.5)\x22>\x0a    <path\
+ d=\x22M0,8 L62,8 L\
+62,32 L50,32 L50\
+,40 L42,40 L42,3\
+2 L20,32 L20,40 \
+L12,40 L12,32 L0\
+,32 Z\x22 \x0a        \
+  fill=\x22white\x22 s\
+troke=\x22white\x22 st\
+roke-width=\x222\x22/>\
+\x0a    <rect x=\x2226\
+\x22 y=\x220\x22 width=\x221\
+0\x22 height=\x228\x22 fi\
+ll=\x22white\x22/>\x0a   \
+ <rect x=\x2220\x22 y=\
+\x2216\x22 width=\x2222\x22 \
+height=\x228\x22 fill=\
+\x22#0078d7\x22/>\x0a    \
+<path d=\x22M30,24 \
+L32,24 L32,32 L3\
+0,32 Z\x22 fill=\x22wh\
+ite\x22/>\x0a  </g>\x0a  \
+\x0a  <!-- \xd0\xa2\xd0\xb5\xd0\xba\xd1\x81\
+\xd1\x82 MBU -->\x0a  <te\
+xt x=\x22128\x22 y=\x2222\
+0\x22 text-anchor=\x22\
+middle\x22 font-fam\
+ily=\x22Arial, sans\
+-serif\x22 \x0a       \
+ font-size=\x2228\x22 \
+font-weight=\x22bol\
+d\x22 fill=\x22white\x22>\
+MBU</text>\x0a</svg\
+>\
+\x00\x00\x02\xc4\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x02\x00\x00\x00%\x0b\xe6\x89\
+\x00\x00\x02\x8bIDATx\x9c\xd5\x98\xcbn\xd3P\
+\x10\x86\xff\xf9m7M\xa2J\x0d\xb7\x05t\x81\xbaa\
+\x81\x90\xe0\x05\x10\x08\xd8t\xc1#\xb0\xe0\x09\x10B\x88\
+7@b\xc93\xf0\x08\xa8\x12\x88=[v\x08\xb1\x81\
+%t\xd3R5\xd7\xe33\xe8\xd8!*\xb1\x93\xe0\xc4\
+Q\x99O'\x96e\xfb\x5c\xfe\x999sF\x11\xbc\xf8\
+\x0c\xcb\x10\xc6!\x8cC\x18\x870\x0ea\x1c\xc28\xf1\
+:\x06\x95\xf1o\x1aU#\x02T\x01_\xb6X\x96\xc9\
+\xfa\xef\x04(6\x13i&\x91\xfeqC~\xe3U\x7f\
+\x0d|\xedN\x88k\x1e\x8e\xe2N\xdc\x93\xbb\x97\x9e\xdf\
+>\x97z\x8dr\x93g\x0a\x8e\xfa\xfe\xd6\xebo\x87]\
+'\x91\xd4(#F\xed(Z\x89t\x9a\xd1\xf4L\x14\
+\x11#{ \xd5\xb0\x0d\x9c\xd78\xf3\x80*D0J\
+\xd5R\x16\x12\x19\xb7\xf1\x93S\xf7\xf5B\x18'\x9e\xff\
+\xbaj\xde\xa3\x846\xcb\xd8\x93\xb7\x95\x82Iu\xde\xf7\
+\x0b\x04\xf8\x81\xaf2\x17\x86\x14\xf4\xfd\xc0\x95\xcc\xa8\xc0\
+\xf1\xc0\x87\x01\xa3\x8a\x0ab\xce\x09\x94r\x01\xc1H^\
+\xb76\xa37\x8fv\xb668\xc9\xe8\xc55\x85\xc4\xae\
+\x7fwL\xf5\xea\x85\x8d4;\xc8\xf2k\xfei;\x91\
+w\x8fw\x5c\x9a\xed\xe8S]HH\xf9\xf0\xf0Y\x88\
+?\xdd\xff\xf1\xe9{\x9f\x1bRz6\xce\xf6\x80\x22\xa1\
+\xec]k\xe7\x99du\x22\xca\x9d\xdd\xf6\x12\x1d/\xb6\
+cx\x0d9\xb8\x9a\x80\xcc\xc0\x87=\xdfiFy\x1e\
+,\xe2\xbc\xff\xf8\xf5\xa7s~\xea\xb5d\xb1^\x1c\xcd\
+O\xc5\xa3\x84\x8c{s\xf7|\xa7\xd5Ph\xd1\x0f^\
+\xc38\xa3R\xcb\xff\x8b\x80\xccl\xa1\x15\x05\xe4O\x8e\
+zn\xef\xd5\xfb\xdeQ\x1f\x09\xab\x85u\x0e\x05\xdd\xd1\
+\x87\x97\x0f\xef]\xbf\x9c\xfa0\xd1\x14\x92\x09\x90\xb5\x9e\
+\x03!\xcaU\x83\xad\x96;\xa6\xbc\xaeXV,\x10\x90\
+\xfa\xd0J<06\x8f<\xb8q\xe5\xb8;\x5c\xae\xbc\
+\xa1\x88\x1f\xbaN\xbb\x91\xfa\xacx-$\xbc`\x96E\
+\x19k\x9e\x00\x01\xb6\x9b,zv\xc2v+y\xfb\xec\
+>\xea *\x8b\x94\xbc\x9cJ\xe6f\x91\xd9\x02\xb2\xdd\
+\xb3\xff\xe5dq\x1a]\x0d\xce\xae\xf1\xf24zp\xe2\
+\xc0\x99\x1e\x96\x05\x7fl\x0d\xab\x1ddk!\xae~\x90\
+M`\xe3\xec\x8b%]\xa9\x94XK\x09\x5c'\x84q\
+\x08\xe3\x10\xc6!\x8cC\x18\x870\x0ea\x1c\xc28\x84\
+q\x08\xe3\x10\xc6!\x8cC\x18\x870\x0ea\x1c\xc28\
+\x84q\x08\xe3\x10\xc6!\x8cC\x18\x870\x0ea\x1c\xc2\
+8\x84q\x08\xe3\x10\xc6!\x8cC\x18\x870\x0ea\x1c\
+\xc28\x84q\x08\xe3\x10\xc6\xe1Y/`U~\x03\x19\
+n\xdb\xce\xec\xfcQ\x7f\x00\x00\x00\x00IEND\xae\
+B`\x82\
+\x00\x00\x01^\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x02\x00\x00\x00\x90\x91h6\
+\x00\x00\x01%IDATx\x9c\xe5\x90\xbdJ\x03A\
+\x14\x85\xcf\xb931\xeb\xcfj\x0a\xf1\xbf\x11K\xc5\xca\
+\x14\xb6v\xb6\x0a\xfa\x10\xbe@\xc0\x07\xb0\x13l-\xf2\
+\x16vV\x22Z[\xc5\xd2\x10\x84 \xe6G\x88\xabq\
+g\xe7\xca$\xd1\xc6-\xd2\xfbus\xcf|\x979C\
+Tj\xf8\x83\x15\x02p^s\x22\xe4\xe1\x12\x07\x05\x22\
+\x83 \xe6\x09B\x90!\x1d.=\xd9\x9b\x9f-\xca\xf9\
+m\xbb\x9f\xaaHpUG\xd1@ |\xaap\x83A\
+\xc1@x\xb6\xbf8mqq\xff\xe6\x13\xe7\xbd\x0f\x86\
+%\x0a\x84\xc2\x1a2\xfb\xcc\x8e\xcb\xa5\xa3\xedX\x15\xf5\
+\xd7\xde\xfbG\xfa\xf0\xd4\x8a\xac\x9c\xee\x16\xad\x9dZ_\
+\x88I\x5c=\xf6\xaaw\x1dS4\xa1^\xe6tg-\
+:\xd8\x8c\x01\x5c^\xd7\xeb\x8dV\xb5!^uFt\
+c\xb5t\xb8\xb5\x02\xa0\x93d\xd5\x9b6#\x90\x95\x9a\
+z]\x9a+,\xc7VU''\xac5\x14\x92@\xa6\
+\x9ayM\xfa\x8e\xe4K\xcf=wS\x0amx\xb8\xb0\
+\xd9M\x9b\xad\xaf\xd0aX\xf0\x97\xe1W\x000\x84a\
+\xe82\x9a[\x8a\x0d\xe7\x5c\x08\xf8\x9f=#A\x15\x19\
+\xc6B\xc6\xbb\x86\xff-|\x03\x10$v\x8e\x19\xbfT\
+\xf9\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0f\
+\x0a\x04/g\
+\x00m\
+\x00b\x00u\x00l\x00i\x00n\x00u\x00x\x00_\x003\x002\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x0b\xb8\xd1G\
+\x00m\
+\x00b\x00u\x00l\x00i\x00n\x00u\x00x\x00.\x00p\x00n\x00g\
+\x00\x10\
+\x02L\xd4\x07\
+\x00m\
+\x00b\x00u\x00l\x00i\x00n\x00u\x00x\x00_\x001\x002\x008\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x0b\xb8\xdc\xc7\
+\x00m\
+\x00b\x00u\x00l\x00i\x00n\x00u\x00x\x00.\x00s\x00v\x00g\
+\x00\x0f\
+\x0a\xf6/g\
+\x00m\
+\x00b\x00u\x00l\x00i\x00n\x00u\x00x\x00_\x006\x004\x00.\x00p\x00n\x00g\
+\x00\x0f\
+\x0a(/g\
+\x00m\
+\x00b\x00u\x00l\x00i\x00n\x00u\x00x\x00_\x001\x006\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x06\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00\x03\x08\
+\x00\x00\x01\x9cC2\xc2p\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9cC2\xc2p\
+\x00\x00\x00\xba\x00\x00\x00\x00\x00\x01\x00\x00\x0d\xbb\
+\x00\x00\x01\x9cC2\xc2p\
+\x00\x00\x00\x96\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xf3\
+\x00\x00\x01\x9cC2\xc2p\
+\x00\x00\x004\x00\x04\x00\x00\x00\x01\x00\x00\x02\x1e\
+\x00\x00\x01\x9cC2\xc2p\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x00\x06\xed\
+\x00\x00\x01\x9cC2\xc2p\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -4,27 +4,79 @@ Main application window.
 
 import sys
 import json
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QStatusBar, QMessageBox, QFrame
 )
-from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtCore import Qt, QTimer, QSocketNotifier, Signal, Slot
 from PySide6.QtGui import QCloseEvent, QIcon
 
-from ..constants import APP_NAME, CONFIG_DIR
-from ..core.disk_manager import DiskManager
-from ..core.image_analyzer import ImageAnalyzer
-from ..core.permissions import PermissionManager
+from ..constants import APP_NAME, CONFIG_DIR, FAT32_MAX_FILE_SIZE
 
 from .components.disk_list_widget import DiskListWidget
 from .components.iso_selector import IsoSelector
 from .components.settings_panel import SettingsPanel
-from .components.progress_panel import ProgressPanel
 from .resources import load_style, get_icon
 
+# Minimum spacing between progress signals sent to the GUI (~30 Hz)
+PROGRESS_EMIT_INTERVAL_MS = 33
+
+
+class _ProgressThrottle:
+    """
+    Forward progress updates at most once per interval, keeping the latest.
+    
+    An update held back is sent by a trailing timer once the interval has
+    passed, so the last message before a long pause (e.g. the final fsync)
+    still reaches the GUI.
+    """
+    
+    def __init__(self, emit, min_interval_ms: int = PROGRESS_EMIT_INTERVAL_MS):
+        self._emit = emit
+        self._interval = min_interval_ms / 1000
+        self._lock = threading.Lock()
+        self._last_emit = 0.0
+        self._pending = None
+        self._timer = None
+    
+    def post(self, percent: int, message: str):
+        """Record an update and forward it if the interval has elapsed."""
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._last_emit
+            if percent < 100 and elapsed < self._interval:
+                self._pending = (percent, message)
+                if self._timer is None:
+                    self._timer = threading.Timer(self._interval - elapsed, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            self._pending = None
+            self._last_emit = now
+        self._emit(percent, message)
+    
+    def flush(self):
+        """Forward the last update held back by the throttle, if any."""
+        with self._lock:
+            pending, self._pending = self._pending, None
+            timer, self._timer = self._timer, None
+            if pending is not None:
+                self._last_emit = time.monotonic()
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
+        if pending is not None:
+            self._emit(*pending)
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
@@ -32,19 +84,28 @@ class MainWindow(QMainWindow):
     write_started = Signal()
     write_finished = Signal(bool, str)
     progress_updated = Signal(int, str)
+    disks_changed = Signal()
     
     def __init__(self, settings: dict):
         super().__init__()
         
         self.settings = settings
         self.iso_path: Optional[str] = None
+        self.iso_info: Optional[dict] = None
         self.selected_device: Optional[str] = None
         self.current_strategy = None
+        self._write_worker = None
+        
+        # Managers are created on first use
+        self._disk_manager = None
+        self._image_analyzer = None
+        self._permission_manager = None
         
-        # Initialize managers
-        self.disk_manager = DiskManager()
-        self.image_analyzer = ImageAnalyzer()
-        self.permission_manager = PermissionManager()
+        # Collapse bursts of refresh requests into a single scan
+        self._refresh_pending = QTimer(self)
+        self._refresh_pending.setSingleShot(True)
+        self._refresh_pending.setInterval(150)
+        self._refresh_pending.timeout.connect(self._do_refresh_disks)
         
         # Setup UI
         self.setup_ui()
@@ -52,11 +113,38 @@ class MainWindow(QMainWindow):
         # Connect signals
         self.connect_signals()
         
-        # Setup auto-refresh
-        self.setup_refresh_timer()
+        # Watch for disk hotplug
+        self.setup_disk_monitor()
         
         # Apply settings
         self.apply_settings()
+        
+        # First disk scan once the event loop is running
+        QTimer.singleShot(0, self._do_refresh_disks)
+    
+    @property
+    def disk_manager(self):
+        """Disk manager, created on first access."""
+        if self._disk_manager is None:
+            from ..core.disk_manager import DiskManager
+            self._disk_manager = DiskManager()
+        return self._disk_manager
+    
+    @property
+    def image_analyzer(self):
+        """ISO analyzer, created on first access."""
+        if self._image_analyzer is None:
+            from ..core.image_analyzer import ImageAnalyzer
+            self._image_analyzer = ImageAnalyzer()
+        return self._image_analyzer
+    
+    @property
+    def permission_manager(self):
+        """Permission manager, created on first access."""
+        if self._permission_manager is None:
+            from ..core.permissions import PermissionManager
+            self._permission_manager = PermissionManager()
+        return self._permission_manager
     
     def setup_ui(self):
         """Setup the main window UI."""
@@ -115,10 +203,10 @@ class MainWindow(QMainWindow):
         
         main_layout.addWidget(splitter)
         
-        # Progress panel (hidden by default)
-        self.progress_panel = ProgressPanel()
-        self.progress_panel.hide()
-        main_layout.addWidget(self.progress_panel)
+        # Progress panel slot; the panel is created on the first write
+        self.progress_panel = None
+        self._main_layout = main_layout
+        self._progress_panel_index = main_layout.count()
         
         # Start button
         from PySide6.QtWidgets import QPushButton
@@ -140,32 +228,84 @@ class MainWindow(QMainWindow):
         # Disk selection
         self.disk_list.disk_selected.connect(self.on_disk_selected)
         self.disk_list.refresh_requested.connect(self.refresh_disks)
+        self.disks_changed.connect(self.refresh_disks)
         
         # Start button
         self.start_button.clicked.connect(self.start_write_process)
         
-        # Progress signals
-        self.progress_updated.connect(self.progress_panel.update_progress)
+        # Write signals; progress_updated is connected once the progress
+        # panel exists (see _ensure_progress_panel)
         self.write_started.connect(self.on_write_started)
-        self.write_finished.connect(self.on_write_finished)
+        self.write_finished.connect(self.on_write_finished, Qt.QueuedConnection)
     
-    def setup_refresh_timer(self):
-        """Setup timer for automatic disk refresh."""
+    def setup_disk_monitor(self):
+        """Refresh the disk list on udev block events, with a slow fallback timer."""
+        self.udev_monitor = None
+        self.udev_notifier = None
+        
+        if pyudev is not None:
+            try:
+                context = pyudev.Context()
+                monitor = pyudev.Monitor.from_netlink(context)
+                monitor.filter_by('block')
+                monitor.start()
+            except (OSError, ValueError):
+                monitor = None
+            
+            if monitor is not None:
+                self.udev_monitor = monitor
+                self.udev_notifier = QSocketNotifier(monitor.fileno(), QSocketNotifier.Read, self)
+                self.udev_notifier.activated.connect(self.on_udev_event)
+        
+        # Fallback in case events are missed or udev is unavailable
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_disks)
-        self.refresh_timer.start(5000)  # Refresh every 5 seconds
+        self.refresh_timer.start(60000 if self.udev_notifier else 5000)
+    
+    @Slot()
+    def on_udev_event(self):
+        """Drain pending udev events and signal a change if any touched disks."""
+        changed = False
+        while True:
+            device = self.udev_monitor.poll(0)
+            if device is None:
+                break
+            if device.action in ('add', 'remove', 'change'):
+                changed = True
+        
+        if changed:
+            # The list shown comes from the disk manager's short-lived cache;
+            # a manager not created yet has nothing cached
+            if self._disk_manager is not None:
+                self._disk_manager.invalidate_cache()
+            from ..utils.system import invalidate_disks_cache
+            invalidate_disks_cache()
+            self.disks_changed.emit()
     
     def apply_settings(self):
         """Apply application settings."""
         # Apply theme
         theme = self.settings.get('theme', 'light')
         style = load_style(theme)
-        self.setStyleSheet(style)
+        
+        # Assigning a stylesheet makes Qt re-parse it and re-polish every
+        # child, so skip assignments that would not change anything
+        app = QApplication.instance()
+        if app is not None and app.styleSheet() == style:
+            # Already applied application-wide; a second copy on the window
+            # would only be parsed and cascaded again
+            style = ""
+        if style != self.styleSheet():
+            self.setStyleSheet(style)
         
         # Apply language
         # TODO: Implement language switching
     
     def refresh_disks(self):
+        """Schedule a disk list refresh; requests within 150 ms share one scan."""
+        self._refresh_pending.start()
+    
+    def _do_refresh_disks(self):
         """Refresh the list of available disks."""
         try:
             disks = self.disk_manager.get_removable_disks()
@@ -185,6 +325,7 @@ class MainWindow(QMainWindow):
         # Analyze ISO
         try:
             iso_info = self.image_analyzer.analyze(iso_path)
+            self.iso_info = iso_info
             self.settings_panel.set_iso_info(iso_info)
             
             # Update status
@@ -199,6 +340,7 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to analyze ISO: {str(e)}")
             self.iso_path = None
+            self.iso_info = None
         
         self.update_start_button()
     
@@ -227,7 +369,7 @@ class MainWindow(QMainWindow):
             
             # Check WIM size
             wim_size = iso_info.get('wim_size', 0)
-            if wim_size > 4 * 1024**3:  # > 4GB
+            if wim_size > FAT32_MAX_FILE_SIZE:
                 # Need NTFS for large WIM
                 self.settings_panel.set_filesystem('ntfs')
             else:
@@ -263,16 +405,31 @@ class MainWindow(QMainWindow):
         settings = self.settings_panel.get_settings()
         
         # Show confirmation dialog
-        reply = QMessageBox.question(
-            self,
+        dialog = QMessageBox(
+            QMessageBox.Question,
             "Confirm USB Creation",
             f"This will erase ALL data on {self.selected_device}\n"
             f"ISO: {Path(self.iso_path).name}\n"
             f"Device: {self.selected_device}\n\n"
             "Are you sure you want to continue?",
             QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
+            self
         )
+        dialog.setDefaultButton(QMessageBox.No)
+        dialog.setWindowModality(Qt.WindowModal)
+        
+        # Keep the disk list still while the user confirms; pending udev
+        # events are picked up once the notifier is re-enabled
+        self.refresh_timer.stop()
+        self._refresh_pending.stop()
+        if self.udev_notifier is not None:
+            self.udev_notifier.setEnabled(False)
+        try:
+            reply = dialog.exec()
+        finally:
+            if self.udev_notifier is not None:
+                self.udev_notifier.setEnabled(True)
+            self.refresh_timer.start()
         
         if reply != QMessageBox.Yes:
             return
@@ -300,51 +457,80 @@ class MainWindow(QMainWindow):
         self.start_button.setEnabled(False)
         
         # Show progress panel
+        self._ensure_progress_panel()
         self.progress_panel.show()
         self.progress_panel.reset()
         
-        # Start actual write in background
-        QTimer.singleShot(100, self.perform_write)
+        # Start actual write on a worker thread so the window stays responsive
+        from ..utils.async_worker import AsyncWorker
+        worker = AsyncWorker(
+            self._do_write,
+            self.iso_path,
+            self.selected_device,
+            self.settings_panel.get_settings(),
+            self.iso_info,
+        )
+        worker.progress.connect(self.progress_panel.update_progress, Qt.QueuedConnection)
+        worker.finished.connect(self.write_finished, Qt.QueuedConnection)
+        worker.error.connect(self.on_write_error, Qt.QueuedConnection)
+        self._write_worker = worker
+        worker.start()
     
-    def perform_write(self):
-        """Perform the actual write operation."""
-        try:
-            # Get strategy based on ISO type
-            iso_info = self.image_analyzer.analyze(self.iso_path)
-            iso_type = iso_info.get('type')
-            
-            if iso_type == 2:  # Windows
-                from ..core.writer_strategies.windows_strategy import WindowsWriteStrategy
-                strategy = WindowsWriteStrategy()
-            else:  # Linux and others
-                from ..core.writer_strategies.linux_strategy import LinuxWriteStrategy
-                strategy = LinuxWriteStrategy()
-            
-            # Set progress callback
-            strategy.set_progress_callback(
-                lambda p, m: self.progress_updated.emit(p, m)
-            )
-            
-            # Get settings
-            settings = self.settings_panel.get_settings()
-            
-            # Perform write
-            success = strategy.write(
-                self.iso_path,
-                self.selected_device,
-                settings
-            )
-            
-            # Emit result
-            message = "Write completed successfully" if success else "Write failed"
-            self.write_finished.emit(success, message)
-            
-        except Exception as e:
-            self.write_finished.emit(False, f"Error: {str(e)}")
+    def _ensure_progress_panel(self):
+        """Create the progress panel and wire its signals on first use."""
+        if self.progress_panel is not None:
+            return
+        
+        from .components.progress_panel import ProgressPanel
+        self.progress_panel = ProgressPanel()
+        self.progress_panel.hide()
+        self._main_layout.insertWidget(self._progress_panel_index, self.progress_panel)
+        
+        # The write reports from a worker thread, so queue explicitly
+        # instead of letting Qt pick the connection type per emit
+        self.progress_updated.connect(self.progress_panel.update_progress, Qt.QueuedConnection)
+    
+    def _do_write(self, iso_path: str, device: str, settings: dict,
+                  iso_info: Optional[dict], progress_callback=None):
+        """Perform the actual write operation; runs on the worker thread."""
+        # Get strategy based on ISO type, reusing the selection-time analysis
+        iso_info = iso_info or self.image_analyzer.analyze(iso_path)
+        iso_type = iso_info.get('type')
+        
+        if iso_type == 2:  # Windows
+            from ..core.writer_strategies.windows_strategy import WindowsWriteStrategy
+            strategy = WindowsWriteStrategy()
+        else:  # Linux and others
+            from ..core.writer_strategies.linux_strategy import LinuxWriteStrategy
+            strategy = LinuxWriteStrategy()
+        
+        # Set progress callback
+        progress_throttle = _ProgressThrottle(progress_callback or self.progress_updated.emit)
+        strategy.set_progress_callback(progress_throttle.post)
+        
+        # Perform write
+        success = strategy.write(iso_path, device, settings)
+        
+        # Deliver the final progress update the throttle may be holding
+        progress_throttle.flush()
+        
+        message = "Write completed successfully" if success else "Write failed"
+        return success, message
+    
+    @Slot(str)
+    def on_write_error(self, error: str):
+        """Handle an exception raised by the write worker."""
+        self.write_finished.emit(False, f"Error: {error}")
     
     @Slot(bool, str)
     def on_write_finished(self, success: bool, message: str):
         """Handle write process completion."""
+        # The worker has returned from run(); let the thread exit before deleting it
+        if self._write_worker is not None:
+            self._write_worker.wait()
+            self._write_worker.deleteLater()
+            self._write_worker = None
+        
         # Re-enable UI
         self.iso_selector.setEnabled(True)
         self.disk_list.setEnabled(True)
@@ -375,12 +561,25 @@ class MainWindow(QMainWindow):
     
     def closeEvent(self, event: QCloseEvent):
         """Handle window close event."""
+        # Closing mid-write would leave the USB half written
+        if self._write_worker is not None and self._write_worker.isRunning():
+            QMessageBox.warning(
+                self,
+                "Write in Progress",
+                "Please wait for the USB creation to finish before closing."
+            )
+            event.ignore()
+            return
+        
         # Save window size
         self.settings['window_width'] = self.width()
         self.settings['window_height'] = self.height()
         
-        # Stop refresh timer
+        # Stop disk monitoring
         self.refresh_timer.stop()
+        self._refresh_pending.stop()
+        if self.udev_notifier is not None:
+            self.udev_notifier.setEnabled(False)
         
         # Accept close event
         event.accept()
\ No newline at end of file
@@ -2,30 +2,24 @@
 Resource management for UI.
 """
 
-from PySide6.QtCore import QFile, QIODevice
-from PySide6.QtGui import QIcon, QPixmap
+import functools
+
+from PySide6.QtCore import QFile, QIODevice, QSize
+from PySide6.QtGui import QIcon, QImageReader, QPixmap
 from pathlib import Path
 
 from ..constants import DATA_DIR
 
-def load_style(theme: str = "light") -> str:
-    """
-    Load QSS style from file.
-    
-    Args:
-        theme: Theme name (light, dark, auto)
-        
-    Returns:
-        QSS style string
-    """
-    style_file = DATA_DIR / "styles" / f"{theme}.qss"
-    
-    if style_file.exists():
-        with open(style_file, 'r') as f:
-            return f.read()
-    
-    # Default style
-    return """
+# Compiled icon bundle; regenerate with
+#   pyside6-rcc mbulinux/ui/icons.qrc -o mbulinux/ui/icons_rc.py
+# after adding icons to data/icons
+try:
+    from . import icons_rc
+except ImportError:
+    icons_rc = None
+
+# Fallback style used when no QSS file exists for a theme
+_DEFAULT_QSS = """
     QMainWindow {
         background-color: #f0f0f0;
     }
@@ -64,33 +58,74 @@ def load_style(theme: str = "light") -> str:
     }
     """
 
+@functools.lru_cache(maxsize=4)
+def load_style(theme: str = "light") -> str:
+    """
+    Load QSS style from file.
+    
+    Results are cached per theme; call reload_styles() after editing
+    the QSS files on disk.
+    
+    Args:
+        theme: Theme name (light, dark, auto)
+        
+    Returns:
+        QSS style string
+    """
+    style_file = DATA_DIR / "styles" / f"{theme}.qss"
+    
+    try:
+        return style_file.read_text(encoding='utf-8')
+    except OSError:
+        return _DEFAULT_QSS
+
+def reload_styles():
+    """Drop cached stylesheets so the next load_style() reads from disk."""
+    load_style.cache_clear()
+
+@functools.lru_cache(maxsize=128)
+def _resolve_icon_path(name: str, extensions: tuple = (".svg", ".png")):
+    """Return the first existing icon file for name, or None."""
+    # Bundled resources are looked up in memory without touching the disk
+    if icons_rc is not None:
+        for ext in extensions:
+            resource_path = f":/icons/{name}{ext}"
+            if QFile.exists(resource_path):
+                return resource_path
+    
+    for ext in extensions:
+        icon_path = DATA_DIR / "icons" / f"{name}{ext}"
+        if icon_path.exists():
+            return str(icon_path)
+    return None
+
+@functools.lru_cache(maxsize=128)
 def get_icon(name: str) -> QIcon:
     """
     Get icon by name.
     
+    Icons are cached per name; QIcon is implicitly shared, so handing out
+    the same instance is safe.
+    
     Args:
         name: Icon name without extension
         
     Returns:
         QIcon object
     """
-    icon_path = DATA_DIR / "icons" / f"{name}.svg"
-    
-    if icon_path.exists():
-        return QIcon(str(icon_path))
-    
-    # Fallback to PNG
-    icon_path = DATA_DIR / "icons" / f"{name}.png"
-    if icon_path.exists():
-        return QIcon(str(icon_path))
+    icon_path = _resolve_icon_path(name)
     
     # Return empty icon if not found
-    return QIcon()
+    return QIcon(icon_path) if icon_path else QIcon()
 
+@functools.lru_cache(maxsize=128)
 def get_pixmap(name: str, size: tuple = (64, 64)) -> QPixmap:
     """
     Get pixmap by name.
     
+    Pixmaps are cached per (name, size); QPixmap is copy-on-write, so
+    callers that modify the result do not affect the cached instance.
+    
     Args:
         name: Image name without extension
         size: Desired size (width, height)
@@ -98,12 +133,16 @@ def get_pixmap(name: str, size: tuple = (64, 64)) -> QPixmap:
     Returns:
         QPixmap object
     """
-    image_path = DATA_DIR / "icons" / f"{name}.png"
+    image_path = _resolve_icon_path(name, (".png",))
     
-    if image_path.exists():
-        pixmap = QPixmap(str(image_path))
-        if not pixmap.isNull():
-            return pixmap.scaled(*size)
+    if image_path:
+        # Decode straight to the requested size; the reader scales smoothly
+        # once here instead of loading at native size and scaling afterwards
+        reader = QImageReader(image_path)
+        reader.setScaledSize(QSize(*size))
+        image = reader.read()
+        if not image.isNull():
+            return QPixmap.fromImage(image)
     
     # Return empty pixmap if not found
-    return QPixmap(*size)
\ No newline at end of file
+    return QPixmap(*size)
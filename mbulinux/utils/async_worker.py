@@ -2,85 +2,165 @@
 Async worker using QThread.
 """
 
-from PySide6.QtCore import QThread, Signal, QObject
+import functools
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThread, QThreadPool, Signal
+
+
+# Milliseconds cancel() waits for the task to notice the request
+CANCEL_WAIT_MS = 5000
+
+
+@functools.lru_cache(maxsize=256)
+def _code_arg_names(code) -> frozenset:
+    """Return the names of the positional and keyword-only arguments of a code object."""
+    nargs = code.co_argcount + code.co_kwonlyargcount
+    return frozenset(code.co_varnames[:nargs])
+
+
+def _accepts_arg(fn, name: str) -> bool:
+    """Check whether fn takes an argument called name without building a Signature."""
+    code = getattr(fn, '__code__', None)
+    return code is not None and name in _code_arg_names(code)
+
+
+def _run_task(task_func, args, kwargs, signals, cancelled: threading.Event):
+    """Run task_func and report the outcome through signals."""
+    try:
+        # Connect progress callback if task supports it
+        if _accepts_arg(task_func, 'progress_callback'):
+            kwargs['progress_callback'] = signals.progress.emit
+        
+        # Let long-running tasks poll for cancellation
+        if _accepts_arg(task_func, 'cancel_check'):
+            kwargs['cancel_check'] = cancelled.is_set
+        
+        # Execute task
+        result = task_func(*args, **kwargs)
+        
+        if isinstance(result, tuple):
+            success, message = result
+        elif isinstance(result, bool):
+            success, message = result, "Operation completed"
+        else:
+            success, message = True, str(result)
+        
+        if not cancelled.is_set():
+            signals.finished.emit(success, message)
+            
+    except Exception as e:
+        if not cancelled.is_set():
+            signals.error.emit(str(e))
 
 
 class AsyncWorker(QThread):
-    """Worker thread for async operations."""
+    """
+    Worker thread for async operations.
+    
+    Prefer WorkerManager (which runs tasks on the shared QThreadPool) for
+    short tasks; a dedicated thread is for long jobs such as USB writes.
+    """
+    
+    progress = Signal(int, str)  # percent, message
+    finished = Signal(bool, str)  # success, message
+    error = Signal(str)  # error message
+    
+    def __init__(self, task_func, *args, **kwargs):
+        super().__init__()
+        self.task_func = task_func
+        self.args = args
+        self.kwargs = kwargs
+        self.is_cancelled = threading.Event()
+    
+    def run(self):
+        """Run the task."""
+        _run_task(self.task_func, self.args, self.kwargs, self, self.is_cancelled)
+    
+    def cancel(self, timeout_ms: int = CANCEL_WAIT_MS) -> bool:
+        """
+        Request cancellation and wait for the task to stop.
+        
+        The task must poll cancel_check() to stop early; the thread is
+        never terminated forcibly.
+        
+        Returns:
+            True if the thread finished within timeout_ms
+        """
+        self.is_cancelled.set()
+        self.requestInterruption()
+        return self.wait(timeout_ms)
+
+
+class WorkerSignals(QObject):
+    """Signals reported by an AsyncRunnable."""
     
     progress = Signal(int, str)  # percent, message
     finished = Signal(bool, str)  # success, message
     error = Signal(str)  # error message
+
+
+class AsyncRunnable(QRunnable):
+    """Task run on a QThreadPool, reporting through a WorkerSignals object."""
     
     def __init__(self, task_func, *args, **kwargs):
         super().__init__()
         self.task_func = task_func
         self.args = args
         self.kwargs = kwargs
-        self.is_cancelled = False
+        self.signals = WorkerSignals()
+        self.is_cancelled = threading.Event()
+        self.done = threading.Event()
     
     def run(self):
         """Run the task."""
         try:
-            # Connect progress callback if task supports it
-            if hasattr(self.task_func, '__code__'):
-                # Check if task function accepts progress_callback parameter
-                import inspect
-                sig = inspect.signature(self.task_func)
-                if 'progress_callback' in sig.parameters:
-                    self.kwargs['progress_callback'] = self.progress.emit
-            
-            # Execute task
-            result = self.task_func(*self.args, **self.kwargs)
-            
-            if isinstance(result, tuple):
-                success, message = result
-            elif isinstance(result, bool):
-                success, message = result, "Operation completed"
-            else:
-                success, message = True, str(result)
-            
-            if not self.is_cancelled:
-                self.finished.emit(success, message)
-                
-        except Exception as e:
-            if not self.is_cancelled:
-                self.error.emit(str(e))
+            _run_task(self.task_func, self.args, self.kwargs, self.signals, self.is_cancelled)
+        finally:
+            self.done.set()
     
-    def cancel(self):
-        """Cancel the operation."""
-        self.is_cancelled = True
-        self.terminate()
-        self.wait()
+    def cancel(self, timeout_ms: int = CANCEL_WAIT_MS) -> bool:
+        """
+        Request cancellation and wait for the task to stop.
+        
+        Returns:
+            True if the task finished within timeout_ms
+        """
+        self.is_cancelled.set()
+        return self.done.wait(timeout_ms / 1000)
 
 
 class WorkerManager(QObject):
-    """Manage worker threads."""
+    """Run tasks on the shared QThreadPool and track them until they finish."""
     
     def __init__(self):
         super().__init__()
         self.workers = []
     
     def start_worker(self, task_func, *args, **kwargs):
-        """Start a new worker thread."""
-        worker = AsyncWorker(task_func, *args, **kwargs)
+        """Start a task on the global thread pool and return its signals."""
+        worker = AsyncRunnable(task_func, *args, **kwargs)
         self.workers.append(worker)
         
         # Clean up when worker finishes
-        worker.finished.connect(lambda: self._cleanup_worker(worker))
-        worker.error.connect(lambda e: self._cleanup_worker(worker))
+        worker.signals.finished.connect(lambda *_: self._cleanup_worker(worker))
+        worker.signals.error.connect(lambda e: self._cleanup_worker(worker))
         
-        worker.start()
-        return worker
+        QThreadPool.globalInstance().start(worker)
+        return worker.signals
     
     def _cleanup_worker(self, worker):
-        """Clean up finished worker."""
+        """Forget a finished worker."""
         if worker in self.workers:
             self.workers.remove(worker)
-            worker.deleteLater()
     
     def stop_all(self):
         """Stop all workers."""
+        # Signal every worker first so they wind down in parallel
+        for worker in self.workers:
+            worker.is_cancelled.set()
+        
         for worker in self.workers[:]:
-            worker.cancel()
-            self._cleanup_worker(worker)
\ No newline at end of file
+            # Pool threads cannot be killed; keep stragglers tracked
+            if worker.cancel():
+                self._cleanup_worker(worker)
@@ -2,6 +2,16 @@
 Human-readable formatting utilities.
 """
 
+import functools
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# From 1 GiB up sizes are shown to 0.01 GB at best, so they are rounded to
+# the nearest MiB first; progress ticks then share cache entries
+_QUANTIZE_FROM = 1 << 30
+_QUANTUM_SHIFT = 20
+
+
 def humanize_size(size_bytes: int) -> str:
     """
     Convert size in bytes to human readable string.
@@ -12,26 +22,35 @@ def humanize_size(size_bytes: int) -> str:
     Returns:
         Human readable string (e.g., "1.5 GB")
     """
+    if size_bytes >= _QUANTIZE_FROM:
+        half = 1 << (_QUANTUM_SHIFT - 1)
+        size_bytes = ((int(size_bytes) + half) >> _QUANTUM_SHIFT) << _QUANTUM_SHIFT
+    return _format_size(size_bytes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_size(size_bytes: int) -> str:
+    """Format an exact byte count for humanize_size."""
     if size_bytes == 0:
         return "0 B"
     
-    units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-    unit_index = 0
+    # Each unit is 10 bits wider than the previous one
+    whole = int(size_bytes)
+    unit_index = (whole.bit_length() - 1) // 10 if whole > 0 else 0
+    unit_index = min(unit_index, len(_SIZE_UNITS) - 1)
+    unit = _SIZE_UNITS[unit_index]
     
-    size = float(size_bytes)
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    size = size_bytes / (1 << (10 * unit_index))
     
     # Format with appropriate precision
     if unit_index == 0:  # Bytes
-        return f"{int(size)} {units[unit_index]}"
+        return f"{int(size)} {unit}"
     elif size < 10:
-        return f"{size:.2f} {units[unit_index]}"
+        return f"{size:.2f} {unit}"
     elif size < 100:
-        return f"{size:.1f} {units[unit_index]}"
+        return f"{size:.1f} {unit}"
     else:
-        return f"{int(size)} {units[unit_index]}"
+        return f"{int(size)} {unit}"
 
 
 def humanize_time(seconds: float) -> str:
@@ -47,21 +66,22 @@ def humanize_time(seconds: float) -> str:
     if seconds < 1:
         return f"{seconds*1000:.0f}ms"
     
-    minutes, seconds = divmod(int(seconds), 60)
-    hours, minutes = divmod(minutes, 60)
-    days, hours = divmod(hours, 24)
-    
+    return _humanize_whole_seconds(int(seconds))
+
+
+_TIME_UNITS = ((86400, 'd'), (3600, 'h'), (60, 'm'), (1, 's'))
+
+
+@functools.lru_cache(maxsize=256)
+def _humanize_whole_seconds(seconds: int) -> str:
+    """Format a whole number of seconds as e.g. "1h 2m 3s", skipping zero units."""
     parts = []
-    if days > 0:
-        parts.append(f"{days}d")
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if seconds > 0 or not parts:
-        parts.append(f"{seconds}s")
+    for unit_seconds, suffix in _TIME_UNITS:
+        value, seconds = divmod(seconds, unit_seconds)
+        if value:
+            parts.append(f"{value}{suffix}")
     
-    return " ".join(parts)
+    return " ".join(parts) if parts else "0s"
 
 
 def humanize_percent(value: float, total: float) -> str:
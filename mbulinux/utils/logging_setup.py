@@ -2,20 +2,91 @@
 Logging setup for MBU-Linux.
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import platform
+import queue
 import sys
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
 
 from ..constants import CACHE_DIR, LOG_FILE
+from .system import psutil, _scan_disks
+
+# Writes records to the real handlers on a background thread
+_queue_listener = None
+
+# Set once the background system-info logging has been started
+_started = False
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """
+    Console handler that batches records when output is redirected.
+    
+    On a terminal each record is encoded once, written straight to the
+    byte buffer and flushed, as the line-buffered text layer would. When
+    output is redirected, records go through the text layer shared with
+    print(), so their order is kept, and only WARNING and above flush.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        try:
+            self._tty = self.stream.isatty()
+        except (AttributeError, ValueError):
+            self._tty = False
+    
+    def emit(self, record):
+        buffer = getattr(self.stream, 'buffer', None)
+        if buffer is None:
+            # Replaced stdout (e.g. under test capture); use the text path
+            super().emit(record)
+            return
+        
+        try:
+            msg = self.format(record) + self.terminator
+            if not self._tty:
+                # INFO and DEBUG stay in the buffers until they fill up
+                self.stream.write(msg)
+                if record.levelno >= logging.WARNING:
+                    self.stream.flush()
+                return
+            
+            # Push out text queued by print() first so the order is kept
+            self.stream.flush()
+            buffer.write(msg.encode('utf-8', 'replace'))
+            buffer.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def _stop_queue_listener():
+    """Flush queued records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(level=logging.INFO):
     """
     Setup application logging.
     
+    Records are queued by the logging thread and written to the log file
+    and console on a listener thread, so logging never blocks on I/O.
+    
     Args:
         level: Logging level
     """
+    global _queue_listener, _started
+    
     # Create log directory
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
     
@@ -31,7 +102,7 @@ def setup_logging(level=logging.INFO):
     file_handler.setLevel(level)
     
     # Setup console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler = _ConsoleHandler(sys.stdout)
     console_handler.setFormatter(formatter)
     console_handler.setLevel(level)
     
@@ -41,16 +112,27 @@ def setup_logging(level=logging.INFO):
     
     # Remove existing handlers
     logger.handlers.clear()
+    _stop_queue_listener()
     
-    # Add handlers
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Route records through a queue to the file and console handlers
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Log startup
     logger.info("=" * 50)
     logger.info("MBU-Linux started")
     logger.info(f"Log file: {LOG_FILE}")
     logger.info("=" * 50)
+    
+    # The mount scan costs a statvfs per partition; keep it off startup
+    if not _started:
+        _started = True
+        threading.Thread(target=log_system_info, name="log-system-info",
+                         daemon=True).start()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -70,32 +152,21 @@ def log_system_info():
     """Log system information."""
     logger = get_logger(__name__)
     
-    try:
-        import platform
-        import psutil
-        
-        # Basic system info
-        logger.info(f"System: {platform.system()} {platform.release()}")
-        logger.info(f"Python: {platform.python_version()}")
-        logger.info(f"Machine: {platform.machine()}")
-        
-        # Disk info
-        disk_info = []
-        for partition in psutil.disk_partitions():
-            if 'loop' not in partition.device:
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_info.append(
-                        f"{partition.device} ({partition.mountpoint}): "
-                        f"{usage.percent}% used"
-                    )
-                except:
-                    pass
-        
-        if disk_info:
-            logger.info("Disks: " + ", ".join(disk_info))
-        
-    except ImportError:
+    # Basic system info
+    logger.info(f"System: {platform.system()} {platform.release()}")
+    logger.info(f"Python: {platform.python_version()}")
+    logger.info(f"Machine: {platform.machine()}")
+    
+    # Disk info, from the mount scan shared with get_system_info
+    disk_info = [
+        f"{disk['device']} ({disk['mountpoint']}): {disk['percent']}% used"
+        for disk in _scan_disks()
+    ]
+    
+    if disk_info:
+        logger.info("Disks: " + ", ".join(disk_info))
+    
+    if psutil is None:
         logger.warning("psutil not available, limited system info")
 
 
@@ -108,11 +179,16 @@ def cleanup_old_logs(days_to_keep: int = 7):
     """
     try:
         log_dir = LOG_FILE.parent
-        cutoff_time = datetime.now().timestamp() - (days_to_keep * 86400)
+        cutoff_time = time.time() - (days_to_keep * 86400)
         
-        for log_file in log_dir.glob("mbulinux*.log"):
-            if log_file.stat().st_mtime < cutoff_time:
-                log_file.unlink()
+        # DirEntry carries the file type from getdents, so only matching
+        # names need a stat
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not (entry.name.startswith("mbulinux") and entry.name.endswith(".log")):
+                    continue
+                if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                    os.unlink(entry.path)
                 
     except Exception as e:
         get_logger(__name__).warning(f"Failed to cleanup old logs: {e}")
\ No newline at end of file
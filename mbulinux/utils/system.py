@@ -2,11 +2,79 @@
 System information and dependency checking.
 """
 
+import functools
+import math
+import os
 import subprocess
 import sys
 import platform
+import threading
+import time
 from typing import List, Dict, Optional
 
+from ..core.mounts import read_mountinfo
+
+try:
+    import orjson
+except ImportError:
+    # Only needed when orjson is missing
+    import json
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def _ttl_cache(ttl: float):
+    """
+    Cache the result of a no-argument function for ttl seconds.
+    
+    The wrapped function gains a cache_clear() method for event-driven
+    invalidation. Exceptions are not cached.
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        entry = []  # [value, monotonic deadline] once populated
+        
+        @functools.wraps(func)
+        def wrapper():
+            with lock:
+                if entry and time.monotonic() < entry[1]:
+                    return entry[0]
+            value = func()
+            with lock:
+                entry[:] = [value, time.monotonic() + ttl]
+            return value
+        
+        def cache_clear():
+            with lock:
+                entry.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+# Tools that may be installed under an alternative name
+_TOOL_ALTERNATIVES = {
+    'mkfs.fat': ('mkfs.fat', 'mkfs.vfat'),
+    'mkfs.ntfs': ('mkfs.ntfs', 'mkntfs'),
+}
+
+
+def _path_executables() -> set:
+    """Return the names of all files in the directories on $PATH."""
+    names = set()
+    for directory in os.environ.get('PATH', os.defpath).split(os.pathsep):
+        try:
+            names.update(os.listdir(directory or '.'))
+        except OSError:
+            continue
+    return names
+
+
 def check_dependencies() -> Dict[str, bool]:
     """
     Check for required system dependencies.
@@ -14,6 +82,12 @@ def check_dependencies() -> Dict[str, bool]:
     Returns:
         Dictionary of tool: available
     """
+    return dict(_check_dependencies())
+
+
+@_ttl_cache(math.inf)  # installed tools do not change while we run
+def _check_dependencies() -> Dict[str, bool]:
+    """Look every tool up in a single pass over $PATH; cached per process."""
     dependencies = {
         'dd': 'Disk duplication',
         'parted': 'Partition editing',
@@ -27,139 +101,256 @@ def check_dependencies() -> Dict[str, bool]:
         'sudo': 'Privilege escalation (optional)',
     }
     
+    available_names = _path_executables()
     results = {}
     
     for tool, description in dependencies.items():
-        try:
-            if tool == 'mkfs.fat':
-                # Check for mkfs.fat or mkfs.vfat
-                result1 = subprocess.run(['which', 'mkfs.fat'], 
-                                       capture_output=True, check=False)
-                result2 = subprocess.run(['which', 'mkfs.vfat'],
-                                       capture_output=True, check=False)
-                available = result1.returncode == 0 or result2.returncode == 0
-            elif tool == 'mkfs.ntfs':
-                # Check for mkfs.ntfs or mkntfs
-                result1 = subprocess.run(['which', 'mkfs.ntfs'],
-                                       capture_output=True, check=False)
-                result2 = subprocess.run(['which', 'mkntfs'],
-                                       capture_output=True, check=False)
-                available = result1.returncode == 0 or result2.returncode == 0
-            else:
-                result = subprocess.run(['which', tool],
-                                      capture_output=True, check=False)
-                available = result.returncode == 0
-            
-            results[tool] = available
-            
-            if not available and 'optional' not in description:
-                print(f"Warning: Required tool '{tool}' not found")
-                
-        except Exception:
-            results[tool] = False
+        names = _TOOL_ALTERNATIVES.get(tool, (tool,))
+        available = any(name in available_names for name in names)
+        results[tool] = available
+        
+        if not available and 'optional' not in description:
+            print(f"Warning: Required tool '{tool}' not found")
     
     return results
 
 
+# Pseudo and image filesystems that say nothing about real disks
+_SKIP_FSTYPES = frozenset({'squashfs', 'tmpfs', 'devtmpfs', 'overlay'})
+
+
+def _iter_physical_mounts():
+    """
+    Yield (device, mountpoint, fstype) for block-device mounts.
+    
+    /proc/self/mountinfo is read once; loop devices and the pseudo
+    filesystems in _SKIP_FSTYPES are left out.
+    """
+    for device, mountpoint, fstype in read_mountinfo():
+        if (not device.startswith('/dev/') or device.startswith('/dev/loop')
+                or fstype in _SKIP_FSTYPES):
+            continue
+        yield device, mountpoint, fstype
+
+
+@_ttl_cache(30.0)
+def _scan_disks() -> tuple:
+    """
+    Walk the mount table once and collect usage for each mounted partition.
+    
+    Shared by get_system_info and log_system_info; one statvfs per mount.
+    """
+    disks = []
+    for device, mountpoint, fstype in _iter_physical_mounts():
+        try:
+            st = os.statvfs(mountpoint)
+        except OSError:
+            # Unmounted or unreadable since the mount table was read
+            continue
+        
+        total = st.f_blocks * st.f_frsize
+        free = st.f_bavail * st.f_frsize
+        used = (st.f_blocks - st.f_bfree) * st.f_frsize
+        # Same as psutil: share of the space usable by non-root
+        usable = used + free
+        disks.append({
+            'device': device,
+            'mountpoint': mountpoint,
+            'fstype': fstype,
+            'total': total,
+            'used': used,
+            'free': free,
+            'percent': round(used / usable * 100, 1) if usable else 0.0
+        })
+    return tuple(disks)
+
+
+# Kernel identification never changes while we run; one uname() call
+_UNAME = os.uname()
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_model() -> str:
+    """Return the CPU model name from /proc/cpuinfo, or the machine type."""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                if key.strip() == 'model name':
+                    return value.strip()
+    except OSError:
+        pass
+    return _UNAME.machine
+
+
 def get_system_info() -> Dict:
     """
     Get system information.
     
+    The result is reused for 30 seconds.
+    
     Returns:
         Dictionary with system info
     """
+    info = dict(_get_system_info())
+    if 'disks' in info:
+        info['disks'] = [dict(disk) for disk in info['disks']]
+    return info
+
+
+@_ttl_cache(30.0)
+def _get_system_info() -> Dict:
+    """Collect the system information returned by get_system_info."""
     info = {}
     
-    try:
-        import platform
-        import psutil
-        
-        # Basic info
-        info['system'] = platform.system()
-        info['release'] = platform.release()
-        info['version'] = platform.version()
-        info['machine'] = platform.machine()
-        info['processor'] = platform.processor()
-        
-        # Python info
-        info['python_version'] = platform.python_version()
-        info['python_implementation'] = platform.python_implementation()
-        
-        # CPU info
-        info['cpu_count'] = psutil.cpu_count()
-        info['cpu_freq'] = psutil.cpu_freq().current if psutil.cpu_freq() else None
-        
-        # Memory info
-        mem = psutil.virtual_memory()
-        info['memory_total'] = mem.total
-        info['memory_available'] = mem.available
-        
-        # Disk info
-        disks = []
-        for partition in psutil.disk_partitions():
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                disks.append({
-                    'device': partition.device,
-                    'mountpoint': partition.mountpoint,
-                    'fstype': partition.fstype,
-                    'total': usage.total,
-                    'used': usage.used,
-                    'free': usage.free,
-                    'percent': usage.percent
-                })
-            except:
-                pass
-        info['disks'] = disks
-        
-    except ImportError as e:
-        info['error'] = f"Failed to get system info: {e}"
+    # Basic info
+    info['system'] = _UNAME.sysname
+    info['release'] = _UNAME.release
+    info['version'] = _UNAME.version
+    info['machine'] = _UNAME.machine
+    info['processor'] = _cpu_model()
+    
+    # Python info
+    info['python_version'] = platform.python_version()
+    info['python_implementation'] = platform.python_implementation()
+    
+    # Disk info
+    info['disks'] = list(_scan_disks())
+    
+    if psutil is None:
+        info['error'] = "Failed to get system info: psutil is not installed"
+        return info
+    
+    # CPU info
+    info['cpu_count'] = psutil.cpu_count()
+    freq = psutil.cpu_freq()
+    info['cpu_freq'] = freq.current if freq else None
+    
+    # Memory info
+    mem = psutil.virtual_memory()
+    info['memory_total'] = mem.total
+    info['memory_available'] = mem.available
     
     return info
 
 
+@functools.cache  # firmware mode is fixed for the boot
 def is_uefi_boot() -> bool:
     """
     Check if system is booted in UEFI mode.
     
+    The kernel exposes /sys/firmware/efi only when booted through UEFI,
+    which is all that bootctl would report as well.
+    
     Returns:
         True if UEFI boot
     """
-    try:
-        # Check for efivars directory
-        import os
-        if os.path.exists('/sys/firmware/efi'):
-            return True
-        
-        # Check boot entry
-        result = subprocess.run(['bootctl', 'status'],
-                              capture_output=True, text=True, check=False)
-        if result.returncode == 0 and 'Boot loader spec not found' not in result.stdout:
-            return 'EFI' in result.stdout
-        
-        return False
-        
-    except Exception:
-        return False
+    return os.path.isdir('/sys/firmware/efi')
 
 
 def get_available_disks() -> List[Dict]:
     """
-    Get available disks using lsblk.
+    Get available whole disks from sysfs (or lsblk as a fallback).
+    
+    Results are reused for 2 seconds; call invalidate_disks_cache() when
+    a hotplug event is seen.
     
     Returns:
         List of disk information
     """
+    return [dict(disk) for disk in _get_available_disks()]
+
+
+def invalidate_disks_cache():
+    """Forget the cached disk list so the next lookup rescans."""
+    _get_available_disks.cache_clear()
+
+
+# Set MBULINUX_USE_LSBLK=1 to enumerate disks with lsblk instead of sysfs
+_USE_LSBLK = os.environ.get('MBULINUX_USE_LSBLK') == '1'
+
+SYS_BLOCK = '/sys/block'
+
+
+@_ttl_cache(2.0)
+def _get_available_disks() -> tuple:
+    """Enumerate whole disks; returns an immutable tuple."""
+    if _USE_LSBLK or not os.path.isdir(SYS_BLOCK):
+        return _get_available_disks_lsblk()
+    
+    try:
+        return _get_available_disks_sysfs()
+    except OSError as e:
+        print(f"Error getting disks: {e}")
+        return ()
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    """Return the stripped contents of a sysfs attribute, or None if unreadable."""
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _mount_sources() -> Dict[str, str]:
+    """Map mounted device paths to their first mountpoint from /proc/self/mountinfo."""
+    mounts = {}
+    for source, mountpoint, _ in read_mountinfo():
+        mounts.setdefault(source, mountpoint)
+    return mounts
+
+
+def _lsblk_size(size_bytes: int) -> str:
+    """Format a size the way lsblk does by default, e.g. "14.9G" or "512M"."""
+    units = 'BKMGTPE'
+    exp = 0
+    while size_bytes >= 1024 ** (exp + 1) and exp < len(units) - 1:
+        exp += 1
+    value = round(size_bytes / 1024 ** exp, 1)
+    if value.is_integer():
+        return f"{int(value)}{units[exp]}"
+    return f"{value}{units[exp]}"
+
+
+def _get_available_disks_sysfs() -> tuple:
+    """Read whole-disk information straight from /sys/block."""
+    mounts = _mount_sources()
+    disks = []
+    
+    for name in sorted(os.listdir(SYS_BLOCK)):
+        base = f"{SYS_BLOCK}/{name}"
+        # Virtual devices such as loop and ram have no backing device
+        if not os.path.exists(f"{base}/device"):
+            continue
+        
+        sectors = _read_sysfs(f"{base}/size")
+        size = int(sectors) * 512 if sectors else 0
+        
+        disks.append({
+            'name': name,
+            'size': _lsblk_size(size),
+            'model': _read_sysfs(f"{base}/device/model"),
+            'vendor': _read_sysfs(f"{base}/device/vendor"),
+            'read_only': _read_sysfs(f"{base}/ro") == '1',
+            'mountpoint': mounts.get(f"/dev/{name}"),
+        })
+    
+    return tuple(disks)
+
+
+def _get_available_disks_lsblk() -> tuple:
+    """Enumerate whole disks with lsblk."""
     try:
         result = subprocess.run(
             ['lsblk', '-J', '-o', 'NAME,SIZE,TYPE,MODEL,VENDOR,RO,MOUNTPOINT,PKNAME'],
             capture_output=True,
-            text=True,
             check=True
         )
         
-        import json
-        data = json.loads(result.stdout)
+        # Parse the raw bytes; no need to decode to str first
+        data = orjson.loads(result.stdout) if orjson else json.loads(result.stdout)
         
         disks = []
         for device in data.get('blockdevices', []):
@@ -173,8 +364,8 @@ def get_available_disks() -> List[Dict]:
                     'mountpoint': device.get('mountpoint'),
                 })
         
-        return disks
+        return tuple(disks)
         
     except Exception as e:
         print(f"Error getting disks: {e}")
-        return []
\ No newline at end of file
+        return ()
\ No newline at end of file
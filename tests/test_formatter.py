@@ -0,0 +1,39 @@
+"""
+Tests for disk formatting.
+"""
+
+import subprocess
+
+import pytest
+from unittest.mock import Mock, patch
+from mbulinux.core.formatter import DiskFormatter
+
+
+def test_check_filesystem_unescapes_values():
+    """Test parsing of blkid export output with shell-escaped values."""
+    output = (
+        "DEVNAME=/dev/sdb1\n"
+        "LABEL=My\\ Disk\n"
+        "UUID=1234-ABCD\n"
+        "PARTLABEL=it\\'s\\ \\\"here\\\"\\\\\n"
+        "TYPE=vfat\n"
+    )
+
+    with patch('subprocess.run', return_value=Mock(stdout=output)):
+        info = DiskFormatter().check_filesystem('/dev/sdb1')
+
+    assert info == {
+        'devname': '/dev/sdb1',
+        'label': 'My Disk',
+        'uuid': '1234-ABCD',
+        'partlabel': 'it\'s "here"\\',
+        'type': 'vfat',
+    }
+
+
+def test_check_filesystem_no_filesystem():
+    """Test that a device blkid knows nothing about gives None."""
+    error = subprocess.CalledProcessError(2, ['blkid'])
+
+    with patch('subprocess.run', side_effect=error):
+        assert DiskFormatter().check_filesystem('/dev/sdb1') is None
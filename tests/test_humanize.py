@@ -0,0 +1,63 @@
+"""
+Tests for human-readable formatting.
+"""
+
+import pytest
+from mbulinux.utils.humanize import format_speed, humanize_size, humanize_time
+
+MIB = 1 << 20
+GIB = 1 << 30
+
+
+@pytest.mark.parametrize('size, expected', [
+    (0, "0 B"),
+    (1023, "1023 B"),
+    (1536, "1.50 KB"),
+    (15 * 1024, "15.0 KB"),
+    (512 * MIB, "512 MB"),
+    (GIB, "1.00 GB"),
+    (16 * GIB, "16.0 GB"),
+    (1 << 50, "1.00 PB"),
+    (1 << 60, "1024 PB"),
+])
+def test_humanize_size(size, expected):
+    """Test unit selection and precision."""
+    assert humanize_size(size) == expected
+
+
+def test_humanize_size_quantizes_large_sizes():
+    """Test that sizes from 1 GiB are rounded to the nearest MiB."""
+    base = 5 * GIB + 300 * MIB
+    assert humanize_size(base + MIB // 2 - 1) == humanize_size(base)
+    assert humanize_size(base + MIB // 2) == humanize_size(base + MIB)
+    assert humanize_size(base - MIB // 2) == humanize_size(base)
+
+
+def test_humanize_size_exact_below_gib():
+    """Test that sizes under 1 GiB are formatted without rounding."""
+    assert humanize_size(10 * MIB + MIB // 2) == "10.5 MB"
+    assert humanize_size(GIB - 1) == "1023 MB"
+
+
+def test_humanize_size_float():
+    """Test that fractional byte counts, e.g. speeds, are accepted."""
+    assert humanize_size(1536.0) == "1.50 KB"
+    assert humanize_size(2.5 * GIB) == "2.50 GB"
+
+
+def test_format_speed():
+    """Test speed formatting and the negative marker."""
+    assert format_speed(5 * MIB) == "5.00 MB/s"
+    assert format_speed(-1) == "N/A"
+
+
+@pytest.mark.parametrize('seconds, expected', [
+    (0.25, "250ms"),
+    (1, "1s"),
+    (150, "2m 30s"),
+    (3600, "1h"),
+    (90061.9, "1d 1h 1m 1s"),
+])
+def test_humanize_time(seconds, expected):
+    """Test duration formatting, skipping zero units."""
+    assert humanize_time(seconds) == expected
@@ -0,0 +1,166 @@
+"""
+Tests for ISO image analysis.
+"""
+
+import struct
+
+import pytest
+from mbulinux.core.image_analyzer import ImageAnalyzer, ISO_SECTOR_SIZE
+
+PVD_SECTOR = 16
+CATALOG_SECTOR = 19
+ROOT_SECTOR = 20
+SOURCES_SECTOR = 21
+
+
+def _dir_record(name: bytes, extent: int, length: int, flags: int) -> bytes:
+    """Build an ISO9660 directory record."""
+    record_length = 33 + len(name) + (1 - len(name) % 2)  # Padded to even
+    record = bytearray(record_length)
+    record[0] = record_length
+    record[2:10] = struct.pack('<I', extent) + struct.pack('>I', extent)
+    record[10:18] = struct.pack('<I', length) + struct.pack('>I', length)
+    record[25] = flags
+    record[32] = len(name)
+    record[33:33 + len(name)] = name
+    return bytes(record)
+
+
+def _catalog(validation_platform: int, sections=()) -> bytes:
+    """Build an El Torito catalog; sections are (platform, entry count) pairs."""
+    entry = bytearray(32)
+    entry[0] = 0x88  # Bootable
+
+    validation = bytearray(32)
+    validation[0] = 0x01
+    validation[1] = validation_platform
+    validation[30:32] = b'\x55\xaa'
+
+    catalog = bytearray(validation + entry)
+    for i, (platform, count) in enumerate(sections):
+        header = bytearray(32)
+        header[0] = 0x91 if i == len(sections) - 1 else 0x90
+        header[1] = platform
+        header[2:4] = struct.pack('<H', count)
+        catalog += header
+        for _ in range(count):
+            catalog += entry
+            extension = bytearray(32)
+            extension[0] = 0x44
+            catalog += extension
+    return bytes(catalog)
+
+
+def _build_iso(path, catalog: bytes = None, wim_extents=(1000,)):
+    """
+    Write a minimal ISO9660 image with /SOURCES/INSTALL.WIM.
+
+    wim_extents lists the sizes of the file's extents; every one but the
+    last is flagged as multi-extent. Without a catalog no El Torito boot
+    record is written.
+    """
+    image = bytearray(ISO_SECTOR_SIZE * (SOURCES_SECTOR + 1))
+
+    def sector(n):
+        return slice(n * ISO_SECTOR_SIZE, (n + 1) * ISO_SECTOR_SIZE)
+
+    pvd = bytearray(ISO_SECTOR_SIZE)
+    pvd[0:7] = b'\x01CD001\x01'
+    pvd[156:190] = _dir_record(b'\x00', ROOT_SECTOR, ISO_SECTOR_SIZE, 0x02)
+    image[sector(PVD_SECTOR)] = pvd
+
+    if catalog is not None:
+        boot = bytearray(ISO_SECTOR_SIZE)
+        boot[0:7] = b'\x00CD001\x01'
+        boot[7:39] = b'EL TORITO SPECIFICATION'.ljust(32, b'\x00')
+        boot[0x47:0x4B] = struct.pack('<I', CATALOG_SECTOR)
+        image[sector(PVD_SECTOR + 1)] = boot
+        image[CATALOG_SECTOR * ISO_SECTOR_SIZE:
+              CATALOG_SECTOR * ISO_SECTOR_SIZE + len(catalog)] = catalog
+
+    root = (_dir_record(b'\x00', ROOT_SECTOR, ISO_SECTOR_SIZE, 0x02)
+            + _dir_record(b'\x01', ROOT_SECTOR, ISO_SECTOR_SIZE, 0x02)
+            + _dir_record(b'BOOT', 0, ISO_SECTOR_SIZE, 0x02)
+            + _dir_record(b'SOURCES', SOURCES_SECTOR, ISO_SECTOR_SIZE, 0x02))
+    image[ROOT_SECTOR * ISO_SECTOR_SIZE:ROOT_SECTOR * ISO_SECTOR_SIZE + len(root)] = root
+
+    sources = (_dir_record(b'\x00', SOURCES_SECTOR, ISO_SECTOR_SIZE, 0x02)
+               + _dir_record(b'\x01', ROOT_SECTOR, ISO_SECTOR_SIZE, 0x02)
+               + _dir_record(b'BOOT.WIM;1', 0, 123, 0))
+    for i, size in enumerate(wim_extents):
+        flags = 0x80 if i < len(wim_extents) - 1 else 0
+        sources += _dir_record(b'INSTALL.WIM;1', 0, size, flags)
+    sources += _dir_record(b'SETUP.EXE;1', 0, 77, 0)
+    image[SOURCES_SECTOR * ISO_SECTOR_SIZE:
+          SOURCES_SECTOR * ISO_SECTOR_SIZE + len(sources)] = sources
+
+    path.write_bytes(bytes(image))
+    return path
+
+
+def _probe(path, method, *args):
+    """Call an analyzer probe on path with its header."""
+    analyzer = ImageAnalyzer()
+    header = analyzer._read_header(str(path))
+    return getattr(analyzer, method)(str(path), header, *args)
+
+
+@pytest.mark.parametrize('catalog, expected', [
+    (_catalog(0xEF), True),
+    (_catalog(0x00), False),
+    (_catalog(0x00, [(0x00, 1), (0xEF, 1)]), True),
+    (_catalog(0x00, [(0x00, 2)]), False),
+    (b'\x00' * 64, None),
+], ids=['validation-efi', 'bios-only', 'efi-section', 'bios-sections', 'invalid'])
+def test_eltorito_has_efi(tmp_path, catalog, expected):
+    """Test EFI detection from the validation entry and section headers."""
+    iso = _build_iso(tmp_path / "win.iso", catalog)
+
+    assert _probe(iso, '_eltorito_has_efi') is expected
+
+
+def test_eltorito_without_boot_record(tmp_path):
+    """Test that an ISO without an El Torito boot record gives None."""
+    iso = _build_iso(tmp_path / "plain.iso")
+
+    assert _probe(iso, '_eltorito_has_efi') is None
+
+
+def test_find_iso9660_file_size(tmp_path):
+    """Test walking the directory tree to a file."""
+    iso = _build_iso(tmp_path / "win.iso")
+
+    assert _probe(iso, '_find_iso9660_file_size', ['SOURCES', 'INSTALL.WIM']) == 1000
+    assert _probe(iso, '_find_iso9660_file_size', ['SOURCES', 'BOOT.WIM']) == 123
+
+
+def test_find_iso9660_multi_extent_file(tmp_path):
+    """Test that the extents of a file over 4 GiB are summed."""
+    extents = (0xFFFFF800, 0xFFFFF800, 1000)
+    iso = _build_iso(tmp_path / "win.iso", wim_extents=extents)
+
+    assert _probe(iso, '_find_iso9660_file_size', ['SOURCES', 'INSTALL.WIM']) == sum(extents)
+
+
+def test_find_iso9660_missing_file(tmp_path):
+    """Test that missing files and files used as directories give None."""
+    iso = _build_iso(tmp_path / "win.iso")
+
+    assert _probe(iso, '_find_iso9660_file_size', ['SOURCES', 'INSTALL.ESD']) is None
+    assert _probe(iso, '_find_iso9660_file_size', ['EFI', 'BOOT']) is None
+    assert _probe(iso, '_find_iso9660_file_size', ['SOURCES', 'SETUP.EXE', 'X']) is None
+
+
+def test_find_iso9660_not_iso(tmp_path):
+    """Test that a file without a primary volume descriptor gives None."""
+    path = tmp_path / "blank.img"
+    path.write_bytes(b'\x00' * ISO_SECTOR_SIZE * 20)
+
+    assert _probe(path, '_find_iso9660_file_size', ['SOURCES', 'INSTALL.WIM']) is None
+
+
+def test_get_wim_size_from_iso9660(tmp_path):
+    """Test that the WIM size comes from the directory tree without 7z."""
+    iso = _build_iso(tmp_path / "win.iso", wim_extents=(4096,))
+
+    assert _probe(iso, '_get_wim_size') == 4096
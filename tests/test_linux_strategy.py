@@ -0,0 +1,183 @@
+"""
+Tests for the Linux write strategy.
+"""
+
+import errno
+import os
+
+import pytest
+from unittest.mock import Mock, patch
+from mbulinux.core.writer_strategies.linux_strategy import LinuxWriteStrategy
+
+# Not a multiple of the O_DIRECT alignment, so the short final chunk is
+# written through the buffered fallback
+IMAGE_SIZE = 3 * 1024 * 1024 + 1234
+
+
+@pytest.fixture
+def image(tmp_path):
+    """An ISO-sized file of non-repeating data."""
+    path = tmp_path / "image.iso"
+    path.write_bytes(os.urandom(IMAGE_SIZE))
+    return path
+
+
+@pytest.fixture
+def target(tmp_path):
+    """An empty regular file standing in for the block device."""
+    path = tmp_path / "device"
+    path.write_bytes(b'')
+    return path
+
+
+def test_write_direct_copies_image(image, target):
+    """Test that the O_DIRECT writer copies every byte and reports 100%."""
+    strategy = LinuxWriteStrategy()
+    progress = Mock()
+    strategy.set_progress_callback(progress)
+
+    assert strategy._write_direct(str(image), str(target), IMAGE_SIZE) is True
+
+    assert target.read_bytes() == image.read_bytes()
+    assert progress.call_args[0][0] == 100
+
+
+def test_write_sendfile_copies_image(image, target):
+    """Test that the sendfile writer copies every byte."""
+    strategy = LinuxWriteStrategy()
+
+    assert strategy._write_sendfile(str(image), str(target), IMAGE_SIZE) is True
+
+    assert target.read_bytes() == image.read_bytes()
+
+
+def test_write_falls_back_to_sendfile(image, target):
+    """Test that write() uses sendfile when O_DIRECT is not supported."""
+    strategy = LinuxWriteStrategy()
+
+    with patch.object(strategy, '_write_direct', side_effect=OSError(errno.EINVAL, 'EINVAL')), \
+            patch.object(strategy, '_write_dd') as mock_dd:
+        assert strategy.write(str(image), str(target), {'format': False}) is True
+
+    mock_dd.assert_not_called()
+    assert target.read_bytes() == image.read_bytes()
+
+
+def test_write_falls_back_to_dd(image, target):
+    """Test that write() runs dd when neither in-process writer works."""
+    strategy = LinuxWriteStrategy()
+    unsupported = OSError(errno.EOPNOTSUPP, 'EOPNOTSUPP')
+
+    with patch.object(strategy, '_write_direct', side_effect=unsupported), \
+            patch.object(strategy, '_write_sendfile', side_effect=unsupported), \
+            patch.object(strategy, '_write_dd', return_value=True) as mock_dd:
+        assert strategy.write(str(image), str(target), {'format': False}) is True
+
+    mock_dd.assert_called_once_with(str(image), str(target), IMAGE_SIZE)
+
+
+def test_write_direct_error_falls_back(image, target):
+    """Test that an unsupported pwrite inside the O_DIRECT loop falls back to sendfile."""
+    strategy = LinuxWriteStrategy()
+    progress = Mock()
+    strategy.set_progress_callback(progress)
+
+    with patch('os.pwrite', side_effect=OSError(errno.EINVAL, 'EINVAL')), \
+            patch.object(strategy, '_write_dd') as mock_dd:
+        assert strategy.write(str(image), str(target), {'format': False}) is True
+
+    mock_dd.assert_not_called()
+    assert target.read_bytes() == image.read_bytes()
+    assert not any('Unexpected error' in call[0][1] for call in progress.call_args_list)
+
+
+def test_write_stops_on_io_error(image, target):
+    """Test that a real I/O error fails the write instead of falling back."""
+    strategy = LinuxWriteStrategy()
+
+    with patch.object(strategy, '_write_direct', side_effect=OSError(errno.EIO, 'EIO')), \
+            patch.object(strategy, '_write_sendfile') as mock_sendfile, \
+            patch.object(strategy, '_write_dd') as mock_dd:
+        assert strategy.write(str(image), str(target), {'format': False}) is False
+
+    mock_sendfile.assert_not_called()
+    mock_dd.assert_not_called()
+
+
+def test_write_dd_parses_progress(image, target):
+    """Test dd progress parsing across chunk boundaries and \\r separators."""
+    strategy = LinuxWriteStrategy()
+    progress = Mock()
+    strategy.set_progress_callback(progress)
+
+    half = IMAGE_SIZE // 2
+    output = [
+        f"{half} bytes (1.6 MB, 1.5 MiB) copied, 1 s, 1.6 MB/s\r".encode()[:20],
+        f"{half} bytes (1.6 MB, 1.5 MiB) copied, 1 s, 1.6 MB/s\r".encode()[20:],
+        b'',
+    ]
+    process = Mock(returncode=0)
+    process.stdout.read.side_effect = output
+
+    with patch('subprocess.Popen', return_value=process):
+        assert strategy._write_dd(str(image), str(target), IMAGE_SIZE) is True
+
+    progress.assert_any_call(50, "Writing: 50% (1.6 MB/s)")
+    assert progress.call_args[0][0] == 100
+
+
+def test_write_dd_failure(image, target):
+    """Test that a failing dd is reported."""
+    strategy = LinuxWriteStrategy()
+    process = Mock(returncode=1)
+    process.stdout.read.return_value = b''
+
+    with patch('subprocess.Popen', return_value=process):
+        assert strategy._write_dd(str(image), str(target), IMAGE_SIZE) is False
+
+
+def test_validate_detects_mismatch(image, target):
+    """Test sampled validation against matching and corrupted copies."""
+    strategy = LinuxWriteStrategy()
+    data = bytearray(image.read_bytes())
+    target.write_bytes(data)
+
+    assert strategy.validate(str(image), str(target)) is True
+
+    # The last stripe is always sampled
+    data[-1] ^= 0xff
+    target.write_bytes(data)
+
+    assert strategy.validate(str(image), str(target)) is False
+
+
+def test_validate_full_detects_mismatch(image, target):
+    """Test the full compare against matching and corrupted copies."""
+    strategy = LinuxWriteStrategy()
+    data = bytearray(image.read_bytes())
+    target.write_bytes(data)
+
+    assert strategy.validate(str(image), str(target), full=True) is True
+
+    # Flip a byte in the middle of the image
+    data[len(data) // 2] ^= 0xff
+    target.write_bytes(data)
+
+    assert strategy.validate(str(image), str(target), full=True) is False
+
+
+def test_validate_rejects_short_device(image, target):
+    """Test that a device smaller than the image fails validation."""
+    strategy = LinuxWriteStrategy()
+    target.write_bytes(image.read_bytes()[:-1])
+
+    assert strategy.validate(str(image), str(target)) is False
+
+
+def test_format_device_missing_tool():
+    """Test that a missing sfdisk is reported instead of raised."""
+    strategy = LinuxWriteStrategy()
+    missing = FileNotFoundError(errno.ENOENT, 'No such file or directory', 'sfdisk')
+
+    with patch('subprocess.run', side_effect=missing):
+        assert strategy._format_device('/dev/sdz', {}) is False
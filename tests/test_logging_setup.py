@@ -0,0 +1,49 @@
+"""
+Tests for logging setup.
+"""
+
+import logging
+import os
+import pty
+
+import pytest
+from mbulinux.utils.logging_setup import _ConsoleHandler
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    """Build a bare log record with the given level and message."""
+    return logging.LogRecord('test', level, __file__, 0, message, None, None)
+
+
+def test_console_handler_buffers_info_when_redirected(tmp_path):
+    """Test that INFO records stay buffered until a warning when redirected."""
+    path = tmp_path / 'out.log'
+    with open(path, 'w') as stream:
+        handler = _ConsoleHandler(stream)
+
+        for i in range(5):
+            handler.emit(_record(logging.INFO, f"info {i}"))
+            assert os.path.getsize(path) == 0
+
+        print("printed", file=stream)
+        handler.emit(_record(logging.WARNING, "warning"))
+
+        assert path.read_text().splitlines() == [
+            "info 0", "info 1", "info 2", "info 3", "info 4", "printed", "warning",
+        ]
+
+
+def test_console_handler_flushes_each_record_on_tty():
+    """Test that every record reaches a terminal immediately, after earlier print() output."""
+    master, slave = pty.openpty()
+    try:
+        with open(slave, 'w', closefd=True) as stream:
+            handler = _ConsoleHandler(stream)
+
+            print("printed", file=stream)
+            handler.emit(_record(logging.INFO, "info"))
+
+            output = os.read(master, 1024).replace(b'\r\n', b'\n')
+            assert output == b"printed\ninfo\n"
+    finally:
+        os.close(master)
@@ -0,0 +1,56 @@
+"""
+Tests for mount table parsing.
+"""
+
+import pytest
+from unittest.mock import patch
+from mbulinux.core import mounts
+from mbulinux.core.mounts import parse_mountinfo, read_mountinfo, unescape_mount_field
+
+
+def test_parse_mountinfo():
+    """Test parsing entries with and without optional fields."""
+    lines = [
+        "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n",
+        "30 22 0:25 / /tmp rw,nosuid - tmpfs tmpfs rw,size=100k\n",
+        "41 22 8:17 / /media/usb rw shared:5 master:2 - vfat /dev/sdb1 rw,fmask=0022\n",
+    ]
+
+    assert parse_mountinfo(lines) == [
+        ('/dev/sda1', '/', 'ext4'),
+        ('tmpfs', '/tmp', 'tmpfs'),
+        ('/dev/sdb1', '/media/usb', 'vfat'),
+    ]
+
+
+def test_parse_mountinfo_unescapes_fields():
+    """Test that space, tab, newline and backslash escapes are decoded."""
+    line = "41 22 8:17 / /media/My\\040Disk\\011\\012\\134x rw - vfat /dev/sdb1 rw\n"
+
+    assert parse_mountinfo([line]) == [('/dev/sdb1', '/media/My Disk\t\n\\x', 'vfat')]
+
+
+def test_parse_mountinfo_skips_malformed_lines():
+    """Test that lines without the separator or enough fields are ignored."""
+    assert parse_mountinfo(["garbage\n", "1 2 3 4\n", "1 2 3 / /x - ext4\n", "\n"]) == []
+
+
+def test_unescape_mount_field():
+    """Test octal escape decoding."""
+    assert unescape_mount_field('/plain') == '/plain'
+    assert unescape_mount_field('/a\\040b') == '/a b'
+
+
+def test_read_mountinfo_unreadable(tmp_path):
+    """Test that an unreadable mount table gives an empty list."""
+    with patch.object(mounts, 'MOUNTINFO', str(tmp_path / 'missing')):
+        assert read_mountinfo() == []
+
+
+def test_read_mountinfo_reads_file(tmp_path):
+    """Test reading a mount table from disk."""
+    path = tmp_path / 'mountinfo'
+    path.write_text("22 1 8:1 / / rw - ext4 /dev/sda1 rw\n")
+
+    with patch.object(mounts, 'MOUNTINFO', str(path)):
+        assert read_mountinfo() == [('/dev/sda1', '/', 'ext4')]
@@ -0,0 +1,48 @@
+"""
+Tests for the progress throttle between write strategies and the GUI.
+"""
+
+import time
+
+import pytest
+from mbulinux.ui.main_window import _ProgressThrottle
+
+
+def test_throttle_drops_intermediate_updates():
+    """Test that updates inside the interval are coalesced to the latest."""
+    emitted = []
+    throttle = _ProgressThrottle(lambda *update: emitted.append(update), min_interval_ms=1000)
+
+    for percent in range(10, 15):
+        throttle.post(percent, f"Writing: {percent}%")
+    throttle.flush()
+
+    assert emitted == [(10, "Writing: 10%"), (14, "Writing: 14%")]
+
+
+def test_throttle_sends_held_update_after_interval():
+    """Test that a held update is sent without another post or flush."""
+    emitted = []
+    throttle = _ProgressThrottle(lambda *update: emitted.append(update), min_interval_ms=20)
+
+    throttle.post(98, "Writing: 98%")
+    throttle.post(99, "Flushing data to device...")
+
+    deadline = time.monotonic() + 2
+    while len(emitted) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert emitted == [(98, "Writing: 98%"), (99, "Flushing data to device...")]
+
+
+def test_throttle_always_sends_completion():
+    """Test that 100% is forwarded immediately and replaces a held update."""
+    emitted = []
+    throttle = _ProgressThrottle(lambda *update: emitted.append(update), min_interval_ms=50)
+
+    throttle.post(50, "Writing: 50%")
+    throttle.post(99, "Flushing data to device...")
+    throttle.post(100, "Write completed successfully")
+    time.sleep(0.1)
+
+    assert emitted == [(50, "Writing: 50%"), (100, "Write completed successfully")]
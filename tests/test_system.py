@@ -0,0 +1,130 @@
+"""
+Tests for system information helpers.
+"""
+
+import math
+import os
+
+import pytest
+from unittest.mock import Mock, patch
+from mbulinux.utils import system
+from mbulinux.utils.system import _ttl_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep cached scans from leaking between tests."""
+    system._scan_disks.cache_clear()
+    system._get_system_info.cache_clear()
+    yield
+    system._scan_disks.cache_clear()
+    system._get_system_info.cache_clear()
+
+
+def test_ttl_cache_reuses_value():
+    """Test that a cached value is returned until cleared."""
+    func = Mock(side_effect=[1, 2])
+    func.__name__ = 'func'
+    cached = _ttl_cache(math.inf)(func)
+
+    assert cached() == 1
+    assert cached() == 1
+    cached.cache_clear()
+    assert cached() == 2
+    assert func.call_count == 2
+
+
+def test_ttl_cache_expires():
+    """Test that the value is recomputed once the ttl has passed."""
+    func = Mock(side_effect=[1, 2])
+    func.__name__ = 'func'
+    cached = _ttl_cache(10.0)(func)
+
+    with patch.object(system.time, 'monotonic', side_effect=[100.0, 105.0, 111.0, 111.0]):
+        assert cached() == 1
+        assert cached() == 1
+        assert cached() == 2
+
+
+def test_ttl_cache_does_not_cache_errors():
+    """Test that an exception is raised again rather than cached."""
+    func = Mock(side_effect=[OSError('boom'), 3])
+    func.__name__ = 'func'
+    cached = _ttl_cache(math.inf)(func)
+
+    with pytest.raises(OSError):
+        cached()
+    assert cached() == 3
+
+
+def test_iter_physical_mounts_filters():
+    """Test that loop devices, pseudo filesystems and non-/dev sources are skipped."""
+    table = [
+        ('/dev/sda1', '/', 'ext4'),
+        ('/dev/loop0', '/snap/core/1', 'squashfs'),
+        ('/dev/loop1', '/mnt/image', 'ext4'),
+        ('tmpfs', '/tmp', 'tmpfs'),
+        ('/dev/sda2', '/var/lib/docker', 'overlay'),
+        ('proc', '/proc', 'proc'),
+        ('/dev/sdb1', '/media/My Disk', 'vfat'),
+    ]
+
+    with patch.object(system, 'read_mountinfo', return_value=table):
+        assert list(system._iter_physical_mounts()) == [
+            ('/dev/sda1', '/', 'ext4'),
+            ('/dev/sdb1', '/media/My Disk', 'vfat'),
+        ]
+
+
+def test_scan_disks_statvfs(tmp_path):
+    """Test usage figures and that vanished mount points are skipped."""
+    table = [
+        ('/dev/sdz1', str(tmp_path), 'ext4'),
+        ('/dev/sdz2', str(tmp_path / 'gone'), 'ext4'),
+    ]
+
+    with patch.object(system, 'read_mountinfo', return_value=table):
+        disks = system._scan_disks()
+
+    st = os.statvfs(tmp_path)
+    assert len(disks) == 1
+    disk = disks[0]
+    assert disk['device'] == '/dev/sdz1'
+    assert disk['mountpoint'] == str(tmp_path)
+    assert disk['fstype'] == 'ext4'
+    assert disk['total'] == st.f_blocks * st.f_frsize
+    assert disk['used'] == (st.f_blocks - st.f_bfree) * st.f_frsize
+    assert 0 <= disk['percent'] <= 100
+
+
+def test_get_system_info_returns_copies():
+    """Test that callers cannot modify the cached info."""
+    table = [('/dev/sdz1', '/', 'ext4')]
+
+    with patch.object(system, 'read_mountinfo', return_value=table):
+        info = system.get_system_info()
+        info['disks'][0]['device'] = 'changed'
+        info['system'] = 'changed'
+
+        again = system.get_system_info()
+
+    assert again['system'] != 'changed'
+    assert again['disks'][0]['device'] == '/dev/sdz1'
+
+
+def test_mount_sources_first_mountpoint():
+    """Test that each source maps to the first place it is mounted."""
+    table = [
+        ('/dev/sdb1', '/media/a', 'vfat'),
+        ('/dev/sdb1', '/media/b', 'vfat'),
+    ]
+
+    with patch.object(system, 'read_mountinfo', return_value=table):
+        assert system._mount_sources() == {'/dev/sdb1': '/media/a'}
+
+
+def test_lsblk_size():
+    """Test lsblk-style size formatting."""
+    assert system._lsblk_size(0) == '0B'
+    assert system._lsblk_size(512 * 1024 * 1024) == '512M'
+    assert system._lsblk_size(16_000_000_000) == '14.9G'
@@ -0,0 +1,213 @@
+"""
+Tests for the Windows write strategy.
+"""
+
+import errno
+import os
+
+import pytest
+from unittest.mock import Mock, patch
+from mbulinux.core.writer_strategies import windows_strategy
+from mbulinux.core.writer_strategies.windows_strategy import WindowsWriteStrategy
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """A small Windows-like install tree with an excluded file."""
+    src = tmp_path / "src"
+    (src / "boot").mkdir(parents=True)
+    (src / "sources").mkdir()
+    (src / "bootmgr").write_bytes(os.urandom(1000))
+    (src / "boot" / "BCD").write_bytes(os.urandom(5000))
+    (src / "sources" / "boot.wim").write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+    (src / "sources" / "install.wim").write_bytes(b'excluded')
+    (src / "empty.txt").write_bytes(b'')
+    return src
+
+
+def _tree_contents(root):
+    """Map relative paths to file contents for every file under root."""
+    contents = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            with open(path, 'rb') as f:
+                contents[os.path.relpath(path, root)] = f.read()
+    return contents
+
+
+def test_parallel_copy_tree(source_tree, tmp_path):
+    """Test that the threaded copy reproduces the tree without excluded paths."""
+    dst = tmp_path / "dst"
+    strategy = WindowsWriteStrategy()
+
+    strategy._parallel_copy_tree(str(source_tree), str(dst),
+                                 exclude=[os.path.join('sources', 'install.wim')])
+
+    expected = _tree_contents(source_tree)
+    del expected[os.path.join('sources', 'install.wim')]
+    assert _tree_contents(dst) == expected
+
+
+def test_copy_files_preserves_mtime(source_tree, tmp_path):
+    """Test that copied files keep the source modification time."""
+    src = source_tree / "bootmgr"
+    os.utime(src, ns=(1_000_000_000, 1_000_000_000))
+    dst = tmp_path / "bootmgr"
+
+    WindowsWriteStrategy()._copy_files([(str(src), str(dst))])
+
+    assert os.stat(dst).st_mtime_ns == 1_000_000_000
+
+
+def test_copy_files_read_write_fallback(source_tree, tmp_path):
+    """Test the buffered loop used when the kernel copy is unsupported."""
+    src = source_tree / "sources" / "boot.wim"
+    dst = tmp_path / "boot.wim"
+    strategy = WindowsWriteStrategy()
+
+    with patch.object(strategy, '_kernel_copy', return_value=False):
+        strategy._copy_files([(str(src), str(dst))])
+
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_copy_files_short_writes(source_tree, tmp_path):
+    """Test that partial raw writes in the fallback loop are completed."""
+    src = source_tree / "sources" / "boot.wim"
+    dst = tmp_path / "boot.wim"
+    strategy = WindowsWriteStrategy()
+    real_open = open
+
+    class ShortWriter:
+        """Wrap a raw file so every write stores at most 1000 bytes."""
+
+        def __init__(self, raw):
+            self.raw = raw
+
+        def write(self, data):
+            return self.raw.write(data[:1000])
+
+        def __getattr__(self, name):
+            return getattr(self.raw, name)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            self.raw.close()
+
+    def fake_open(path, mode='r', *args, **kwargs):
+        handle = real_open(path, mode, *args, **kwargs)
+        return ShortWriter(handle) if 'w' in mode else handle
+
+    with patch.object(strategy, '_kernel_copy', return_value=False), \
+            patch.object(windows_strategy, 'open', fake_open, create=True):
+        strategy._copy_files([(str(src), str(dst))])
+
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_kernel_copy_falls_back_to_sendfile(source_tree, tmp_path):
+    """Test that an unsupported copy_file_range switches to sendfile."""
+    src = source_tree / "sources" / "boot.wim"
+    dst = tmp_path / "boot.wim"
+    size = src.stat().st_size
+    strategy = WindowsWriteStrategy()
+
+    with patch.object(windows_strategy, 'LARGE_FILE_SIZE', 1), \
+            patch('os.copy_file_range', side_effect=OSError(errno.EXDEV, 'EXDEV'),
+                  create=True):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            assert strategy._kernel_copy(fsrc.fileno(), fdst.fileno(), size) is True
+
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_kernel_copy_unsupported():
+    """Test that _kernel_copy reports False when no method is available."""
+    strategy = WindowsWriteStrategy()
+
+    with patch('os.sendfile', side_effect=OSError(errno.EINVAL, 'EINVAL')):
+        assert strategy._kernel_copy(0, 1, 10) is False
+
+
+def test_kernel_copy_raises_after_partial_copy():
+    """Test that an error after some data was copied is not masked."""
+    strategy = WindowsWriteStrategy()
+
+    with patch('os.sendfile', side_effect=[4, OSError(errno.EINVAL, 'EINVAL')]):
+        with pytest.raises(OSError):
+            strategy._kernel_copy(0, 1, 10)
+
+
+def test_mount_retry_keeps_read_only():
+    """Test that a rejected mount is retried without dropping ro."""
+    strategy = WindowsWriteStrategy()
+
+    with patch('subprocess.run') as mock_run:
+        mock_run.side_effect = [Mock(returncode=32), Mock(returncode=0)]
+        strategy._mount_partition('/dev/sdz1', '/mnt/x', 'ro,noatime')
+
+    assert mock_run.call_args_list[1][0][0] == ['mount', '-o', 'ro', '/dev/sdz1', '/mnt/x']
+
+
+def test_mount_retry_without_required_options():
+    """Test that only performance options are dropped on the retry."""
+    strategy = WindowsWriteStrategy()
+
+    with patch('subprocess.run') as mock_run:
+        mock_run.side_effect = [Mock(returncode=32), Mock(returncode=0)]
+        strategy._mount_partition('/dev/sdz1', '/mnt/x', 'noatime,big_writes')
+
+    assert mock_run.call_args_list[1][0][0] == ['mount', '/dev/sdz1', '/mnt/x']
+
+
+def test_wait_for_partition_plain_settle():
+    """Test that udev is settled fully rather than until the node exists."""
+    strategy = WindowsWriteStrategy()
+
+    with patch('subprocess.run') as mock_run:
+        strategy._wait_for_partition('/dev/sdz1')
+
+    assert mock_run.call_args[0][0] == ['udevadm', 'settle', '--timeout=5']
+
+
+def test_wait_for_partition_without_udev():
+    """Test that a missing udevadm is ignored."""
+    strategy = WindowsWriteStrategy()
+
+    with patch('subprocess.run', side_effect=FileNotFoundError('udevadm')):
+        strategy._wait_for_partition('/dev/sdz1')
+
+
+def test_copy_error_unmounts_before_removing(tmp_path):
+    """Test that a failed copy detaches the partition before cleanup."""
+    mount_point = tmp_path / "mnt"
+    mount_point.mkdir()
+    strategy = WindowsWriteStrategy()
+    calls = []
+
+    with patch('tempfile.mkdtemp', return_value=str(mount_point)), \
+            patch.object(strategy, '_mount_partition'), \
+            patch.object(strategy, '_parallel_copy_tree', side_effect=OSError('ENOSPC')), \
+            patch('os.path.ismount', side_effect=[True, False]), \
+            patch('subprocess.run', side_effect=lambda cmd, **kw: calls.append(cmd)), \
+            patch('shutil.rmtree', side_effect=lambda path, **kw: calls.append(path)):
+        with pytest.raises(OSError):
+            strategy._copy_all_files('/iso', '/dev/sdz1')
+
+    assert calls == [['umount', '-l', str(mount_point)], str(mount_point)]
+
+
+def test_still_mounted_partition_is_not_removed(tmp_path):
+    """Test that files are kept when the partition cannot be detached."""
+    mount_point = tmp_path / "mnt"
+    mount_point.mkdir()
+    (mount_point / "bootmgr").write_bytes(b'data')
+    strategy = WindowsWriteStrategy()
+
+    with patch('os.path.ismount', return_value=True), patch('subprocess.run'):
+        strategy._remove_mount_point(str(mount_point))
+
+    assert (mount_point / "bootmgr").read_bytes() == b'data'